@@ -1,6 +1,48 @@
-from pynarrator.narrate_descriptive import narrate_descriptive, get_descriptive_outliers
-from pynarrator.narrate_trend import narrate_trend, get_trend_outliers
-from pynarrator.text_helpers import clean_text, format_text, format_pct, pluralize, clean_tags, add_tag
-from pynarrator.chatgpt import gpt_get_completions, enhance_narrative, summarize_narrative, translate_narrative
-from pynarrator.data import read_data
-from pynarrator.trend_helpers import ytd_volume, pytd_volume, get_py_date, get_frequency
\ No newline at end of file
+import types
+import importlib
+
+# Public names and their submodules, imported on first access so `import pynarrator`
+# doesn't load pandas, inflect or openai until a function that needs them is used
+_EXPORTS = {
+    "narrate_descriptive": ["narrate_descriptive", "get_descriptive_outliers", "get_descriptive_outliers_l2", "narrate_descriptive_stream", "narrate_descriptive_many"],
+    "narrate_trend": ["narrate_trend", "get_trend_outliers", "get_trend_outliers_l2", "get_trend_movers", "narrate_trend_movers"],
+    "text_helpers": ["clean_text", "clean_text_many", "compile_cleaner", "format_text", "format_pct", "format_numbers", "format_percentages", "color_classes", "pluralize", "precompute_plurals", "register_plurals", "clean_tags", "add_tag", "compile_template", "render_template"],
+    "chatgpt": ["gpt_get_completions", "enhance_narrative", "summarize_narrative", "translate_narrative"],
+    "data": ["read_data"],
+    "trend_helpers": ["ytd_volume", "pytd_volume", "trend_volume", "get_py_date", "get_frequency", "get_trend_context", "TrendContext", "sort_by_date", "series_matrix"],
+    "descriptive_helpers": ["aggregate_dimensions", "aggregate_measures", "aggregate_pair", "aggregate_total", "DescriptiveState", "MeasureAggregates"],
+    "cache_helpers": ["AggregationCache", "frame_fingerprint"],
+    "sketch_helpers": ["HyperLogLog"],
+    "narrate_by": ["narrate_by"],
+    "narrate_incremental": ["IncrementalNarrator", "WindowNarrator"],
+    "cube_helpers": ["TimeCube", "period_start"],
+    "calendar_helpers": ["FiscalCalendar"],
+    "token_helpers": ["Token", "template_tokens", "outlier_tokens", "render_plain", "render_html", "render_markdown", "render_narrative"]
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+# Functions named like their submodule, importing the submodule binds it over the function
+_SHADOWED = [name for name, module in _MODULES.items() if name == module]
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{_MODULES[name]}"), name)
+
+    # The import binds the submodule and the ones it imports on the package, the functions
+    # named like them are bound again in their place
+    for shadowed in _SHADOWED:
+        if isinstance(globals().get(shadowed), types.ModuleType):
+            globals()[shadowed] = getattr(globals()[shadowed], shadowed)
+
+    # Later lookups find the name without calling __getattr__
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,182 @@
+import sys
+import threading
+from collections import OrderedDict
+import pandas as pd
+import numpy as np
+
+def frame_fingerprint(df):
+    """
+    Fingerprint of a data frame content.
+
+    Combines the shape, column names and dtypes with a checksum of every row and the
+    index, so in-place edits of any cell change the fingerprint. Hashing the rows costs
+    about as much as one aggregation pass, far less than the aggregations it saves.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to fingerprint.
+
+    Returns:
+    tuple: Hashable fingerprint of the data frame.
+
+    Examples:
+    >>> df = pd.DataFrame({'A': ['foo', 'bar'], 'B': [1, 2]})
+    >>> frame_fingerprint(df) == frame_fingerprint(df.copy())
+    True
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("df must be a pandas DataFrame")
+
+    hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+
+    # Rows are weighted by odd multipliers, so the checksum also follows the row order
+    # the date slices depend on, the uint64 products and the sum wrap around
+    weights = np.arange(1, 2 * len(hashes), 2, dtype="uint64")
+    checksum = int((hashes * weights).sum(dtype="uint64"))
+
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+        checksum
+    )
+
+def _sizeof(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in vars(value).values())
+    return sys.getsizeof(value)
+
+class AggregationCache:
+    """
+    In-process LRU cache of aggregated tables.
+
+    Pass an instance as `cache` to narrate_descriptive, narrate_trend and their helpers
+    to reuse the aggregates of a data frame across calls. Entries are keyed by the frame
+    fingerprint and the parameters of the aggregation (dimension, measure, summarization,
+    date cut-offs), so calls that only change presentation parameters like coverage,
+    coverage_limit or templates don't scan the raw data again. The least recently used
+    entries are evicted once the total size exceeds `max_bytes`.
+
+    Args:
+    max_bytes (int, optional): Memory bound of the cached values in bytes. Defaults to 256 MB.
+
+    Examples:
+    >>> cache = AggregationCache(max_bytes=64 * 1024**2)
+    >>> narrate_descriptive(df, measure='Sales', cache=cache)
+    >>> narrate_descriptive(df, measure='Sales', coverage=0.8, cache=cache)
+    >>> cache.stats()
+    {'hits': 7, 'misses': 7, 'evictions': 0, 'entries': 7, 'bytes': 5240, 'max_bytes': 67108864}
+    """
+    def __init__(self, max_bytes=256 * 1024**2):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # Pickled copies, e.g. sent to process pool workers, start empty
+        return {'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state['max_bytes'])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Return the cached value and mark it as recently used, or `default` on a miss.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        """
+        Store the value, evicting the least recently used entries if needed.
+        Values bigger than `max_bytes` aren't stored.
+        """
+        size = _sizeof(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        """
+        Return hit, miss and eviction counts together with the current size.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes
+            }
+
+_MISSING = object()
+
+def cached(cache, df, key, compute):
+    """
+    Return compute() through the cache, keyed by the fingerprint of df and `key`.
+    If cache is None the value is always computed.
+    """
+    if cache is None:
+        return compute()
+
+    full_key = (frame_fingerprint(df),) + tuple(key)
+    value = cache.get(full_key, _MISSING)
+
+    if value is _MISSING:
+        value = compute()
+        cache.put(full_key, value)
+
+    return value
@@ -0,0 +1,206 @@
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Grains of the compared windows and the columns of their starts in the date table
+_START_COLUMNS = {"year": "year_start", "quarter": "quarter_start", "month": "period_start", "week": "week_start"}
+
+@dataclass(frozen=True)
+class FiscalCalendar:
+    """
+    Fiscal calendar for the trend windows, e.g. a 4-4-5 retail calendar.
+
+    Without a pattern the fiscal year starts on the first day of `start_month` and its
+    periods are calendar months. With a pattern like (4, 4, 5) the fiscal year has 52 or
+    53 weeks, it starts on the `week_start` weekday nearest to the first day of
+    `start_month` and every quarter has periods of the pattern's number of weeks, a 53rd
+    week is part of the last period. Fiscal years are named after the calendar year they
+    end in, e.g. FY2024 of a July calendar runs from July 2023 to June 2024.
+
+    Pass it as `calendar` to get_trend_context, trend_volume or narrate_trend to compare
+    fiscal year, quarter, period or week to date windows. The fiscal attributes of all
+    distinct dates of a frame are calculated once with `date_table` and joined to the rows
+    through their integer codes with `annotate`.
+
+    Args:
+    start_month (int, optional): The month the fiscal year starts in. Defaults to 1.
+    pattern (tuple, optional): Weeks of the three periods of a quarter, e.g. (4, 4, 5). Defaults to None, calendar months.
+    week_start (int, optional): The first weekday of fiscal weeks, 0 for Monday to 6 for Sunday. Defaults to 0.
+
+    Examples:
+    >>> calendar = FiscalCalendar(start_month=2, pattern=(4, 4, 5), week_start=6)
+    >>> calendar.date_table(pd.to_datetime(['2024-03-15']))
+                fiscal_year  fiscal_quarter  fiscal_period  fiscal_week  year_start ...
+    2024-03-15         2024               1              2            7  2024-02-04 ...
+    >>> narrate_trend(df, calendar=calendar)
+    """
+    start_month: int = 1
+    pattern: Optional[Tuple[int, int, int]] = None
+    week_start: int = 0
+
+    def __post_init__(self):
+        if self.start_month not in range(1, 13):
+            raise ValueError("start_month must be between 1 and 12")
+        if self.week_start not in range(7):
+            raise ValueError("week_start must be between 0 and 6")
+
+        if self.pattern is not None:
+            object.__setattr__(self, "pattern", tuple(int(weeks) for weeks in self.pattern))
+
+            if len(self.pattern) != 3 or sum(self.pattern) != 13 or min(self.pattern) < 1:
+                raise ValueError("pattern must have three periods of 13 weeks in total, e.g. (4, 4, 5)")
+
+    def year_starts(self, years):
+        """
+        Return the first day of the fiscal years as a DatetimeIndex.
+        """
+        years = np.asarray(years, dtype="int64")
+        anchors = pd.to_datetime(pd.DataFrame({
+            "year": years - (self.start_month > 1),
+            "month": self.start_month,
+            "day": 1
+        }))
+
+        if self.pattern is None:
+            return pd.DatetimeIndex(anchors)
+
+        # Week based years start on the first weekday nearest to the anchor date
+        shift = (self.week_start - anchors.dt.dayofweek) % 7
+        shift = shift.where(shift <= 3, shift - 7)
+
+        return pd.DatetimeIndex(anchors + pd.to_timedelta(shift, unit="D"))
+
+    def date_table(self, dates):
+        """
+        Return the fiscal attributes of every distinct date, indexed by the normalized date.
+
+        The columns are fiscal_year, fiscal_quarter, fiscal_period (1 to 12), fiscal_week
+        (1 to 53), the starts of the fiscal year, quarter, period and week, and
+        same_day_last_year, the matching day of the previous fiscal year.
+        """
+        days = pd.DatetimeIndex(pd.unique(pd.DatetimeIndex(dates).dropna()))
+
+        if days.tz is not None:
+            days = days.tz_localize(None)
+
+        days = pd.DatetimeIndex(pd.unique(days.normalize())).sort_values()
+
+        # Fiscal year named after the calendar year it ends in, moved by the week shift
+        years = days.year.to_numpy().astype("int64") + ((self.start_month > 1) & (days.month >= self.start_month))
+        years = years - (days < self.year_starts(years))
+        years = years + (days >= self.year_starts(years + 1))
+
+        year_start = self.year_starts(years)
+        day = (days - year_start).days.to_numpy()
+
+        if self.pattern is None:
+            period = (days.month.to_numpy() - self.start_month) % 12 + 1
+            period_start = days - pd.to_timedelta(days.day - 1, unit="D")
+            months = days.year.to_numpy() * 12 + days.month.to_numpy() - 1 - (period - 1) % 3
+            quarter_start = pd.DatetimeIndex(pd.to_datetime(pd.DataFrame({"year": months // 12, "month": months % 12 + 1, "day": 1})))
+            same_day_last_year = pd.DatetimeIndex(pd.Series(days) - pd.DateOffset(years=1))
+        else:
+            weeks = np.cumsum(np.tile(self.pattern, 4))
+            period = np.minimum(np.searchsorted(weeks, day // 7, side="right") + 1, 12)
+            first_weeks = np.concatenate([[0], weeks[:-1]])
+            period_start = year_start + pd.to_timedelta(first_weeks[period - 1] * 7, unit="D")
+            quarter_start = year_start + pd.to_timedelta(first_weeks[(period - 1) // 3 * 3] * 7, unit="D")
+
+            # Same fiscal week and weekday, the 53rd week maps to the last day of the previous year
+            same_day_last_year = self.year_starts(years - 1) + pd.to_timedelta(day, unit="D")
+            same_day_last_year = same_day_last_year.where(same_day_last_year < year_start, year_start - pd.Timedelta(days=1))
+
+        week_start = days - pd.to_timedelta((days.dayofweek - self.week_start) % 7, unit="D")
+
+        return pd.DataFrame({
+            "fiscal_year": years,
+            "fiscal_quarter": (period - 1) // 3 + 1,
+            "fiscal_period": period,
+            "fiscal_week": day // 7 + 1,
+            "year_start": year_start,
+            "quarter_start": quarter_start,
+            "period_start": period_start,
+            "week_start": week_start,
+            "same_day_last_year": same_day_last_year
+        }, index=days)
+
+    def annotate(self, df, date):
+        """
+        Return a copy of df with the fiscal year, quarter, period and week of its dates.
+
+        The attributes are calculated once per distinct date and joined to the rows
+        through the integer codes of the dates.
+        """
+        dates = df[date]
+
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+
+        codes, uniques = pd.factorize(dates.dt.normalize())
+        table = self.date_table(uniques).reindex(uniques)
+        columns = {}
+
+        for column in ["fiscal_year", "fiscal_quarter", "fiscal_period", "fiscal_week"]:
+            values = table[column].to_numpy()[codes]
+
+            if (codes < 0).any():
+                values = pd.array(np.where(codes >= 0, values, 0), dtype="Int64")
+                values[codes < 0] = pd.NA
+
+            columns[column] = pd.Series(values, index=df.index)
+
+        return df.assign(**columns)
+
+    def _attributes(self, cut_off):
+        cut_off = pd.Timestamp(cut_off)
+        naive = cut_off.tz_localize(None) if cut_off.tz is not None else cut_off
+
+        return self.date_table([naive]).iloc[0], cut_off.tz
+
+    def period_start(self, cut_off, grain):
+        """
+        Return the start of the fiscal year, quarter, period ('month') or week of the cut-off date.
+        """
+        attributes, tz = self._attributes(cut_off)
+        start = attributes[_START_COLUMNS[grain]]
+
+        return start if tz is None else start.tz_localize(tz)
+
+    def previous(self, cut_off, grain):
+        """
+        Return the matching cut-off date of the previous fiscal year, quarter, period ('month') or week.
+        """
+        cut_off = pd.Timestamp(cut_off)
+
+        if grain == "year":
+            attributes, tz = self._attributes(cut_off)
+            day = attributes["same_day_last_year"]
+            day = day if tz is None else day.tz_localize(tz)
+
+            return day + (cut_off - cut_off.normalize())
+
+        if grain == "week":
+            return cut_off - pd.Timedelta(days=7)
+
+        # Same offset from the start of the previous period, capped at its end
+        start = self.period_start(cut_off, grain)
+        previous_start = self.period_start(start - pd.Timedelta(days=1), grain)
+
+        return min(previous_start + (cut_off - start), start - pd.Timedelta(days=1) + (cut_off - cut_off.normalize()))
+
+    def label(self, cut_off, grain):
+        """
+        Return the name of the fiscal year, quarter, period or week of the cut-off date, e.g. 'FY2024 Q1'.
+        """
+        attributes, _ = self._attributes(cut_off)
+        year = f"FY{attributes['fiscal_year']}"
+
+        if grain == "year":
+            return year
+        if grain == "quarter":
+            return f"{year} Q{attributes['fiscal_quarter']}"
+        if grain == "month":
+            return f"{year} P{attributes['fiscal_period']:02d}"
+
+        return f"{year} W{attributes['fiscal_week']:02d}"
@@ -1,4 +1,3 @@
-import openai
 import os
 
 def gpt_get_completions(
@@ -21,6 +20,9 @@ def gpt_get_completions(
       "content": prompt}
   ]
           
+  # Imported on first use, so importing pynarrator doesn't load the OpenAI client
+  import openai
+
   completion = openai.ChatCompletion.create(
     model="gpt-3.5-turbo",
     messages=messages
@@ -0,0 +1,223 @@
+import pandas as pd
+import numpy as np
+from pynarrator.trend_helpers import trend_volume, get_trend_context
+from pynarrator.narrate_trend import narrate_trend
+
+GRAINS = ["day", "week", "month", "quarter", "year"]
+
+# Every grain is rolled up from the finest grain nested in it
+_PARENT_GRAIN = {"week": "day", "month": "day", "quarter": "month", "year": "quarter"}
+
+_PERIODS = {"week": "W", "month": "M", "quarter": "Q", "year": "Y"}
+
+# Column of the number of non-missing measure values of every cell
+_COUNT = "_count"
+
+_SUMMARIZATIONS = ["sum", "count"]
+
+def period_start(dates, grain):
+    """
+    Return the start of the calendar period of every date.
+
+    Weeks start on Monday, the same as the ISO weeks used by get_py_date. The periods
+    are calculated once per distinct date, so repeated dates of long frames are cheap.
+
+    Args:
+    dates (pandas.Series): Datetime values, timezone aware or naive.
+    grain (str): One of 'day', 'week', 'month', 'quarter' or 'year'.
+
+    Returns:
+    pandas.Series: The first day of the period of every date, with the same index and timezone.
+
+    Examples:
+    >>> period_start(pd.Series(pd.to_datetime(['2023-02-15', '2023-05-02'])), 'quarter')
+    0   2023-01-01
+    1   2023-04-01
+    dtype: datetime64[ns]
+    """
+    if grain not in GRAINS:
+        raise ValueError(f"grain must of be one of: {', '.join(GRAINS)}")
+
+    codes, uniques = pd.factorize(dates)
+    uniques = pd.Series(uniques).dt.normalize()
+    tz = uniques.dt.tz
+
+    if grain != "day":
+        naive = uniques.dt.tz_localize(None) if tz is not None else uniques
+        uniques = naive.dt.to_period(_PERIODS[grain]).dt.start_time.astype(naive.dtype)
+
+        if tz is not None:
+            uniques = uniques.dt.tz_localize(tz)
+
+    starts = uniques.to_numpy()[codes]
+
+    if (codes < 0).any():
+        starts = pd.Series(starts).where(codes >= 0).to_numpy()
+
+    return pd.Series(starts, index=dates.index, dtype=uniques.dtype, name=dates.name)
+
+class TimeCube:
+    """
+    Sums of a measure by dimension levels at every calendar grain, built once from raw data.
+
+    The raw rows are aggregated once to daily sums by all dimensions, coarser grains are
+    rolled up from the finest grain nested in them (weeks and months from days, quarters
+    from months and years from quarters) and kept once built. Narrating the same data at
+    several grains then reads the small rolled up tables instead of resampling the raw
+    rows, and the frequency of every grain is known, so it isn't estimated again.
+
+    A rolled up frame is the same as resampling the raw rows with a sum by the dimensions
+    and the period start, e.g. a pandas Grouper with freq='MS' for months. Rows with
+    missing dimension values are kept, so the totals match the raw data.
+
+    Every cell also keeps the number of non-missing measure values, so the trend can be
+    narrated with the 'sum' or 'count' summarization. Averages of the raw rows can't be
+    derived from the rolled up volumes of the trend functions, 'average' raises a ValueError.
+
+    Args:
+    measure (str): The measure to sum.
+    date (str): The date column.
+    dimensions (list): The dimensions kept in the cube.
+
+    Examples:
+    >>> cube = TimeCube.from_frame(sales, measure='Sales', date='Date', dimensions=['Region', 'Product'])
+    >>> cube.frame('month')
+    >>> cube.trend_volume('quarter', dimension='Region')
+    >>> cube.narrate('week')
+    {'Total Sales': 'From 2020 YTD to 2021 YTD, Sales had an increase of ...', ...}
+    >>> cube.narrate('month', comparison='mom')
+    """
+    def __init__(self, measure, date, dimensions):
+        self.measure = measure
+        self.date = date
+        self.dimensions = list(dimensions)
+        self._tables = {}
+        self._contexts = {}
+
+    @classmethod
+    def from_frame(cls, df, measure=None, date=None, dimensions=None):
+        """
+        Build the cube from raw rows, by default with the first numeric column as measure,
+        the first datetime column as date and the character and categorical columns as dimensions.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+        if df.shape[0] == 0:
+            raise ValueError("df must have at least one row, execution is stopped")
+
+        if measure is None:
+            measure = df.select_dtypes(include=[np.number]).columns[0]
+        elif measure not in df.columns:
+            raise ValueError("measure must a column in the dataset")
+
+        if date is None:
+            date_fields = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+
+            if date_fields.empty:
+                raise ValueError("No date column found in the dataset")
+
+            date = date_fields[0]
+        elif date not in df.columns:
+            raise ValueError("date must a column in the dataset")
+        elif not pd.api.types.is_datetime64_any_dtype(df[date]):
+            raise ValueError("'date' must be a date column in the dataset")
+
+        if dimensions is None:
+            dimensions = df.select_dtypes(include=['object', 'category']).columns.values.tolist()
+        elif any(d not in df.columns for d in dimensions):
+            raise ValueError("dimensions must be columns in the dataset")
+
+        cube = cls(measure, date, dimensions)
+        cube._tables["day"] = cube._rollup(df.assign(**{_COUNT: df[measure].notna().astype("int64")}), "day")
+
+        return cube
+
+    def _rollup(self, df, grain):
+        keys = [df[d] for d in self.dimensions] + [period_start(df[self.date], grain)]
+
+        return (
+            df[[self.measure, _COUNT]]
+            .groupby(keys, observed=True, dropna=False, sort=False)
+            .sum()
+            .reset_index()
+        )
+
+    def table(self, grain):
+        """
+        Return the sums and counts by dimensions and period start at the grain, rolled up on first use.
+        """
+        if grain not in GRAINS:
+            raise ValueError(f"grain must of be one of: {', '.join(GRAINS)}")
+
+        if grain not in self._tables:
+            self._tables[grain] = self._rollup(self.table(_PARENT_GRAIN[grain]), grain)
+
+        return self._tables[grain]
+
+    def frame(self, grain, summarization="sum"):
+        """
+        Return the rolled up rows at the grain sorted by date, ready for the trend functions.
+
+        The measure holds the sums, or the counts of non-missing values for 'count', so
+        the frame is narrated with the 'sum' summarization either way.
+        """
+        if summarization not in _SUMMARIZATIONS:
+            raise ValueError("summarization of a TimeCube must of be one of: 'sum' or 'count', averages can't be derived from the cube")
+
+        key = ("frame", grain, summarization)
+
+        if key not in self._tables:
+            frame = self.table(grain).sort_values(self.date, kind="stable", ignore_index=True)
+
+            if summarization == "count":
+                frame = frame.assign(**{self.measure: frame[_COUNT]})
+
+            self._tables[key] = frame.drop(columns=_COUNT)
+
+        return self._tables[key]
+
+    def context(self, grain, cy_date=None, py_date=None, comparison="ytd", periods=1):
+        """
+        Return the TrendContext of the frame at the grain, with the grain as frequency.
+        """
+        key = (grain, cy_date, py_date, comparison, periods)
+
+        if key not in self._contexts:
+            self._contexts[key] = get_trend_context(
+                self.frame(grain),
+                measure=self.measure,
+                date=self.date,
+                frequency=grain,
+                cy_date=cy_date,
+                py_date=py_date,
+                sorted_dates=True,
+                comparison=comparison,
+                periods=periods
+            )
+
+        return self._contexts[key]
+
+    def trend_volume(self, grain, dimension=None, summarization="sum", cy_date=None, py_date=None, cache=None, comparison="ytd", periods=1):
+        """
+        Return the current and previous volumes at the grain, see trend_volume.
+        """
+        return trend_volume(
+            self.frame(grain, summarization),
+            dimension=dimension,
+            summarization="sum",
+            context=self.context(grain, cy_date, py_date, comparison, periods),
+            cache=cache
+        )
+
+    def narrate(self, grain, cy_date=None, py_date=None, comparison="ytd", periods=1, summarization="sum", **kwargs):
+        """
+        Narrate the trend at the grain, keyword arguments are passed to narrate_trend.
+        """
+        kwargs.setdefault("dimensions", self.dimensions)
+
+        return narrate_trend(
+            self.frame(grain, summarization),
+            summarization="sum",
+            context=self.context(grain, cy_date, py_date, comparison, periods),
+            **kwargs
+        )
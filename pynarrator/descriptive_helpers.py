@@ -0,0 +1,641 @@
+import pandas as pd
+import numpy as np
+from pynarrator.cache_helpers import cached, frame_fingerprint
+from pynarrator.sketch_helpers import HyperLogLog, hash_values, hll_group_estimates
+
+def aggregate_dimensions(df, dimensions, measure, summarization="sum", cache=None, approximate=False, precision=12):
+    """
+    Aggregate a measure by several dimensions in a single scan.
+
+    Every dimension is factorized once and the per-level aggregates are computed
+    with np.bincount over the integer codes, so the measure column is read once for
+    all dimensions instead of once per df.groupby(dimension) call.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze.
+    dimensions (list): The dimensions to group by.
+    measure (str): The measure to use for aggregation.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    cache (AggregationCache, optional): Cache of the aggregated tables, only missing dimensions are scanned. Defaults to None.
+    approximate (bool, optional): Estimate distinct counts with HyperLogLog sketches for "count" summarization,
+        with a relative standard error of about 1.04 / sqrt(2 ** precision). Defaults to False.
+    precision (int, optional): HyperLogLog precision between 4 and 18, each level uses 2 ** precision bytes. Defaults to 12.
+
+    Returns:
+    dict: A dictionary with one data frame per dimension, each with the dimension levels in sorted order
+    and the aggregated measure, same as df.groupby(dimension)[measure].agg(...).reset_index().
+
+    Raises:
+    ValueError: If the summarization parameter is not one of "sum", "count", or "average".
+    ValueError: If the measure is not numeric for "sum" or "average" summarization.
+
+    Examples:
+    >>> data = {'A': ['foo', 'foo', 'bar', 'bar', 'baz', 'baz', 'qux', 'qux'],
+                'B': ['x', 'y', 'x', 'y', 'x', 'y', 'x', 'y'],
+                'C': [10, 20, 30, 40, 50, 60, 70, 80]}
+    >>> df = pd.DataFrame(data)
+    >>> aggregate_dimensions(df, ['A', 'B'], 'C')['B']
+       B    C
+    0  x  160
+    1  y  200
+    """
+    return aggregate_measures(df, dimensions, {measure: summarization}, cache, approximate, precision)[measure]
+
+def _measure_aggregator(series, summarization, approximate, precision):
+    # Reads the measure column once and returns the valid rows mask together with a function
+    # aggregating the valid rows by integer codes of any dimension
+    if summarization == "count" and approximate:
+        # Distinct values of the measure are hashed once and shared by all dimensions
+        valid = series.notna().to_numpy()
+        hashes = np.zeros(len(series), dtype="uint64")
+        hashes[valid] = hash_values(series.to_numpy()[valid])
+
+        def aggregate(codes, mask, n_levels):
+            return np.round(hll_group_estimates(codes, n_levels, hashes[mask], precision)).astype("int64")
+
+    elif summarization == "count":
+        # Distinct values of the measure are coded once and shared by all dimensions
+        measure_codes, measure_uniques = pd.factorize(series)
+        n_values = len(measure_uniques)
+        valid = measure_codes >= 0
+
+        def aggregate(codes, mask, n_levels):
+            pairs = np.unique(codes.astype("int64") * n_values + measure_codes[mask])
+            return np.bincount(pairs // max(n_values, 1), minlength=n_levels)
+
+    else:
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            raise ValueError("measure must be numeric for 'sum' or 'average' summarization")
+
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(values)
+        values = np.where(valid, values, 0)
+
+        # Integer sums are accumulated in int64, float64 weights lose precision above 2 ** 53
+        integers = series.to_numpy(dtype="int64", na_value=0) if pd.api.types.is_integer_dtype(series) else None
+
+        def aggregate(codes, mask, n_levels):
+            if summarization == "sum" and integers is not None:
+                aggregated = np.zeros(n_levels, dtype="int64")
+                np.add.at(aggregated, codes, integers[mask])
+                return aggregated
+
+            aggregated = np.bincount(codes, weights=values[mask], minlength=n_levels)
+
+            if summarization == "average":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    return aggregated / np.bincount(codes, minlength=n_levels)
+
+            return aggregated
+
+    return valid, aggregate
+
+def aggregate_measures(df, dimensions, measures, cache=None, approximate=False, precision=12):
+    """
+    Aggregate several measures, each with its own summarization, by several dimensions in a single scan.
+
+    Every dimension is factorized once and shared by all measures, so D dimensions and
+    N measures take D factorizations instead of the N x D groupby calls of separate
+    aggregate_dimensions calls.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze.
+    dimensions (list): The dimensions to group by.
+    measures (dict): The summarization (sum, count, or average) of every measure, keyed by measure.
+    cache (AggregationCache, optional): Cache of the aggregated tables, shared with aggregate_dimensions. Defaults to None.
+    approximate (bool, optional): Estimate distinct counts with HyperLogLog sketches for "count" summarization. Defaults to False.
+    precision (int, optional): HyperLogLog precision between 4 and 18. Defaults to 12.
+
+    Returns:
+    dict: A dictionary keyed by measure with the tables of every dimension, same as aggregate_dimensions.
+
+    Raises:
+    ValueError: If a summarization is not one of "sum", "count", or "average".
+    ValueError: If a measure is not numeric for "sum" or "average" summarization.
+
+    Examples:
+    >>> aggregate_measures(df, ['A', 'B'], {'C': 'sum', 'D': 'average'})['D']['B']
+       B     D
+    0  x  40.0
+    1  y  50.0
+    """
+    if any(summarization not in ["sum", "count", "average"] for summarization in measures.values()):
+        raise ValueError("summarization must of be one of: 'sum', 'count' or 'average'.")
+
+    dimensions = list(dict.fromkeys(dimensions))
+
+    if cache is not None:
+        fingerprint = frame_fingerprint(df)
+        keys = {
+            (measure, d): (fingerprint, "aggregate_dimensions", d, measure, summarization, (approximate, precision) if summarization == "count" else None)
+            for measure, summarization in measures.items() for d in dimensions
+        }
+        tables = {key: cache.get(full_key) for key, full_key in keys.items()}
+        missing = [key for key, table in tables.items() if table is None]
+
+        if missing:
+            missing_dimensions = list(dict.fromkeys(d for _, d in missing))
+            missing_measures = {measure: measures[measure] for measure, _ in missing}
+
+            for measure, tables_measure in aggregate_measures(df, missing_dimensions, missing_measures, approximate=approximate, precision=precision).items():
+                for d, table in tables_measure.items():
+                    cache.put(keys[(measure, d)], table)
+                    tables[(measure, d)] = table
+
+        return {measure: {d: tables[(measure, d)] for d in dimensions} for measure in measures}
+
+    aggregators = {measure: _measure_aggregator(df[measure], summarization, approximate, precision) for measure, summarization in measures.items()}
+    tables = {measure: {} for measure in measures}
+
+    for dimension in dimensions:
+        codes, levels = pd.factorize(df[dimension], sort=True)
+        n_levels = len(levels)
+
+        for measure, (valid, aggregate) in aggregators.items():
+            # Rows with missing dimension are dropped, same as in groupby
+            mask = valid & (codes >= 0)
+
+            tables[measure][dimension] = pd.DataFrame({
+                dimension: levels,
+                measure: aggregate(codes[mask], mask, n_levels)
+            })
+
+    return tables
+
+def aggregate_total(df, measure, summarization="sum", cache=None):
+    """
+    Aggregate a measure over the whole data frame.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze.
+    measure (str): The measure to use for aggregation.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    cache (AggregationCache, optional): Cache of the aggregated values. Defaults to None.
+
+    Returns:
+    float: Sum or average rounded to 2 digits, or the number of non-missing values for count.
+
+    Examples:
+    >>> df = pd.DataFrame({'A': ['foo', 'bar', 'baz'], 'B': [1, 2, 4]})
+    >>> aggregate_total(df, 'B', 'average')
+    2.33
+    """
+    def compute():
+        if summarization == "sum":
+            return df[measure].sum().round(2)
+        elif summarization == "average":
+            return df[measure].mean().round(2)
+        elif summarization == "count":
+            return df[measure].count()
+
+    return cached(cache, df, ("aggregate_total", measure, summarization), compute)
+
+def aggregate_pair(df, dimension_l1, dimension_l2, measures, approximate=False, precision=12):
+    """
+    Aggregate several measures by a pair of dimensions with one groupby.
+
+    The grouping of the pair is computed once and shared by all measures. Tables are
+    returned for both orders of the pair, so a pair of dimensions is grouped once for
+    the drill-downs in both directions.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze.
+    dimension_l1 (str): The first dimension.
+    dimension_l2 (str): The second dimension.
+    measures (dict): The summarization (sum, count, or average) of every measure, keyed by measure.
+    approximate (bool, optional): Estimate distinct counts with HyperLogLog sketches for "count" summarization. Defaults to False.
+    precision (int, optional): HyperLogLog precision between 4 and 18. Defaults to 12.
+
+    Returns:
+    dict: Tables in the format used by get_descriptive_outliers_l2, keyed by the pair of dimensions
+    in both orders and then by measure.
+    """
+    keys = [dimension_l1, dimension_l2]
+    grouped = df.groupby(keys, observed=True)
+    tables = {}
+
+    for measure, summarization in measures.items():
+        if summarization == "count" and approximate:
+            sketch = HyperLogLog.from_frame(df, keys, measure, precision)
+            tables[measure] = sketch.estimate().sort_index().round().astype("int64").rename(measure).reset_index()
+        elif summarization == "count":
+            tables[measure] = grouped[measure].nunique().reset_index()
+        elif summarization == "sum":
+            tables[measure] = grouped[measure].sum().reset_index()
+        else:
+            tables[measure] = grouped[measure].agg(["sum", "count"]).reset_index()
+
+    flipped = {
+        measure: table[keys[::-1] + list(table.columns[2:])].sort_values(keys[::-1], kind="stable").reset_index(drop=True)
+        for measure, table in tables.items()
+    }
+
+    return {(dimension_l1, dimension_l2): tables, (dimension_l2, dimension_l1): flipped}
+
+def top_k_positions(keys, k):
+    """
+    Positions of the k largest rows ordered by several keys in descending order.
+
+    Candidates are found with an O(n) partition on the first key and only they are
+    sorted, by all keys in order and then by position, so the result is the same as
+    the first k rows of a full descending sort with ties kept in original order.
+    Missing values are ordered last.
+
+    Args:
+    keys (list): Arrays or series of equal length, the most significant first.
+    k (int): The maximum number of positions to return.
+
+    Returns:
+    numpy.ndarray: Integer positions of the selected rows.
+
+    Examples:
+    >>> top_k_positions([np.array([3, 9, 1, 9, 5])], 3)
+    array([1, 3, 4])
+    """
+    keys = [np.asarray(key, dtype="float64") for key in keys]
+    keys = [np.where(np.isnan(key), -np.inf, key) for key in keys]
+
+    primary = keys[0]
+    n = len(primary)
+    k = max(min(k, n), 0)
+
+    if k == 0:
+        return np.array([], dtype="int64")
+
+    if k < n:
+        kth = np.partition(primary, n - k)[n - k]
+        candidates = np.flatnonzero(primary >= kth)
+    else:
+        candidates = np.arange(n)
+
+    # np.lexsort uses the last key as the primary one
+    order = np.lexsort([candidates] + [-key[candidates] for key in reversed(keys)])
+
+    return candidates[order][:k]
+
+def grouped_top_k_positions(groups, keys, k):
+    """
+    Positions of the k largest rows within every group ordered by several keys in descending order.
+
+    All groups are handled with one np.lexsort by group and keys, the rank of every row
+    within its group is derived from the group boundaries. Ties are kept in original
+    order and missing values are ordered last, same as in top_k_positions.
+
+    Args:
+    groups (array-like): Integer group codes.
+    keys (list): Arrays or series of equal length, the most significant first.
+    k (int): The maximum number of positions to return per group.
+
+    Returns:
+    numpy.ndarray: Integer positions of the selected rows, ordered by group code and keys.
+
+    Examples:
+    >>> grouped_top_k_positions([0, 0, 0, 1, 1], [np.array([3, 9, 5, 1, 2])], 2)
+    array([1, 2, 4, 3])
+    """
+    groups = np.asarray(groups)
+    n = len(groups)
+
+    if n == 0 or k <= 0:
+        return np.array([], dtype="int64")
+
+    keys = [np.asarray(key, dtype="float64") for key in keys]
+    keys = [np.where(np.isnan(key), -np.inf, key) for key in keys]
+
+    # np.lexsort uses the last key as the primary one
+    order = np.lexsort([np.arange(n)] + [-key for key in reversed(keys)] + [groups])
+
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    rank = np.arange(n) - np.repeat(starts, np.diff(np.r_[starts, n]))
+
+    return order[rank < k]
+
+def group_slices(groups):
+    """
+    Codes, start and end positions of the runs of equal codes in an array ordered by group.
+
+    Args:
+    groups (array-like): Integer group codes ordered by group, e.g. rows selected with grouped_top_k_positions.
+
+    Returns:
+    tuple: Arrays of the group codes, the start positions and the end positions of every group.
+
+    Examples:
+    >>> group_slices([0, 0, 2, 2, 2])
+    (array([0, 2]), array([0, 2]), array([2, 5]))
+    """
+    groups = np.asarray(groups)
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.array([], dtype="int64")
+    ends = np.r_[starts[1:], len(groups)].astype("int64")
+
+    return groups[starts], starts, ends
+
+class DescriptiveState:
+    """
+    Mergeable aggregate state of a measure by several dimensions.
+
+    Keeps the number of rows, non-missing values and the sum of the measure for every
+    dimension level, and for 'count' summarization the multiplicity of every distinct
+    (level, value) pair. With narration_depth > 1 the same is kept for all parent-child
+    pairs of dimensions. Memory is bounded by the dimension cardinality, not by the number
+    of rows, so the state can be updated chunk by chunk and states of different chunks
+    or partitions can be merged.
+
+    Args:
+    measure (str): The measure to aggregate.
+    dimensions (list): The dimensions to aggregate by.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    narration_depth (int, optional): Keep parent-child pair states for depth 2 narratives if greater than 1. Defaults to 1.
+    approximate (bool, optional): Keep HyperLogLog sketches instead of exact distinct values for "count" summarization. Defaults to False.
+    precision (int, optional): HyperLogLog precision between 4 and 18. Defaults to 12.
+
+    Raises:
+    ValueError: If the summarization parameter is not one of "sum", "count", or "average".
+
+    Examples:
+    >>> state = DescriptiveState('Sales', ['Region', 'Product'])
+    >>> for chunk in pd.read_csv('sales.csv', chunksize=100000):
+    ...     state.update(chunk)
+    >>> narrate_descriptive(aggregates=state)
+    """
+    def __init__(self, measure, dimensions, summarization="sum", narration_depth=1, approximate=False, precision=12):
+        if summarization not in ["sum", "count", "average"]:
+            raise ValueError("summarization must of be one of: 'sum', 'count' or 'average'.")
+
+        self.measure = measure
+        self.dimensions = list(dict.fromkeys(dimensions))
+        self.summarization = summarization
+        self.narration_depth = narration_depth
+        self.approximate = approximate and summarization == "count"
+        self.precision = precision
+
+        self.keys = [(d,) for d in self.dimensions]
+
+        if narration_depth > 1:
+            self.keys += [(l1, l2) for l1 in self.dimensions for l2 in self.dimensions if l1 != l2]
+
+        self.n_rows = 0
+        self.integer = None
+        self._total = pd.Series({"rows": 0, "count": 0, "sum": 0}, dtype="int64")
+        self._stats = {key: None for key in self.keys}
+        self._values = {key: None for key in self.keys}
+        self._distinct = {key: {} for key in self.keys}
+
+    def _aggregate(self, df):
+        measure = self.measure
+        series = df[measure]
+
+        if self.summarization != "count" and (not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+            raise ValueError("measure must be numeric for 'sum' or 'average' summarization")
+
+        # Integer sums are kept in int64, they are exact past 2 ** 53 and their TwoSum error is 0
+        dtype = "int64" if pd.api.types.is_integer_dtype(series) else "float64"
+
+        funcs = ["size", "count"] if self.summarization == "count" else ["size", "count", "sum"]
+        total = pd.Series({"rows": len(series), "count": series.count(), "sum": series.sum() if "sum" in funcs else 0}, dtype=dtype)
+
+        stats = {}
+        values = {}
+
+        for key in self.keys:
+            stats[key] = (
+                df.groupby(list(key), observed=True)[measure]
+                .agg(funcs)
+                .rename(columns={"size": "rows"})
+                .astype(dtype)
+            )
+
+            if self.approximate:
+                values[key] = HyperLogLog.from_frame(df, key, measure, self.precision)
+            elif self.summarization == "count":
+                values[key] = df.groupby(list(key) + [measure], observed=True).size()
+
+        return total, stats, values
+
+    @staticmethod
+    def _add(a, b):
+        # Adds aggregates with the rounding error of the sums kept in a compensation term (TwoSum),
+        # so that sums updated and expired many times stay as accurate as a recalculation
+        if isinstance(a, pd.Series):
+            # Aligning series with a fill value casts integer totals to float
+            index = a.index.union(b.index, sort=False)
+            a, b = a.reindex(index, fill_value=0), b.reindex(index, fill_value=0)
+        else:
+            a, b = a.align(b, fill_value=0)
+
+        combined = a + b
+
+        if "sum" in combined:
+            s = combined["sum"]
+            b_virtual = s - a["sum"]
+            error = (a["sum"] - (s - b_virtual)) + (b["sum"] - b_virtual)
+            combined["compensation"] = a.get("compensation", 0) + b.get("compensation", 0) + error
+
+        return combined
+
+    def _combine(self, total, stats, values, sign=1):
+        self._total = self._add(self._total, sign * total)
+
+        for key in self.keys:
+            combined = stats[key] * sign if self._stats[key] is None else self._add(self._stats[key], sign * stats[key])
+            combined = combined[combined["rows"] > 0]
+
+            # Aligned levels are sorted already, new levels that can't be sorted are the exception
+            if not combined.index.is_monotonic_increasing:
+                combined = combined.sort_index()
+
+            self._stats[key] = combined
+
+            if self.approximate:
+                if sign < 0:
+                    raise ValueError("HyperLogLog sketches can't be subtracted")
+
+                self._values[key] = HyperLogLog(self.precision).merge(values[key]) if self._values[key] is None else self._values[key].merge(values[key])
+            elif self.summarization == "count":
+                self._count_values(key, values[key], sign)
+
+    def _count_values(self, key, values, sign):
+        # Multiplicities of the (level, value) pairs are updated only for the pairs of the chunk,
+        # the distinct values of a level change when a multiplicity leaves or reaches 0
+        multiplicities = {} if self._values[key] is None else self._values[key]
+        distinct = self._distinct[key]
+
+        for pair, n in values.items():
+            level = pair[0] if len(key) == 1 else pair[:-1]
+            before = multiplicities.get(pair, 0)
+            after = before + sign * n
+
+            if after > 0:
+                multiplicities[pair] = after
+            else:
+                multiplicities.pop(pair, None)
+
+            if before <= 0 < after:
+                distinct[level] = distinct.get(level, 0) + 1
+            elif after <= 0 < before:
+                if distinct[level] == 1:
+                    del distinct[level]
+                else:
+                    distinct[level] -= 1
+
+        self._values[key] = multiplicities
+
+    def update(self, df):
+        """
+        Add the rows of a data frame chunk to the state.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+
+        if self.integer is None:
+            self.integer = pd.api.types.is_integer_dtype(df[self.measure])
+
+        self._combine(*self._aggregate(df))
+        self.n_rows += df.shape[0]
+
+        return self
+
+    def remove(self, df):
+        """
+        Subtract the rows of a data frame chunk previously added to the state.
+
+        Row counts, non-missing counts, sums and distinct value multiplicities are all
+        invertible, so expiring rows costs the same as adding them. HyperLogLog sketches
+        of approximate states can't be subtracted.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+
+        if self.approximate:
+            raise ValueError("Rows can't be removed from approximate states")
+
+        self._combine(*self._aggregate(df), sign=-1)
+        self.n_rows -= df.shape[0]
+
+        return self
+
+    def merge(self, other):
+        """
+        Add the aggregates of another state built with the same parameters.
+        """
+        if (other.measure, other.dimensions, other.summarization, other.keys, other.approximate, other.precision) != \
+                (self.measure, self.dimensions, self.summarization, self.keys, self.approximate, self.precision):
+            raise ValueError("Only states with the same measure, dimensions, summarization, narration_depth and approximation can be merged")
+
+        if other.n_rows == 0:
+            return self
+
+        if self.integer is None:
+            self.integer = other.integer
+
+        self._combine(other._total, {key: other._stats[key] for key in self.keys}, {key: other._values[key] for key in self.keys})
+        self.n_rows += other.n_rows
+
+        return self
+
+    @staticmethod
+    def _sum(stats):
+        return (stats["sum"] + stats.get("compensation", 0)).to_numpy() if isinstance(stats, pd.DataFrame) else stats["sum"] + stats.get("compensation", 0)
+
+    def _table(self, key, levels=None):
+        stats = self._stats[key]
+
+        if stats is None:
+            raise ValueError("State is empty, update it with data first")
+
+        if levels is not None:
+            stats = stats[stats.index.get_level_values(0).astype(str).isin(levels)]
+
+        table = stats.index.to_frame(index=False)
+
+        if self.approximate:
+            nunique = self._values[key].estimate().round()
+            table[self.measure] = nunique.reindex(stats.index, fill_value=0).to_numpy().astype("int64")
+        elif self.summarization == "count":
+            distinct = self._distinct[key]
+            table[self.measure] = np.fromiter((distinct.get(level, 0) for level in stats.index), dtype="int64", count=len(stats))
+        elif self.summarization == "sum":
+            table[self.measure] = self._sum(stats).astype("int64" if self.integer else "float64")
+        elif len(key) == 1:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                table[self.measure] = self._sum(stats) / stats["count"].to_numpy()
+        else:
+            table["sum"] = self._sum(stats)
+            table["count"] = stats["count"].to_numpy().astype("int64")
+
+        return table
+
+    def tables(self, dimensions=None):
+        """
+        Return the aggregated tables in the same format as aggregate_dimensions.
+        """
+        return {d: self._table((d,)) for d in (self.dimensions if dimensions is None else dimensions)}
+
+    def table_l2(self, dimension_l1, dimension_l2, levels_l1=None):
+        """
+        Return the aggregated table of a parent-child pair in the format used by get_descriptive_outliers_l2,
+        optionally only for the parent levels in levels_l1, as strings.
+        """
+        if (dimension_l1, dimension_l2) not in self._stats:
+            raise ValueError("State was built without the pair of dimensions, use narration_depth > 1")
+
+        return self._table((dimension_l1, dimension_l2), levels_l1)
+
+    def total(self):
+        """
+        Return the total in the same format as aggregate_total.
+        """
+        if self.summarization == "sum":
+            total = self._sum(self._total)
+            return np.int64(total) if self.integer else np.float64(total).round(2)
+        elif self.summarization == "average":
+            return np.float64(self._sum(self._total) / self._total["count"]).round(2)
+        else:
+            return np.int64(self._total["count"])
+
+class MeasureAggregates:
+    """
+    Precomputed aggregates of a measure, narrated with narrate_descriptive(aggregates=...).
+
+    Holds the tables built by aggregate_measures and aggregate_pair for one measure, so that
+    several measures aggregated together can be narrated without scanning the data again.
+
+    Args:
+    measure (str): The aggregated measure.
+    dimensions (list): The aggregated dimensions.
+    summarization (str): The summarization of the measure (sum, count, or average).
+    total (float): The total in the format of aggregate_total.
+    tables (dict): Tables of every dimension in the format of aggregate_dimensions.
+    tables_l2 (dict, optional): Tables keyed by parent-child pairs of dimensions in the format used by
+        get_descriptive_outliers_l2. Defaults to None.
+    """
+    def __init__(self, measure, dimensions, summarization, total, tables, tables_l2=None):
+        self.measure = measure
+        self.dimensions = list(dimensions)
+        self.summarization = summarization
+        self._total = total
+        self._tables = tables
+        self._tables_l2 = {} if tables_l2 is None else tables_l2
+
+    def tables(self, dimensions=None):
+        """
+        Return the aggregated tables in the same format as aggregate_dimensions.
+        """
+        dimensions = self.dimensions if dimensions is None else dimensions
+        return {d: self._tables[d] for d in dimensions}
+
+    def table_l2(self, dimension_l1, dimension_l2):
+        """
+        Return the aggregated table of a parent-child pair in the format used by get_descriptive_outliers_l2.
+        """
+        if (dimension_l1, dimension_l2) not in self._tables_l2:
+            raise ValueError("Aggregates were built without the pair of dimensions, use narration_depth > 1")
+
+        return self._tables_l2[(dimension_l1, dimension_l2)]
+
+    def total(self):
+        """
+        Return the total in the same format as aggregate_total.
+        """
+        return self._total
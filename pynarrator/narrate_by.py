@@ -0,0 +1,264 @@
+import inspect
+import pandas as pd
+from pynarrator.text_helpers import format_percentages
+from pynarrator.token_helpers import render_narrative
+from pynarrator.narrate_descriptive import narrate_descriptive, get_descriptive_outliers_l2
+from pynarrator.narrate_trend import narrate_trend, get_trend_outliers_l2
+from pynarrator.trend_helpers import trend_volume, get_trend_context
+from pynarrator.cache_helpers import cached
+
+def narrate_by(
+  df,
+  by,
+  measure = None,
+  dimensions = None,
+  summarization = 'sum',
+  coverage = 0.5,
+  coverage_limit = 5,
+  kind = 'descriptive',
+  template_total = None,
+  template_outlier = None,
+  template_outlier_multiple = None,
+  simplify = False,
+  generator = False,
+  context = None,
+  cache = None,
+  comparison = 'ytd',
+  periods = 1,
+  calendar = None,
+  output_format = 'plain'
+  ):
+  """
+  This function generates a narrative for every segment of a data frame.
+
+  Instead of slicing the data frame and calling narrate_descriptive or narrate_trend once per
+  segment, the totals of all segments are calculated with one groupby and the outliers of every
+  dimension are selected for all segments at once with a grouped operation over [by, dimension],
+  the same as the drill-downs of get_descriptive_outliers_l2 and get_trend_outliers_l2. Segments
+  with a single level of a dimension have no narrative for that dimension.
+
+  Parameters:
+  -----------
+  df : pandas.DataFrame
+      The data frame containing the data to analyze.
+  by : str
+      The name of the variable defining the segments.
+  measure : str or None
+      The name of the numeric variable to analyze. If None, the first numeric field
+      available in the data frame will be used.
+  dimensions : list or None
+      The names of the categorical variables to include in the analysis. If None, all
+      character or factor variables in the data frame other than by will be used.
+  summarization : str, {'sum', 'count', 'average'}
+      The method to use for summarizing the data. Default is 'sum'.
+  coverage : float, optional
+      The portion of variability to be covered by the narrative, expressed as a value
+      between 0 and 1. Default is 0.5.
+  coverage_limit : int, optional
+      The maximum number of elements to be narrated per segment and dimension. Default is 5.
+  kind : str, {'descriptive', 'trend'}
+      Narrate the segments like narrate_descriptive or like narrate_trend. Default is 'descriptive'.
+  template_total : str, optional
+      The template to use for the narrative of segment totals. Defaults to the template of
+      narrate_descriptive or narrate_trend.
+  template_outlier : str, optional
+      The template to use for single outliers. Defaults to the template of narrate_descriptive
+      or narrate_trend.
+  template_outlier_multiple : str, optional
+      The template to use for multiple outliers. Defaults to the template of narrate_descriptive
+      or narrate_trend.
+  simplify : bool, optional
+      If True, the narrative of every segment is a list of strings instead of a dictionary.
+      Default is False.
+  generator : bool, optional
+      If True, a generator of (segment, narrative) pairs is returned. The totals and outliers of
+      all segments are still computed up front, only the rendering of the narratives is deferred
+      until they are consumed. Default is False.
+  context : TrendContext, optional
+      Precomputed context from get_trend_context for kind='trend'. The compared windows are resolved
+      once on the whole data frame, so all segments cover the same period. Default is None.
+  cache : AggregationCache, optional
+      Cache of the aggregated tables, shared with narrate_descriptive and narrate_trend. Default is None.
+  comparison : str, {'ytd', 'wow', 'mom', 'qoq', 'rolling'}
+      The compared windows of kind='trend' if no context is supplied, see narrate_trend. Default is 'ytd'.
+  periods : int, optional
+      The number of periods of the 'rolling' comparison. Default is 1.
+  calendar : FiscalCalendar, optional
+      The fiscal calendar of the compared windows if no context is supplied. Default is None,
+      i.e. calendar years.
+  output_format : str, {'plain', 'html', 'markdown', 'tokens'}
+      The format of the narratives, see narrate_descriptive. Default is 'plain', i.e. text strings.
+
+  Returns:
+  --------
+  narratives : dict or generator
+      The narrative of every segment keyed by segment, or a generator of (segment, narrative) pairs.
+
+  Example:
+    from pynarrator import *
+    narratives = narrate_by(df, by = 'Store', measure = 'Sales', dimensions = ['Region', 'Product'])
+  """
+  # Assert data frame
+  if not isinstance(df, pd.DataFrame):
+    print('df must be a pandas DataFrame')
+    return
+
+  if kind not in ['descriptive', 'trend']:
+    raise ValueError("kind must of be one of: 'descriptive' or 'trend'.")
+
+  if summarization not in ["sum", "count", "average"]:
+    raise ValueError("summarization must of be one of: 'sum', 'count' or 'average'.")
+
+  # Templates default to the ones of the narrator of the same kind
+  narrator = narrate_descriptive if kind == 'descriptive' else narrate_trend
+  defaults = inspect.signature(narrator).parameters
+
+  template_total = defaults['template_total'].default if isinstance(template_total, type(None)) else template_total
+  template_outlier = defaults['template_outlier'].default if isinstance(template_outlier, type(None)) else template_outlier
+  template_outlier_multiple = defaults['template_outlier_multiple'].default if isinstance(template_outlier_multiple, type(None)) else template_outlier_multiple
+
+  if kind == 'trend':
+    if isinstance(context, type(None)):
+      context = cached(cache, df, ('trend_context', measure, comparison, periods, calendar), lambda: get_trend_context(df, measure = measure, comparison = comparison, periods = periods, calendar = calendar))
+    else:
+      context.check(df)
+
+    measure = context.measure
+
+  if isinstance(measure, type(None)):
+    measure = df.\
+      select_dtypes(include = 'number').\
+      columns[0]
+
+  if isinstance(dimensions, type(None)):
+    dimensions = df.\
+      select_dtypes(include = ['object', 'category']).\
+      columns.\
+      drop(by, errors = 'ignore').\
+      values.\
+      tolist()
+
+  if by in dimensions:
+    raise ValueError("by must not be one of the dimensions")
+
+  dimension_one = dimensions[0]
+
+  # Segments are narrated by their position, the l2 outliers are keyed by the parent levels
+  # as strings and distinct segments like 1 and '1' would share a key
+  codes, segments = pd.factorize(df[by], sort = True)
+  df = df.assign(**{by: codes})
+
+  # Totals of all segments in one groupby
+  if kind == 'descriptive':
+    grouped = df.groupby(by, observed = True)[measure]
+
+    if summarization == 'sum':
+      totals = grouped.sum().round(2)
+    elif summarization == 'average':
+      totals = grouped.mean().round(2)
+    else:
+      totals = grouped.count()
+
+    totals = totals.to_frame('total')
+  else:
+    totals = trend_volume(df, dimension = by, summarization = summarization, context = context, cache = cache).set_index(by)
+    totals = totals.assign(change = lambda x: (x['curr_volume'] - x['prev_volume']).round(2))
+    totals = totals.assign(change_p = format_percentages((totals['change'] / totals['prev_volume'] * 100).round(2)))
+
+  # Rows with a missing segment are coded -1, they aren't narrated
+  totals = totals[totals.index >= 0]
+
+  # Outliers of every dimension for all segments at once
+  outputs = {}
+
+  for dimension in dimensions:
+    if kind == 'descriptive':
+      outputs[dimension] = get_descriptive_outliers_l2(
+        df = df,
+        dimension_l1 = by,
+        dimension_l2 = dimension,
+        measure = measure,
+        summarization = summarization,
+        coverage = coverage,
+        coverage_limit = coverage_limit,
+        cache = cache
+      )
+    else:
+      outputs[dimension] = get_trend_outliers_l2(
+        df = df,
+        dimension_l1 = by,
+        dimension_l2 = dimension,
+        measure = measure,
+        summarization = summarization,
+        coverage = coverage,
+        coverage_limit = coverage_limit,
+        context = context,
+        cache = cache
+      )
+
+  def render(code, row):
+    if kind == 'descriptive':
+      variables_total = {
+        'measure': measure,
+        'dimension_one': dimension_one,
+        'total': row['total'],
+        'total_raw': row['total']
+      }
+    else:
+      variables_total = {
+        'measure': measure,
+        'dimension_one': dimension_one,
+        'total_curr': row['curr_volume'],
+        'total_prev': row['prev_volume'],
+        'change': row['change'],
+        'change_p': row['change_p'],
+        'trend': "increase" if row['change'] > 0 else "decrease",
+        'timeframe_curr': context.timeframe_curr,
+        'timeframe_prev': context.timeframe_prev
+      }
+
+    narrative = {
+      f'Total {measure}': render_narrative(template_total, variables_total, output_format)
+    }
+
+    for dimension in dimensions:
+      output = outputs[dimension].get(str(code))
+
+      if isinstance(output, type(None)):
+        continue
+
+      outlier_levels = output['outlier_levels']
+      outlier_values = output['outlier_values']
+      outlier_values_p = output['outlier_values_p']
+
+      if summarization == 'average':
+        outlier_insight = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p} vs average {measure})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels, outlier_values, outlier_values_p)])
+      else:
+        outlier_insight = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels, outlier_values, outlier_values_p)])
+
+      narrative[f'{dimension} by {measure}'] = render_narrative(
+        template_outlier_multiple if output['n_outliers'] > 1 else template_outlier,
+        {
+          'dimension': dimension,
+          'measure': measure,
+          'outlier_insight': outlier_insight,
+          'n_outliers': output['n_outliers'],
+          'outlier_levels': outlier_levels,
+          'outlier_values': outlier_values,
+          'outlier_values_p': outlier_values_p
+        },
+        output_format,
+        measure if summarization == 'average' else None
+      )
+
+    if simplify == True:
+      narrative = list(narrative.values())
+
+    return narrative
+
+  narratives = ((segments[code], render(code, row)) for code, row in zip(totals.index, totals.to_dict('records')))
+
+  if generator == True:
+    return narratives
+
+  return dict(narratives)
@@ -1,5 +1,12 @@
+import functools
 import pandas as pd
-from pynarrator.text_helpers import pluralize
+import numpy as np
+from pynarrator.text_helpers import format_percentages
+from pynarrator.token_helpers import render_narrative
+from pynarrator.descriptive_helpers import aggregate_dimensions, aggregate_measures, aggregate_pair, aggregate_total, top_k_positions, grouped_top_k_positions, group_slices, DescriptiveState, MeasureAggregates
+from pynarrator.cache_helpers import cached
+from pynarrator.sketch_helpers import HyperLogLog
+from pynarrator.parallel_helpers import map_ordered
 
 def get_descriptive_outliers(
     df, 
@@ -8,18 +15,26 @@ def get_descriptive_outliers(
     total=None, 
     summarization="sum", 
     coverage=0.5, 
-    coverage_limit=5):
+    coverage_limit=5,
+    table=None,
+    cache=None,
+    approximate=False,
+    precision=12):
     """
     Returns descriptive outliers based on a given dataframe, dimension, and measure.
 
     Args:
-    df (pandas.DataFrame): The dataframe to analyze.
+    df (pandas.DataFrame): The dataframe to analyze, can be None if table is supplied.
     dimension (str): The dimension to group by.
     measure (str): The measure to use for aggregation.
     total (float, optional): The total value to use for calculation. Defaults to None.
     summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
     coverage (float, optional): The coverage percentage to use for filtering. Defaults to 0.5.
     coverage_limit (int, optional): The maximum number of outliers to return. Defaults to 5.
+    table (pandas.DataFrame, optional): Pre-aggregated table of the dimension and measure from aggregate_dimensions. Defaults to None.
+    cache (AggregationCache, optional): Cache of the aggregated tables reused across calls. Defaults to None.
+    approximate (bool, optional): Estimate distinct counts with HyperLogLog for "count" summarization. Defaults to False.
+    precision (int, optional): HyperLogLog precision, the relative standard error is about 1.04 / sqrt(2 ** precision). Defaults to 12.
 
     Returns:
     dict: A dictionary containing the number of outliers, outlier levels, outlier values, and outlier percentages.
@@ -39,16 +54,17 @@ def get_descriptive_outliers(
     >>> get_descriptive_outliers(df, 'A', 'C', summarization='average')
     {'n_outliers': 3, 'outlier_levels': ['qux', 'baz', 'bar'], 'outlier_values': [1.0, -0.25, -0.5], 'outlier_values_p': ['47.62%', '11.90%', '23.81%']}
     """
-    table = df.groupby(dimension)[measure].agg(
-        sum if summarization == "sum" else 
-        pd.Series.nunique if summarization == "count" else 
-        "mean"
-        ).reset_index().sort_values(by=measure, ascending=False)
+    if table is None:
+        table = aggregate_dimensions(df, [dimension], measure, summarization, cache=cache, approximate=approximate, precision=precision)[dimension]
 
+    # Only the top coverage_limit levels can be returned, so rather than sorting
+    # the whole table the candidates are selected first and coverage is calculated on them
     if summarization in ["sum", "count"]:
         if total is None:
             total = table[measure].sum().round(2)
 
+        table = table.iloc[top_k_positions([table[measure]], coverage_limit)]
+
         table = (
            table.assign(
             share=lambda x: x[measure]/total)
@@ -57,18 +73,22 @@ def get_descriptive_outliers(
             .iloc[:coverage_limit]
         )
 
-        if df.shape[0] == 1 and table['cum_share'].iloc[0] == 1:
+        if df is not None and df.shape[0] == 1 and table['cum_share'].iloc[0] == 1:
             return None
 
     elif summarization == 'average':
         if total is None:
             total = table[measure].mean().round(2)
 
+        share = table[measure]/total - 1
+        share_range = share.max() - share.min()
+
+        table = table.iloc[top_k_positions([share.abs(), table[measure]], coverage_limit)]
+
         table = (table
           .assign(share = lambda x: x[measure]/total - 1)
           .assign(abs_share=lambda x: x['share'].abs())
-          .sort_values(by='abs_share', ascending=False)
-          .assign(cum_share=lambda x: x['share'].abs().cumsum()/(x['share'].max() - x['share'].min()))
+          .assign(cum_share=lambda x: x['share'].abs().cumsum()/share_range)
           .loc[lambda x: (x['cum_share'] >= coverage*2).shift(fill_value=False).cumsum() == 0]
           .iloc[:coverage_limit]
           )
@@ -76,7 +96,7 @@ def get_descriptive_outliers(
     n_outliers = table.shape[0]
     outlier_levels = table[dimension].astype(str).values.tolist()
     outlier_values = table[measure].round(1).values.tolist()
-    outlier_values_p = (table["share"].round(2) * 100).astype(str).add("%").values.tolist()
+    outlier_values_p = format_percentages(table["share"].round(2).to_numpy() * 100, decimals=1).tolist()
 
     output = {
         "n_outliers": n_outliers,
@@ -87,6 +107,195 @@ def get_descriptive_outliers(
 
     return output
 
+def get_descriptive_outliers_l2(
+    df, 
+    dimension_l1, 
+    dimension_l2, 
+    measure, 
+    levels_l1=None, 
+    summarization="sum", 
+    coverage=0.5, 
+    coverage_limit=5,
+    table=None,
+    cache=None,
+    approximate=False,
+    precision=12):
+    """
+    Returns descriptive outliers of a dimension within every level of a parent dimension.
+
+    All parent-child pairs are aggregated with a single groupby over both dimensions and
+    the outlying children of every parent are selected at once, instead of calling
+    get_descriptive_outliers on a filtered data frame for each parent level.
+    Parents with a single child level are skipped.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze, can be None if table is supplied.
+    dimension_l1 (str): The parent dimension.
+    dimension_l2 (str): The child dimension.
+    measure (str): The measure to use for aggregation.
+    levels_l1 (list, optional): Parent levels to return, as strings. Defaults to None, all levels.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    coverage (float, optional): The coverage percentage to use for filtering. Defaults to 0.5.
+    coverage_limit (int, optional): The maximum number of outliers to return per parent level. Defaults to 5.
+    table (pandas.DataFrame, optional): Pre-aggregated table of the pairs from DescriptiveState.table_l2. Defaults to None.
+    cache (AggregationCache, optional): Cache of the aggregated tables reused across calls. Defaults to None.
+    approximate (bool, optional): Estimate distinct counts with HyperLogLog for "count" summarization. Defaults to False.
+    precision (int, optional): HyperLogLog precision, the relative standard error is about 1.04 / sqrt(2 ** precision). Defaults to 12.
+
+    Returns:
+    dict: A dictionary keyed by parent level with the same output as get_descriptive_outliers for every level.
+
+    Raises:
+    ValueError: If the summarization parameter is not one of "sum", "count", or "average".
+    ValueError: If dimension_l1 and dimension_l2 are the same.
+
+    Examples:
+    >>> import pandas as pd
+    >>> data = {'A': ['foo', 'foo', 'foo', 'bar', 'bar', 'bar'],
+                'B': ['x', 'y', 'z', 'x', 'y', 'z'],
+                'C': [10, 20, 70, 30, 40, 30]}
+    >>> df = pd.DataFrame(data)
+    >>> get_descriptive_outliers_l2(df, 'A', 'B', 'C')
+    {'bar': {'n_outliers': 2, 'outlier_levels': ['y', 'x'], 'outlier_values': [40, 30], 'outlier_values_p': ['40.0%', '30.0%']}, 'foo': {'n_outliers': 1, 'outlier_levels': ['z'], 'outlier_values': [70], 'outlier_values_p': ['70.0%']}}
+    """
+    if summarization not in ["sum", "count", "average"]:
+        raise ValueError("summarization must of be one of: 'sum', 'count' or 'average'.")
+
+    if dimension_l1 == dimension_l2:
+        raise ValueError("dimension_l1 and dimension_l2 must be different")
+
+    def aggregate():
+        if summarization == "count" and approximate:
+            sketch = HyperLogLog.from_frame(df, [dimension_l1, dimension_l2], measure, precision)
+            return sketch.estimate().sort_index().round().astype("int64").rename(measure).reset_index()
+
+        grouped = df.groupby([dimension_l1, dimension_l2], observed=True)[measure]
+
+        if summarization == "count":
+            return grouped.nunique().reset_index()
+        elif summarization == "sum":
+            return grouped.sum().reset_index()
+        else:
+            return grouped.agg(["sum", "count"]).reset_index()
+
+    if table is None:
+        approximation = (approximate, precision) if summarization == "count" else None
+        table = cached(cache, df, ("descriptive_outliers_l2", dimension_l1, dimension_l2, measure, summarization, approximation), aggregate)
+
+    parents = table[dimension_l1].astype(str)
+
+    if levels_l1 is not None:
+        table = table[parents.isin(levels_l1)].reset_index(drop=True)
+        parents = parents[parents.isin(levels_l1)].reset_index(drop=True)
+
+    codes, uniques = pd.factorize(parents, sort=True)
+
+    if summarization in ["sum", "count"]:
+        total = table.groupby(codes)[measure].transform("sum")
+        table = table.assign(share=table[measure]/total)
+        positions = grouped_top_k_positions(codes, [table[measure]], coverage_limit)
+        cum_coverage = coverage
+    else:
+        # Every parent is compared to its own average, same as total_raw on the first level
+        sums = table.groupby(codes)[["sum", "count"]].transform("sum")
+        total = (sums["sum"]/sums["count"]).round(2)
+        table = table.assign(**{measure: table["sum"]/table["count"]})
+        table = table.assign(share=table[measure]/total - 1)
+        share_range = table.groupby(codes)["share"].transform("max") - table.groupby(codes)["share"].transform("min")
+        table = table.assign(share_range=share_range)
+        positions = grouped_top_k_positions(codes, [table["share"].abs(), table[measure]], coverage_limit)
+        cum_coverage = coverage*2
+
+    table = table.iloc[positions].assign(parent=codes[positions])
+    parent = table["parent"]
+
+    cum_share = table["share"].abs().groupby(parent).cumsum()
+
+    if summarization == "average":
+        cum_share = cum_share/table["share_range"]
+
+    crossed = (cum_share >= cum_coverage).groupby(parent).shift(fill_value=False)
+    table = table[crossed.groupby(parent).cumsum() == 0]
+
+    n_children = np.bincount(codes, minlength=len(uniques))
+    output = {}
+
+    # Outputs of all parents are formatted at once and sliced by parent
+    outlier_levels = table[dimension_l2].astype(str).values.tolist()
+    outlier_values = table[measure].round(1).values.tolist()
+    outlier_values_p = format_percentages(table["share"].round(2).to_numpy() * 100, decimals=1).tolist()
+
+    for code, start, end in zip(*group_slices(table["parent"].to_numpy())):
+        if n_children[code] == 1:
+            continue
+
+        output[uniques[code]] = {
+            "n_outliers": int(end - start),
+            "outlier_levels": outlier_levels[start:end],
+            "outlier_values": outlier_values[start:end],
+            "outlier_values_p": outlier_values_p[start:end]
+        }
+
+    if levels_l1 is not None:
+        output = {level: output[level] for level in levels_l1 if level in output}
+
+    return output
+
+def _dimension_outliers(
+  dimension,
+  df,
+  dimensions,
+  measure,
+  total,
+  summarization,
+  coverage,
+  coverage_limit,
+  narration_depth,
+  tables,
+  cache,
+  aggregates,
+  approximate,
+  precision
+  ):
+  # Outliers of a dimension and of the other dimensions within its outlying levels,
+  # independent of the other dimensions so that they can be computed in parallel
+  output = get_descriptive_outliers(
+    df = df,
+    dimension=dimension,
+    measure=measure,
+    total = total,
+    summarization = summarization,
+    coverage = coverage,
+    coverage_limit = coverage_limit,
+    table = tables[dimension]
+  )
+
+  outputs_l2 = {}
+
+  if output is None or narration_depth < 2:
+    return output, outputs_l2
+
+  for dimension_l2 in dimensions:
+    if dimension_l2 == dimension:
+      continue
+
+    outputs_l2[dimension_l2] = get_descriptive_outliers_l2(
+      df = df,
+      dimension_l1 = dimension,
+      dimension_l2 = dimension_l2,
+      measure = measure,
+      levels_l1 = output['outlier_levels'],
+      summarization = summarization,
+      coverage = coverage,
+      coverage_limit = coverage_limit,
+      table = None if isinstance(aggregates, type(None)) else aggregates.table_l2(dimension, dimension_l2),
+      cache = cache,
+      approximate = approximate,
+      precision = precision
+    )
+
+  return output, outputs_l2
+
 def narrate_descriptive(
   df,
   measure = None,
@@ -102,7 +311,14 @@ def narrate_descriptive(
   template_outlier_l2 = 'In {level_l1}, significant {level_l2} by {measure} is {outlier_insight}.',
   template_outlier_l2_multiple = 'In {level_l1}, significant {pluralize(level_l2)} by {measure} are {outlier_insight}.',
   return_data = False,
-  simplify = False
+  simplify = False,
+  cache = None,
+  aggregates = None,
+  approximate = False,
+  precision = 12,
+  n_jobs = None,
+  executor = None,
+  output_format = 'plain'
   ):
   """
   This function generates a narrative report based on a given data frame and parameters.
@@ -145,6 +361,31 @@ def narrate_descriptive(
   simplify : bool, optional
       If True, the function will return a list of the narrative strings instead of a
       dictionary. Default is False.
+  cache : AggregationCache, optional
+      Cache of the aggregated tables. Calls on the same data frame that only change
+      coverage, coverage_limit or templates reuse them instead of scanning the data. Default is None.
+  aggregates : DescriptiveState, optional
+      Pre-aggregated state to narrate instead of df, which can be None in this case.
+      Measure and summarization are taken from it. Default is None.
+  approximate : bool, optional
+      If True, distinct counts of the 'count' summarization are estimated with HyperLogLog
+      sketches instead of exact nunique, which is faster and uses less memory on measures
+      with many distinct values. Default is False.
+  precision : int, optional
+      HyperLogLog precision between 4 and 18. The relative standard error of the counts is
+      about 1.04 / sqrt(2 ** precision), 1.6% for the default of 12. Default is 12.
+  n_jobs : int, optional
+      The number of threads analyzing dimensions in parallel, -1 for all CPUs. The
+      narrative is the same and in the same order as with sequential execution. Default
+      is None, i.e. sequential.
+  executor : concurrent.futures.Executor, optional
+      Executor to analyze dimensions with instead of a thread pool of n_jobs threads.
+      Process pools receive a pickled copy of the data frame for every dimension and an
+      empty copy of the cache. Default is None.
+  output_format : str, {'plain', 'html', 'markdown', 'tokens'}
+      The format of the narratives. 'html' and 'markdown' render the structured tokens
+      of a narrative in a single pass, with colored percentages and emphasized levels,
+      'tokens' returns the lists of Token objects. Default is 'plain', i.e. text strings.
       
   Returns:
   --------
@@ -156,8 +397,24 @@ def narrate_descriptive(
     from pynarrator import *\
     narrative = narrate_descriptive(df, measure = 'Sales', dimensions = ['Region', 'Product'])
   """
+  # Narrating pre-aggregated state instead of a data frame
+  if not isinstance(aggregates, type(None)):
+    if not isinstance(measure, type(None)) and measure != aggregates.measure:
+      raise ValueError("measure must match the measure of the supplied aggregates")
+
+    if summarization != aggregates.summarization:
+      raise ValueError("summarization must match the summarization of the supplied aggregates")
+
+    if isinstance(dimensions, type(None)):
+      dimensions = aggregates.dimensions
+    elif any(dimension not in aggregates.dimensions for dimension in dimensions):
+      raise ValueError("dimensions must be a subset of the dimensions of the supplied aggregates")
+
+    measure = aggregates.measure
+    df = None
+
   # Assert data frame
-  if not isinstance(df, pd.DataFrame):
+  elif not isinstance(df, pd.DataFrame):
     print('df must be a pandas DataFrame')
     return
   
@@ -175,16 +432,19 @@ def narrate_descriptive(
       
   dimension_one = dimensions[0]
   
-  if summarization == 'sum':
-    total_raw = df[measure].sum().round(2)
-  elif summarization == 'average':
-    total_raw = df[measure].mean().round(2)
-  elif summarization == 'count':
-    total_raw = df[measure].count()
+  if isinstance(aggregates, type(None)):
+    total_raw = aggregate_total(df, measure, summarization, cache = cache)
+  else:
+    total_raw = aggregates.total()
 
   total = total_raw
   
-  narrative_total = eval(f"f'{template_total}'")
+  narrative_total = render_narrative(template_total, {
+    'measure': measure,
+    'dimension_one': dimension_one,
+    'total': total,
+    'total_raw': total_raw
+  }, output_format)
   
   narrative = {
     f'Total {measure}': narrative_total
@@ -201,19 +461,41 @@ def narrate_descriptive(
     }
   }
 
-  # High-Level Narrative
-  for dimension in dimensions:
+  # Aggregating all dimensions in a single scan of the data
+  if isinstance(aggregates, type(None)):
+    tables = aggregate_dimensions(df, dimensions, measure, summarization, cache = cache, approximate = approximate, precision = precision)
+  else:
+    tables = aggregates.tables(dimensions)
 
-    output = get_descriptive_outliers(
+  # Outliers of every dimension, in parallel if requested
+  outputs = map_ordered(
+    functools.partial(
+      _dimension_outliers,
       df = df,
-      dimension=dimension,
-      measure=measure,
+      dimensions = dimensions,
+      measure = measure,
       # we need overall total for average only, in other cases it leads to incorrect output
       total = None if summarization in ["sum", "count"] else total_raw,
       summarization = summarization,
       coverage = coverage,
-      coverage_limit = coverage_limit
-    )
+      coverage_limit = coverage_limit,
+      narration_depth = narration_depth,
+      tables = tables,
+      cache = cache,
+      aggregates = aggregates,
+      approximate = approximate,
+      precision = precision
+    ),
+    dimensions,
+    n_jobs = n_jobs,
+    executor = executor
+  )
+
+  # Measure added to the outlier insights of averages
+  average_measure = measure if summarization == 'average' else None
+
+  # High-Level Narrative
+  for dimension, (output, outputs_l2_all) in zip(dimensions, outputs):
 
     if output is None:
         continue
@@ -237,7 +519,15 @@ def narrate_descriptive(
       template_selected = "single"
 
     narrative_outlier_final = {
-       f'{dimension} by {measure}': eval(f"f'{template_outlier_final}'")
+       f'{dimension} by {measure}': render_narrative(template_outlier_final, {
+          'dimension': dimension,
+          'measure': measure,
+          'outlier_insight': outlier_insight,
+          'n_outliers': n_outliers,
+          'outlier_levels': outlier_levels,
+          'outlier_values': outlier_values,
+          'outlier_values_p': outlier_values_p
+          }, output_format, average_measure)
        }
     
     narrative.update(narrative_outlier_final)
@@ -273,6 +563,53 @@ def narrate_descriptive(
         }
 
     variables.update(variables_l1)
+
+    # Low-Level Narrative
+    if narration_depth > 1:
+      for dimension_l2 in dimensions:
+        if dimension_l2 == dimension:
+          continue
+
+        outputs_l2 = outputs_l2_all[dimension_l2]
+
+        for level_l1, output_l2 in outputs_l2.items():
+          n_outliers_l2 = output_l2['n_outliers']
+          outlier_levels_l2 = output_l2['outlier_levels']
+          outlier_values_l2 = output_l2['outlier_values']
+          outlier_values_p_l2 = output_l2['outlier_values_p']
+
+          if summarization == 'average':
+            outlier_insight_l2 = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p} vs average {measure})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels_l2, outlier_values_l2, outlier_values_p_l2)])
+          else:
+            outlier_insight_l2 = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels_l2, outlier_values_l2, outlier_values_p_l2)])
+
+          if n_outliers_l2 > 1:
+            template_outlier_l2_final = template_outlier_l2_multiple
+          else:
+            template_outlier_l2_final = template_outlier_l2
+
+          template_variables_l2 = {
+            'level_l1': level_l1,
+            'level_l2': dimension_l2,
+            'dimension_l1': dimension,
+            'dimension_l2': dimension_l2,
+            'measure': measure,
+            'outlier_insight': outlier_insight_l2,
+            'n_outliers': n_outliers_l2,
+            'outlier_levels': outlier_levels_l2,
+            'outlier_values': outlier_values_l2,
+            'outlier_values_p': outlier_values_p_l2
+          }
+
+          narrative_outlier_l2 = render_narrative(template_outlier_l2_final, template_variables_l2, output_format, average_measure)
+
+          narrative[f'{dimension} {level_l1} - {dimension_l2} by {measure}'] = narrative_outlier_l2
+
+          variables[f'{dimension} {level_l1} - {dimension_l2} by {measure}'] = {
+            'narrative_outlier_l2': narrative_outlier_l2,
+            'template_outlier_l2': template_outlier_l2_final,
+            **template_variables_l2
+          }
     
   # Output
   if return_data == True:
@@ -283,3 +620,193 @@ def narrate_descriptive(
     
   return(narrative)
 
+def narrate_descriptive_stream(
+  chunks,
+  measure = None,
+  dimensions = None,
+  summarization = 'sum',
+  narration_depth = 2,
+  approximate = False,
+  precision = 12,
+  **kwargs
+  ):
+  """
+  This function generates the narrative of narrate_descriptive from a stream of data frame chunks.
+
+  Every chunk only updates a mergeable DescriptiveState, so peak memory is bounded by the chunk
+  size and the dimension cardinality instead of the size of the whole data set.
+
+  Parameters:
+  -----------
+  chunks : iterable of pandas.DataFrame
+      Data frame chunks with the same columns, like pd.read_csv(..., chunksize=...) or
+      Parquet row groups converted with to_pandas().
+  measure : str or None
+      The name of the numeric variable to analyze. If None, the first numeric field
+      available in the first chunk will be used.
+  dimensions : list or None
+      The names of the categorical variables to include in the analysis. If None, all
+      character or factor variables in the first chunk will be used.
+  summarization : str, {'sum', 'count', 'average'}
+      The method to use for summarizing the data. Default is 'sum'.
+  narration_depth : int, {1, 2}
+      The depth of the analysis to include in the narrative. 1 for summary and 2 for detailed.
+  approximate : bool, optional
+      If True, distinct counts of the 'count' summarization are kept as mergeable HyperLogLog
+      sketches instead of exact distinct values. Default is False.
+  precision : int, optional
+      HyperLogLog precision between 4 and 18. Default is 12.
+  **kwargs
+      Other arguments of narrate_descriptive like coverage, coverage_limit or templates.
+
+  Returns:
+  --------
+  narrative : dict or list
+      The same narrative as narrate_descriptive on the concatenated chunks.
+
+  Example:
+    from pynarrator import *
+    chunks = pd.read_csv('sales.csv', chunksize = 100000)
+    narrative = narrate_descriptive_stream(chunks, measure = 'Sales', dimensions = ['Region', 'Product'])
+  """
+  state = None
+
+  for chunk in chunks:
+    if isinstance(state, type(None)):
+      if isinstance(measure, type(None)):
+        measure = chunk.\
+          select_dtypes(include = 'number').\
+          columns[0]
+
+      if isinstance(dimensions, type(None)):
+        dimensions = chunk.\
+          select_dtypes(include = ['object', 'category']).\
+          columns.\
+          values.\
+          tolist()
+
+      state = DescriptiveState(measure, dimensions, summarization, narration_depth, approximate, precision)
+
+    state.update(chunk)
+
+  if isinstance(state, type(None)):
+    raise ValueError("chunks must contain at least one data frame")
+
+  return narrate_descriptive(
+    None,
+    summarization = summarization,
+    narration_depth = narration_depth,
+    aggregates = state,
+    **kwargs
+  )
+
+def narrate_descriptive_many(
+  df,
+  measures,
+  dimensions = None,
+  summarization = 'sum',
+  narration_depth = 2,
+  cache = None,
+  approximate = False,
+  precision = 12,
+  **kwargs
+  ):
+  """
+  This function generates the narratives of narrate_descriptive for several measures of the same data frame.
+
+  All measures are aggregated together: every dimension is factorized once and every pair of
+  dimensions is grouped once for all measures, so N measures and D dimensions take D scans
+  instead of the N x D scans of separate narrate_descriptive calls.
+
+  Parameters:
+  -----------
+  df : pandas.DataFrame
+      The data frame containing the data to analyze.
+  measures : list or dict
+      The measures to narrate. Either a list of measure names and (measure, summarization)
+      tuples, or a dictionary of summarizations keyed by measure.
+  dimensions : list or None
+      The names of the categorical variables to include in the analysis. If None, all
+      character or factor variables in the data frame other than the measures will be used.
+  summarization : str, {'sum', 'count', 'average'}
+      The summarization of the measures listed without one. Default is 'sum'.
+  narration_depth : int, {1, 2}
+      The depth of the analysis to include in the narrative. 1 for summary and 2 for detailed.
+  cache : AggregationCache, optional
+      Cache of the aggregated tables, shared with narrate_descriptive. Default is None.
+  approximate : bool, optional
+      If True, distinct counts of the 'count' summarization are estimated with HyperLogLog
+      sketches. Default is False.
+  precision : int, optional
+      HyperLogLog precision between 4 and 18. Default is 12.
+  **kwargs
+      Other arguments of narrate_descriptive like coverage, coverage_limit, templates or n_jobs.
+
+  Returns:
+  --------
+  narratives : dict
+      The narrative of narrate_descriptive of every measure, keyed by measure.
+
+  Example:
+    from pynarrator import *
+    narratives = narrate_descriptive_many(df, measures = ['Sales', ('Price', 'average'), ('Order ID', 'count')])
+  """
+  # Assert data frame
+  if not isinstance(df, pd.DataFrame):
+    print('df must be a pandas DataFrame')
+    return
+
+  if isinstance(measures, dict):
+    measures = list(measures.items())
+
+  measures = [(measure, summarization) if isinstance(measure, str) else tuple(measure) for measure in measures]
+
+  if len(set(measure for measure, _ in measures)) < len(measures):
+    raise ValueError("measures must be unique")
+
+  measures = dict(measures)
+
+  if isinstance(dimensions, type(None)):
+    dimensions = df.\
+      select_dtypes(include = ['object', 'category']).\
+      columns.\
+      drop(list(measures), errors = 'ignore').\
+      values.\
+      tolist()
+
+  tables = aggregate_measures(df, dimensions, measures, cache = cache, approximate = approximate, precision = precision)
+
+  # Every pair of dimensions is grouped once for both drill-down directions
+  tables_l2 = {}
+
+  if narration_depth > 1:
+    for i, dimension_l1 in enumerate(dimensions):
+      for dimension_l2 in dimensions[i + 1:]:
+        tables_l2.update(cached(
+          cache,
+          df,
+          ("aggregate_pair", dimension_l1, dimension_l2, tuple(measures.items()), approximate, precision),
+          lambda: aggregate_pair(df, dimension_l1, dimension_l2, measures, approximate = approximate, precision = precision)
+        ))
+
+  narratives = {}
+
+  for measure, measure_summarization in measures.items():
+    aggregates = MeasureAggregates(
+      measure,
+      dimensions,
+      measure_summarization,
+      aggregate_total(df, measure, measure_summarization, cache = cache),
+      tables[measure],
+      {pair: tables_pair[measure] for pair, tables_pair in tables_l2.items()}
+    )
+
+    narratives[measure] = narrate_descriptive(
+      None,
+      summarization = measure_summarization,
+      narration_depth = narration_depth,
+      aggregates = aggregates,
+      **kwargs
+    )
+
+  return narratives
@@ -0,0 +1,310 @@
+import inspect
+from collections import deque
+import pandas as pd
+from pynarrator.text_helpers import render_template
+from pynarrator.narrate_descriptive import narrate_descriptive, get_descriptive_outliers, get_descriptive_outliers_l2
+from pynarrator.descriptive_helpers import DescriptiveState
+
+class IncrementalNarrator:
+    """
+    Stateful descriptive narrator updated with appended rows.
+
+    Keeps a DescriptiveState of the measure by the dimensions, so every append only
+    aggregates the new rows and combines them with the state, the full history isn't
+    scanned again. The outliers of every dimension are selected again from the state,
+    while the drill-downs of parent levels without new rows are reused as is, since
+    they only depend on the rows of their parent. Only the sentences whose variables
+    changed are rendered again.
+
+    The narrative is the same as narrate_descriptive on all the rows appended so far.
+
+    Args:
+    measure (str, optional): The measure to narrate, by default the first numeric column of the first rows.
+    dimensions (list, optional): The dimensions to narrate, by default the character and categorical columns of the first rows.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    narration_depth (int, optional): The depth of the narrative, 1 for summary and 2 for detailed. Defaults to 2.
+    coverage (float, optional): The portion of variability to be covered by the narrative. Defaults to 0.5.
+    coverage_limit (int, optional): The maximum number of elements to be narrated. Defaults to 5.
+    **templates: Templates of narrate_descriptive like template_total or template_outlier_l2.
+
+    Examples:
+    >>> narrator = IncrementalNarrator(measure='Sales', dimensions=['Region', 'Product'])
+    >>> narrator.append(df)
+    ['Total Sales', 'Region by Sales', ...]
+    >>> narrator.append(df_next_hour)
+    ['Total Sales', 'Region by Sales', 'Region NA - Product by Sales']
+    >>> narrator.narrative
+    {'Total Sales': 'Total Sales across all Regions is 38818794.53.', ...}
+    """
+    def __init__(
+            self,
+            measure=None,
+            dimensions=None,
+            summarization="sum",
+            narration_depth=2,
+            coverage=0.5,
+            coverage_limit=5,
+            **templates):
+        defaults = inspect.signature(narrate_descriptive).parameters
+        unknown = [name for name in templates if not name.startswith("template_") or name not in defaults]
+
+        if unknown:
+            raise ValueError(f"Unknown templates: {', '.join(unknown)}")
+
+        self.measure = measure
+        self.dimensions = dimensions
+        self.summarization = summarization
+        self.narration_depth = narration_depth
+        self.coverage = coverage
+        self.coverage_limit = coverage_limit
+        self.templates = {name: templates.get(name, parameter.default) for name, parameter in defaults.items() if name.startswith("template_")}
+
+        self.state = None
+        self.narrative = {}
+        self._variables = {}
+        self._outputs_l2 = {}
+
+    def _state(self, df):
+        if isinstance(self.measure, type(None)):
+            self.measure = df.select_dtypes(include='number').columns[0]
+
+        if isinstance(self.dimensions, type(None)):
+            self.dimensions = df.select_dtypes(include=['object', 'category']).columns.values.tolist()
+
+        return DescriptiveState(self.measure, self.dimensions, self.summarization, self.narration_depth)
+
+    def _sentences(self, touched):
+        # Template and variables of every sentence in the order of narrate_descriptive
+        measure = self.measure
+        summarization = self.summarization
+        total = self.state.total()
+
+        yield f'Total {measure}', self.templates['template_total'], {
+            'measure': measure,
+            'dimension_one': self.dimensions[0],
+            'total': total,
+            'total_raw': total
+        }
+
+        for dimension in self.dimensions:
+            output = get_descriptive_outliers(
+                df=None,
+                dimension=dimension,
+                measure=measure,
+                total=None if summarization in ["sum", "count"] else total,
+                summarization=summarization,
+                coverage=self.coverage,
+                coverage_limit=self.coverage_limit,
+                table=self.state.tables([dimension])[dimension]
+            )
+
+            if output is None:
+                continue
+
+            yield f'{dimension} by {measure}', self.templates['template_outlier_multiple' if output['n_outliers'] > 1 else 'template_outlier'], {
+                'dimension': dimension,
+                'measure': measure,
+                'outlier_insight': self._insight(output),
+                **output
+            }
+
+            if self.narration_depth < 2:
+                continue
+
+            levels_l1 = output['outlier_levels']
+
+            for dimension_l2 in self.dimensions:
+                if dimension_l2 == dimension:
+                    continue
+
+                # Drill-downs only depend on the rows of their parent level
+                previous = self._outputs_l2.get((dimension, dimension_l2), {})
+                refresh = [level for level in levels_l1 if level in touched[dimension] or level not in previous]
+                outputs_l2 = {level: previous[level] for level in levels_l1 if level not in refresh and level in previous}
+
+                if refresh:
+                    outputs_l2.update(get_descriptive_outliers_l2(
+                        df=None,
+                        dimension_l1=dimension,
+                        dimension_l2=dimension_l2,
+                        measure=measure,
+                        levels_l1=refresh,
+                        summarization=summarization,
+                        coverage=self.coverage,
+                        coverage_limit=self.coverage_limit,
+                        table=self.state.table_l2(dimension, dimension_l2, refresh)
+                    ))
+
+                outputs_l2 = {level: outputs_l2[level] for level in levels_l1 if level in outputs_l2}
+                self._outputs_l2[(dimension, dimension_l2)] = outputs_l2
+
+                for level_l1, output_l2 in outputs_l2.items():
+                    yield f'{dimension} {level_l1} - {dimension_l2} by {measure}', self.templates['template_outlier_l2_multiple' if output_l2['n_outliers'] > 1 else 'template_outlier_l2'], {
+                        'level_l1': level_l1,
+                        'level_l2': dimension_l2,
+                        'dimension_l1': dimension,
+                        'dimension_l2': dimension_l2,
+                        'measure': measure,
+                        'outlier_insight': self._insight(output_l2),
+                        **output_l2
+                    }
+
+    def _insight(self, output):
+        if self.summarization == 'average':
+            return ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p} vs average {self.measure})" for outlier_levels, outlier_values, outlier_values_p in zip(output['outlier_levels'], output['outlier_values'], output['outlier_values_p'])])
+
+        return ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p})" for outlier_levels, outlier_values, outlier_values_p in zip(output['outlier_levels'], output['outlier_values'], output['outlier_values_p'])])
+
+    def append(self, df):
+        """
+        Add new rows and update the narrative.
+
+        Args:
+        df (pandas.DataFrame): The new rows, with the same columns as the previous ones.
+
+        Returns:
+        list: The keys of the narrative whose sentence changed, was added or was removed.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+
+        if self.state is None:
+            self.state = self._state(df)
+
+        self.state.update(df)
+
+        return self._refresh(df)
+
+    def remove(self, df):
+        """
+        Subtract rows appended before, e.g. expired rows, and update the narrative.
+
+        Args:
+        df (pandas.DataFrame): The rows to remove, appended before.
+
+        Returns:
+        list: The keys of the narrative whose sentence changed, was added or was removed.
+        """
+        if self.state is None:
+            raise ValueError("Narrator is empty, append rows first")
+
+        self.state.remove(df)
+
+        return self._refresh(df)
+
+    def _refresh(self, *frames):
+        touched = {dimension: set().union(*(frame[dimension].dropna().astype(str) for frame in frames)) for dimension in self.dimensions}
+
+        narrative = {}
+        variables = {}
+
+        for key, template, sentence_variables in self._sentences(touched):
+            previous = self._variables.get(key)
+
+            # Only sentences with new variables or template are rendered again
+            if previous is not None and previous == (template, sentence_variables):
+                narrative[key] = self.narrative[key]
+            else:
+                narrative[key] = render_template(template, sentence_variables)
+
+            variables[key] = (template, sentence_variables)
+
+        changed = [key for key in narrative if self.narrative.get(key) != narrative[key]]
+        changed += [key for key in self.narrative if key not in narrative]
+
+        self.narrative = narrative
+        self._variables = variables
+
+        return changed
+
+class WindowNarrator(IncrementalNarrator):
+    """
+    Descriptive narrator of a sliding time window, e.g. the last 28 days.
+
+    Every append adds the entering rows to the aggregate state and subtracts the rows
+    that fell out of the window, so a step costs O(delta) instead of O(window). The
+    state keeps invertible aggregates per dimension level: the sum for "sum", the sum
+    and the number of values for "average" and the multiplicity of every distinct value
+    for "count". Outliers are selected with the same coverage rules as get_descriptive_outliers.
+
+    The rows of the window are buffered in the chunks they were appended in, chunks are
+    expected in date order and rows older than the window are dropped on arrival.
+
+    Args:
+    date (str): The date column.
+    window (str or pandas.Timedelta): The length of the window, rows with dates after the latest date minus window are kept.
+    **kwargs: Arguments of IncrementalNarrator like measure, dimensions, summarization or templates.
+
+    Examples:
+    >>> narrator = WindowNarrator(date='Date', window='28D', measure='Sales', dimensions=['Region', 'Product'])
+    >>> for day, rows in df.groupby(pd.Grouper(key='Date', freq='D')):
+    ...     changed = narrator.append(rows)
+    """
+    def __init__(self, date, window, **kwargs):
+        super().__init__(**kwargs)
+
+        self.date = date
+        self.window = pd.Timedelta(window)
+        self.end = None
+        self._chunks = deque()
+
+    def append(self, df):
+        """
+        Add the entering rows, subtract the expiring ones and update the narrative.
+
+        Args:
+        df (pandas.DataFrame): The new rows, with the same columns as the previous ones.
+
+        Returns:
+        list: The keys of the narrative whose sentence changed, was added or was removed.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+
+        if self.state is None:
+            self.state = self._state(df)
+
+        dates = pd.to_datetime(df[self.date])
+
+        if dates.notna().any():
+            self.end = dates.max() if self.end is None else max(self.end, dates.max())
+
+        start = None if self.end is None else self.end - self.window
+
+        if start is not None:
+            df = df[(dates > start).to_numpy()]
+
+        # Chunks are in date order, only the oldest ones can expire
+        expired = []
+
+        while start is not None and self._chunks:
+            chunk = self._chunks[0]
+            mask = (pd.to_datetime(chunk[self.date]) <= start).to_numpy()
+
+            if not mask.any():
+                break
+
+            expired.append(chunk[mask])
+
+            if mask.all():
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = chunk[~mask]
+                break
+
+        if df.shape[0] > 0:
+            self.state.update(df)
+            self._chunks.append(df)
+
+        expired = pd.concat(expired) if expired else df.iloc[:0]
+
+        if expired.shape[0] > 0:
+            self.state.remove(expired)
+
+        return self._refresh(df, expired)
+
+    def rows(self):
+        """
+        Return the rows of the current window.
+        """
+        return pd.concat(self._chunks) if self._chunks else None
@@ -1,5 +1,17 @@
+import functools
+import inspect
 import pandas as pd
-from pynarrator.trend_helpers import ytd_volume, pytd_volume
+import numpy as np
+from pynarrator.trend_helpers import trend_volume, get_trend_context, series_matrix
+from pynarrator.text_helpers import render_template, format_percentages
+from pynarrator.token_helpers import render_narrative
+from pynarrator.descriptive_helpers import aggregate_total, top_k_positions, grouped_top_k_positions, group_slices
+from pynarrator.cache_helpers import cached
+from pynarrator.parallel_helpers import map_ordered
+
+def _change_percentages(table):
+    # Changes vs the previous volumes, formatted only for the selected outliers
+    return format_percentages((table['change'] / table['prev_volume'] * 100).round(2)).tolist()
 
 def get_trend_outliers(
     df, 
@@ -8,21 +20,29 @@ def get_trend_outliers(
     total = None, 
     summarization = "sum", 
     coverage = 0.5, 
-    coverage_limit = 5):
+    coverage_limit = 5,
+    context = None,
+    cache = None):
     """
     Returns trend outliers based on a given dataframe, dimension, and measure.
 
+    Levels are ranked by their absolute change for every summarization, including
+    'average'. When no level changed there are no outliers and None is returned.
+
     Args:
     df (pandas.DataFrame): The dataframe to analyze.
     dimension (str): The dimension to group by.
     measure (str): The measure to use for aggregation.
-    total (float, optional): The total value to use for calculation. Defaults to None.
+    total (float, optional): Unused, accepted for compatibility. The shares are relative to the total absolute change. Defaults to None.
     summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
     coverage (float, optional): The coverage percentage to use for filtering. Defaults to 0.5.
     coverage_limit (int, optional): The maximum number of outliers to return. Defaults to 5.
+    context (TrendContext, optional): Precomputed context from get_trend_context, reused across calls. Defaults to None.
+    cache (AggregationCache, optional): Cache of the aggregated volumes reused across calls. Defaults to None.
 
     Returns:
-    dict: A dictionary containing the number of outliers, outlier levels, outlier values, and outlier percentages.
+    dict: A dictionary containing the number of outliers, outlier levels, outlier values, and outlier percentages,
+    or None if no level changed.
 
     Raises:
     ValueError: If the summarization parameter is not one of "sum", "count", or "average".
@@ -32,49 +52,30 @@ def get_trend_outliers(
     >>> sales = read_data()
     >>> sales['Date'] = pd.to_datetime(sales['Date'])
     >>> sales_monthly = sales.groupby(['Region', 'Product', pd.Grouper(key='Date', freq='MS')])['Sales'].sum().reset_index()
-    >>> get_trend_outliers(sales_monthly)
-    {'n_outliers': 3, 'outlier_levels': ['qux', 'baz', 'bar'], 'outlier_values': [80, 60, 40], 'outlier_values_p': ['25.0%', '18.75%', '12.5%']}
-
-    >>> get_trend_outliers(sales_monthly, 'A', 'C', summarization='average')
-    {'n_outliers': 3, 'outlier_levels': ['qux', 'baz', 'bar'], 'outlier_values': [1.0, -0.25, -0.5], 'outlier_values_p': ['47.62%', '11.90%', '23.81%']}
+    >>> get_trend_outliers(sales_monthly, 'Region', 'Sales')
+    {'n_outliers': 2, 'outlier_levels': ['NA', 'EMEA'], 'outlier_values': [533101.3, 416900.3], 'outlier_values_p': ['9.1%', '9.91%']}
     """
-    grouped = df.groupby(dimension)
-
-    # Define a function to apply to each group
-    def process_group(group, ytd_volume, pytd_volume, summarization, measure):
-        curr_volume = ytd_volume(group, summarization=summarization, measure=measure)
-        prev_volume = pytd_volume(group, summarization=summarization, measure=measure)
-        change = curr_volume - prev_volume
-        change_p = f"{round(change / prev_volume * 100, 2)}%"
-        abs_change = abs(change)
-        trend = "increase" if change > 0 else "decrease"
-        
-        output = pd.Series({
-            "curr_volume": curr_volume,
-            "prev_volume": prev_volume,
-            "change": change,
-            "change_p": change_p,
-            "abs_change": abs_change,
-            "trend": trend,
-        })
-        
-        return output
-
-    # Apply the function to each group and create a new DataFrame
-    table = grouped.apply(process_group, ytd_volume, pytd_volume, summarization, measure)
-
-    # Reset the index and sort by abs_change
-    table = table.reset_index().sort_values(by="abs_change", ascending=False)
-
-    if summarization in ["sum", "count"]:
-      if total is None:
-        total = df[measure].sum().round(2)
+    # Current and prior year to date volumes for all levels in one groupby
+    table = trend_volume(df, dimension=dimension, measure=measure, summarization=summarization, context=context, cache=cache)
+
+    table = table.assign(change=lambda x: x['curr_volume'] - x['prev_volume'])
+    table = table.assign(
+        abs_change=lambda x: x['change'].abs(),
+        trend=lambda x: np.where(x['change'] > 0, "increase", "decrease")
+    )
+
+    # Without any change the shares are undefined and nothing is an outlier
+    if table['abs_change'].sum() == 0:
+        return None
+
+    # Sort by abs_change
+    table = table.sort_values(by="abs_change", ascending=False)
 
     table = (
         table.assign(share=lambda x: x['abs_change'] / x['abs_change'].sum())
               .assign(cum_share=lambda x: x['share'].cumsum())
-              .assign(lag_cum_share=lambda x: x['cum_share'].shift(fill_value=False))
-    ).reset_index()
+              .assign(lag_cum_share=lambda x: x['cum_share'].shift(fill_value=0))
+    ).reset_index(drop=True)
 
     table = table[table['lag_cum_share'] < coverage]
     table = table.head(coverage_limit)
@@ -82,23 +83,10 @@ def get_trend_outliers(
     if df.shape[0] == 1 and table['cum_share'].iloc[0] == 1:
         return None
 
-    elif summarization == 'average':
-        if total is None:
-            total = table[measure].mean().round(2)
-
-        table = (table
-          .assign(share = lambda x: x[measure]/total - 1)
-          .assign(abs_share=lambda x: x['share'].abs())
-          .sort_values(by='abs_share', ascending=False)
-          .assign(cum_share=lambda x: x['share'].abs().cumsum()/(x['share'].max() - x['share'].min()))
-          .loc[lambda x: (x['cum_share'] >= coverage*2).shift(fill_value=False).cumsum() == 0]
-          .iloc[:coverage_limit]
-          )
-
     n_outliers = table.shape[0]
     outlier_levels = table[dimension].astype(str).values.tolist()
-    outlier_values = table[measure].round(1).values.tolist()
-    outlier_values_p = (table["share"].round(2) * 100).astype(str).add("%").values.tolist()
+    outlier_values = table["change"].round(1).values.tolist()
+    outlier_values_p = _change_percentages(table)
 
     output = {
         "n_outliers": n_outliers,
@@ -110,6 +98,279 @@ def get_trend_outliers(
     return output
 
 
+def get_trend_outliers_l2(
+    df, 
+    dimension_l1, 
+    dimension_l2, 
+    measure, 
+    levels_l1 = None, 
+    summarization = "sum", 
+    coverage = 0.5, 
+    coverage_limit = 5,
+    context = None,
+    cache = None):
+    """
+    Returns trend outliers of a dimension within every level of a parent dimension.
+
+    YTD and PYTD volumes of all parent-child pairs are calculated with a single groupby over
+    both dimensions and the children with the biggest changes are selected for all parents at once.
+    Parents with a single child level are skipped.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze.
+    dimension_l1 (str): The parent dimension.
+    dimension_l2 (str): The child dimension.
+    measure (str): The measure to use for aggregation.
+    levels_l1 (list, optional): Parent levels to return, as strings. Defaults to None, all levels.
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    coverage (float, optional): The coverage percentage to use for filtering. Defaults to 0.5.
+    coverage_limit (int, optional): The maximum number of outliers to return per parent level. Defaults to 5.
+    context (TrendContext, optional): Precomputed context from get_trend_context, reused across calls. Defaults to None.
+    cache (AggregationCache, optional): Cache of the aggregated volumes reused across calls. Defaults to None.
+
+    Returns:
+    dict: A dictionary keyed by parent level with the same output as get_trend_outliers for every level.
+
+    Raises:
+    ValueError: If the summarization parameter is not one of "sum", "count", or "average".
+    ValueError: If dimension_l1 and dimension_l2 are the same.
+
+    Examples:
+    >>> import pandas as pd
+    >>> sales = read_data()
+    >>> sales['Date'] = pd.to_datetime(sales['Date'])
+    >>> sales_monthly = sales.groupby(['Region', 'Product', pd.Grouper(key='Date', freq='MS')])['Sales'].sum().reset_index()
+    >>> get_trend_outliers_l2(sales_monthly, 'Region', 'Product', 'Sales', levels_l1=['NA'])
+    {'NA': {'n_outliers': 2, 'outlier_levels': ['Food & Beverage', 'Tools'], 'outlier_values': [243302.5, 186765.4], 'outlier_values_p': ['9.92%', '31.87%']}}
+    """
+    if dimension_l1 == dimension_l2:
+        raise ValueError("dimension_l1 and dimension_l2 must be different")
+
+    table = trend_volume(df, dimension=[dimension_l1, dimension_l2], measure=measure, summarization=summarization, context=context, cache=cache)
+
+    parents = table[dimension_l1].astype(str)
+
+    if levels_l1 is not None:
+        table = table[parents.isin(levels_l1)].reset_index(drop=True)
+        parents = parents[parents.isin(levels_l1)].reset_index(drop=True)
+
+    codes, uniques = pd.factorize(parents, sort=True)
+
+    table = table.assign(change=lambda x: x['curr_volume'] - x['prev_volume'])
+    table = table.assign(abs_change=lambda x: x['change'].abs())
+    table = table.assign(share=lambda x: x['abs_change'] / x['abs_change'].groupby(codes).transform("sum"))
+
+    # Biggest changes of every parent level selected at once
+    positions = grouped_top_k_positions(codes, [table['abs_change']], coverage_limit)
+    table = table.iloc[positions].assign(parent=codes[positions])
+    parent = table['parent']
+
+    lag_cum_share = table['share'].groupby(parent).cumsum().groupby(parent).shift(fill_value=0)
+
+    # Parents without any change have undefined shares and no outliers
+    table = table[(lag_cum_share < coverage) & table['share'].notna()]
+
+    n_children = np.bincount(codes, minlength=len(uniques))
+    output = {}
+
+    # Outputs of all parents are formatted at once and sliced by parent
+    outlier_levels = table[dimension_l2].astype(str).values.tolist()
+    outlier_values = table["change"].round(1).values.tolist()
+    outlier_values_p = _change_percentages(table)
+
+    for code, start, end in zip(*group_slices(table["parent"].to_numpy())):
+        if n_children[code] == 1:
+            continue
+
+        output[uniques[code]] = {
+            "n_outliers": int(end - start),
+            "outlier_levels": outlier_levels[start:end],
+            "outlier_values": outlier_values[start:end],
+            "outlier_values_p": outlier_values_p[start:end]
+        }
+
+    if levels_l1 is not None:
+        output = {level: output[level] for level in levels_l1 if level in output}
+
+    return output
+
+
+def get_trend_movers(
+    df,
+    series,
+    measure = None,
+    k = 5,
+    rank = "change",
+    summarization = "sum",
+    context = None,
+    chunk_size = 10000):
+    """
+    Returns the series with the biggest changes between the compared windows, e.g. the top SKUs.
+
+    Built for a large number of series: the rows of the compared windows are pivoted once into
+    dense float32 arrays of series by period, chunk by chunk with `series_matrix`, the current and
+    previous volumes of all series of a chunk are summed with array operations and only the top k
+    candidates of every chunk are kept. The output has the same format as get_trend_outliers,
+    so it can be rendered with the same templates.
+
+    Args:
+    df (pandas.DataFrame): The dataframe to analyze, one row per series and date.
+    series (str): The column identifying the series.
+    measure (str, optional): The measure to use for aggregation. Defaults to the measure of the context.
+    k (int, optional): The number of series to return. Defaults to 5.
+    rank (str, optional): Rank by the absolute change ("change") or by the absolute relative change ("growth"). Defaults to "change".
+    summarization (str, optional): The type of summarization to use (sum, count, or average). Defaults to "sum".
+    context (TrendContext, optional): Precomputed context from get_trend_context, reused across calls. Defaults to None.
+    chunk_size (int, optional): The maximum number of series pivoted at once. Defaults to 10000.
+
+    Returns:
+    dict: A dictionary containing the number of outliers, outlier levels, outlier values, and outlier percentages,
+    or None if no series has a change. Series without previous volume aren't ranked by growth.
+
+    Raises:
+    ValueError: If the summarization parameter is not one of "sum", "count", or "average".
+    ValueError: If the rank parameter is not one of "change" or "growth".
+
+    Examples:
+    >>> get_trend_movers(sales_monthly, 'SKU', 'Sales', k=3, rank='growth')
+    {'n_outliers': 3, 'outlier_levels': ['SKU-00412', 'SKU-91022', 'SKU-07703'], 'outlier_values': [5120.0, 830.5, 1942.1], 'outlier_values_p': ['812.7%', '-97.4%', '455.02%']}
+    """
+    if summarization not in ["sum", "count", "average"]:
+        raise ValueError("summarization must of be one of: 'sum', 'count' or 'average'.")
+
+    if rank not in ["change", "growth"]:
+        raise ValueError("rank must of be one of: 'change' or 'growth'.")
+
+    if context is None:
+        context = get_trend_context(df, measure=measure)
+    else:
+        context.check(df)
+
+        if measure is not None and measure != context.measure:
+            raise ValueError("measure must match the measure of the supplied context")
+
+    if series not in df.columns:
+        raise ValueError("series must a column in the dataset")
+
+    # Only the rows of the compared windows are pivoted
+    rows = context.cy_mask | context.py_mask
+    window = pd.DataFrame({
+        series: df[series].to_numpy()[rows],
+        context.date: df[context.date].to_numpy()[rows],
+        context.measure: df[context.measure].to_numpy()[rows]
+    })
+    curr_dates = pd.unique(window[context.date].to_numpy()[context.cy_mask[rows]])
+    prev_dates = pd.unique(window[context.date].to_numpy()[context.py_mask[rows]])
+
+    def chunks(how):
+        return series_matrix(window, series, context.measure, context.date, how, chunk_size)
+
+    if summarization == "average":
+        matrices = ((levels, periods, values, counts) for (levels, periods, values), (_, _, counts) in zip(chunks("sum"), chunks("count")))
+    else:
+        matrices = ((levels, periods, values, None) for levels, periods, values in chunks(summarization))
+
+    candidates = []
+
+    for levels, periods, values, counts in matrices:
+        curr_cols = periods.isin(curr_dates)
+        prev_cols = periods.isin(prev_dates)
+
+        curr = values[:, curr_cols].sum(axis=1, dtype="float64")
+        prev = values[:, prev_cols].sum(axis=1, dtype="float64")
+
+        if counts is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                curr = curr / counts[:, curr_cols].sum(axis=1, dtype="float64")
+                prev = prev / counts[:, prev_cols].sum(axis=1, dtype="float64")
+
+        curr = curr.round(2)
+        prev = prev.round(2)
+        change = curr - prev
+
+        if rank == "change":
+            score = np.abs(change)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                score = np.where(prev != 0, np.abs(change / prev), np.nan)
+
+        positions = np.sort(top_k_positions([score], k))
+        positions = positions[~np.isnan(score[positions])]
+        candidates.append((levels[positions], curr[positions], prev[positions], score[positions]))
+
+    if not candidates or sum(len(c[0]) for c in candidates) == 0:
+        return None
+
+    # Candidates are in series order, so ties keep the order of the series
+    levels = np.concatenate([np.asarray(c[0], dtype=object) for c in candidates])
+    table = pd.DataFrame({
+        "level": levels,
+        "curr_volume": np.concatenate([c[1] for c in candidates]),
+        "prev_volume": np.concatenate([c[2] for c in candidates])
+    })
+    table = table.iloc[top_k_positions([np.concatenate([c[3] for c in candidates])], k)]
+
+    table = table.assign(change=lambda x: x['curr_volume'] - x['prev_volume'])
+
+    output = {
+        "n_outliers": table.shape[0],
+        "outlier_levels": table["level"].astype(str).values.tolist(),
+        "outlier_values": table["change"].round(1).values.tolist(),
+        "outlier_values_p": _change_percentages(table)
+    }
+
+    return output
+
+
+def _dimension_outliers(
+  dimension,
+  df,
+  dimensions,
+  measure,
+  summarization,
+  coverage,
+  coverage_limit,
+  narration_depth,
+  context,
+  cache
+  ):
+  # Outliers of a dimension and of the other dimensions within its outlying levels,
+  # independent of the other dimensions so that they can be computed in parallel
+  output = get_trend_outliers(
+    df = df,
+    dimension=dimension,
+    measure=measure,
+    summarization = summarization,
+    coverage = coverage,
+    coverage_limit = coverage_limit,
+    context = context,
+    cache = cache
+  )
+
+  outputs_l2 = {}
+
+  if output is None or narration_depth < 2:
+    return output, outputs_l2
+
+  for dimension_l2 in dimensions:
+    if dimension_l2 == dimension:
+      continue
+
+    outputs_l2[dimension_l2] = get_trend_outliers_l2(
+      df = df,
+      dimension_l1 = dimension,
+      dimension_l2 = dimension_l2,
+      measure = measure,
+      levels_l1 = output['outlier_levels'],
+      summarization = summarization,
+      coverage = coverage,
+      coverage_limit = coverage_limit,
+      context = context,
+      cache = cache
+    )
+
+  return output, outputs_l2
+
 def narrate_trend(
   df,
   measure = None,
@@ -125,7 +386,15 @@ def narrate_trend(
   template_outlier_l2 = "In {level_l1}, significant {level_l2} by {measure} change is {outlier_insight}.",
   template_outlier_l2_multiple = "In {level_l1}, significant {pluralize(level_l2)} by {measure} change are {outlier_insight}.",
   return_data = False,
-  simplify = False
+  simplify = False,
+  context = None,
+  cache = None,
+  n_jobs = None,
+  executor = None,
+  comparison = 'ytd',
+  periods = 1,
+  calendar = None,
+  output_format = 'plain'
   ):
   """
   This function generates a narrative report based on a given data frame and parameters.
@@ -168,6 +437,33 @@ def narrate_trend(
   simplify : bool, optional
       If True, the function will return a list of the narrative strings instead of a
       dictionary. Default is False.
+  context : TrendContext, optional
+      Precomputed measure, date, frequency and compared windows from get_trend_context.
+      Build it once to reuse across many narrations of the same data frame. Default is None.
+  cache : AggregationCache, optional
+      Cache of the context and aggregated volumes. Calls on the same data frame that only change
+      coverage, coverage_limit or templates reuse them instead of scanning the data. Default is None.
+  n_jobs : int, optional
+      The number of threads analyzing dimensions in parallel, -1 for all CPUs. The
+      narrative is the same and in the same order as with sequential execution. Default
+      is None, i.e. sequential.
+  executor : concurrent.futures.Executor, optional
+      Executor to analyze dimensions with instead of a thread pool of n_jobs threads.
+      Process pools receive a pickled copy of the data frame for every dimension and an
+      empty copy of the cache. Default is None.
+  comparison : str, {'ytd', 'wow', 'mom', 'qoq', 'rolling'}
+      The compared windows if no context is supplied: year to date, week over week, month
+      over month, quarter over quarter or the last periods of the data frequency against the
+      ones before. Default is 'ytd'.
+  periods : int, optional
+      The number of periods of the data frequency in a rolling window. Default is 1.
+  calendar : FiscalCalendar, optional
+      The fiscal calendar of the compared windows if no context is supplied, e.g. a 4-4-5
+      calendar. Default is None, i.e. calendar years.
+  output_format : str, {'plain', 'html', 'markdown', 'tokens'}
+      The format of the narratives. 'html' and 'markdown' render the structured tokens
+      of a narrative in a single pass, with colored percentages and emphasized levels,
+      'tokens' returns the lists of Token objects. Default is 'plain', i.e. text strings.
       
   Returns:
   --------
@@ -184,10 +480,16 @@ def narrate_trend(
     print('df must be a pandas DataFrame')
     return
   
-  if isinstance(measure, type(None)):
-    measure = df.\
-      select_dtypes(include = 'number').\
-      columns[0]
+  # Resolving date related state once for all dimensions
+  if isinstance(context, type(None)):
+    context = cached(cache, df, ('trend_context', measure, comparison, periods, calendar), lambda: get_trend_context(df, measure = measure, comparison = comparison, periods = periods, calendar = calendar))
+  else:
+    context.check(df)
+
+    if not isinstance(measure, type(None)) and measure != context.measure:
+      raise ValueError("measure must match the measure of the supplied context")
+
+  measure = context.measure
     
   if isinstance(dimensions, type(None)):
     dimensions = df.\
@@ -198,16 +500,33 @@ def narrate_trend(
       
   dimension_one = dimensions[0]
   
-  if summarization == 'sum':
-    total_raw = df[measure].sum().round(2)
-  elif summarization == 'average':
-    total_raw = df[measure].mean().round(2)
-  elif summarization == 'count':
-    total_raw = df[measure].count()
+  total_raw = aggregate_total(df, measure, summarization, cache = cache)
 
   total = total_raw
+
+  # Current and prior year to date totals
+  totals = trend_volume(df, summarization = summarization, context = context, cache = cache)
+  total_curr = totals['curr_volume']
+  total_prev = totals['prev_volume']
+  change = round(total_curr - total_prev, 2)
+  change_p = f"{round(change / total_prev * 100, 2)}%"
+  trend = "increase" if change > 0 else "decrease"
+  timeframe_curr = context.timeframe_curr
+  timeframe_prev = context.timeframe_prev
   
-  narrative_total = eval(f"f'{template_total}'")
+  narrative_total = render_narrative(template_total, {
+    'measure': measure,
+    'dimension_one': dimension_one,
+    'total': total,
+    'total_raw': total_raw,
+    'total_curr': total_curr,
+    'total_prev': total_prev,
+    'change': change,
+    'change_p': change_p,
+    'trend': trend,
+    'timeframe_curr': timeframe_curr,
+    'timeframe_prev': timeframe_prev
+  }, output_format)
   
   narrative = {
     f'Total {measure}': narrative_total
@@ -220,23 +539,41 @@ def narrate_trend(
         'measure': measure,
         'dimension_one': dimension_one,
         'total': total,
-        'total_raw': total_raw
+        'total_raw': total_raw,
+        'total_curr': total_curr,
+        'total_prev': total_prev,
+        'change': change,
+        'change_p': change_p,
+        'trend': trend,
+        'timeframe_curr': timeframe_curr,
+        'timeframe_prev': timeframe_prev
     }
   }
 
-  # High-Level Narrative
-  for dimension in dimensions:
-
-    output = get_trend_outliers(
+  # Outliers of every dimension, in parallel if requested
+  outputs = map_ordered(
+    functools.partial(
+      _dimension_outliers,
       df = df,
-      dimension=dimension,
-      measure=measure,
-      # we need overall total for average only, in other cases it leads to incorrect output
-      total = None if summarization in ["sum", "count"] else total_raw,
+      dimensions = dimensions,
+      measure = measure,
       summarization = summarization,
       coverage = coverage,
-      coverage_limit = coverage_limit
-    )
+      coverage_limit = coverage_limit,
+      narration_depth = narration_depth,
+      context = context,
+      cache = cache
+    ),
+    dimensions,
+    n_jobs = n_jobs,
+    executor = executor
+  )
+
+  # Measure added to the outlier insights of averages
+  average_measure = measure if summarization == 'average' else None
+
+  # High-Level Narrative
+  for dimension, (output, outputs_l2_all) in zip(dimensions, outputs):
 
     if output is None:
         continue
@@ -260,7 +597,15 @@ def narrate_trend(
       template_selected = "single"
 
     narrative_outlier_final = {
-       f'{dimension} by {measure}': eval(f"f'{template_outlier_final}'")
+       f'{dimension} by {measure}': render_narrative(template_outlier_final, {
+          'dimension': dimension,
+          'measure': measure,
+          'outlier_insight': outlier_insight,
+          'n_outliers': n_outliers,
+          'outlier_levels': outlier_levels,
+          'outlier_values': outlier_values,
+          'outlier_values_p': outlier_values_p
+          }, output_format, average_measure)
        }
     
     narrative.update(narrative_outlier_final)
@@ -296,6 +641,53 @@ def narrate_trend(
         }
 
     variables.update(variables_l1)
+
+    # Low-Level Narrative
+    if narration_depth > 1:
+      for dimension_l2 in dimensions:
+        if dimension_l2 == dimension:
+          continue
+
+        outputs_l2 = outputs_l2_all[dimension_l2]
+
+        for level_l1, output_l2 in outputs_l2.items():
+          n_outliers_l2 = output_l2['n_outliers']
+          outlier_levels_l2 = output_l2['outlier_levels']
+          outlier_values_l2 = output_l2['outlier_values']
+          outlier_values_p_l2 = output_l2['outlier_values_p']
+
+          if summarization == 'average':
+            outlier_insight_l2 = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p} vs average {measure})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels_l2, outlier_values_l2, outlier_values_p_l2)])
+          else:
+            outlier_insight_l2 = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p})" for outlier_levels, outlier_values, outlier_values_p in zip(outlier_levels_l2, outlier_values_l2, outlier_values_p_l2)])
+
+          if n_outliers_l2 > 1:
+            template_outlier_l2_final = template_outlier_l2_multiple
+          else:
+            template_outlier_l2_final = template_outlier_l2
+
+          template_variables_l2 = {
+            'level_l1': level_l1,
+            'level_l2': dimension_l2,
+            'dimension_l1': dimension,
+            'dimension_l2': dimension_l2,
+            'measure': measure,
+            'outlier_insight': outlier_insight_l2,
+            'n_outliers': n_outliers_l2,
+            'outlier_levels': outlier_levels_l2,
+            'outlier_values': outlier_values_l2,
+            'outlier_values_p': outlier_values_p_l2
+          }
+
+          narrative_outlier_l2 = render_narrative(template_outlier_l2_final, template_variables_l2, output_format, average_measure)
+
+          narrative[f'{dimension} {level_l1} - {dimension_l2} by {measure}'] = narrative_outlier_l2
+
+          variables[f'{dimension} {level_l1} - {dimension_l2} by {measure}'] = {
+            'narrative_outlier_l2': narrative_outlier_l2,
+            'template_outlier_l2': template_outlier_l2_final,
+            **template_variables_l2
+          }
     
   # Output
   if return_data == True:
@@ -307,6 +699,89 @@ def narrate_trend(
   return(narrative)
 
 
+def narrate_trend_movers(
+  df,
+  series,
+  measure = None,
+  k = 5,
+  rank = 'change',
+  summarization = 'sum',
+  template_outlier = None,
+  template_outlier_multiple = None,
+  context = None,
+  chunk_size = 10000
+  ):
+  """
+  This function narrates the series with the biggest changes, selected with get_trend_movers.
+
+  Parameters:
+  -----------
+  df : pandas.DataFrame
+      The data frame containing the data to analyze, one row per series and date.
+  series : str
+      The name of the variable identifying the series, e.g. a SKU.
+  measure : str or None
+      The name of the numeric variable to analyze. If None, the measure of the context is used.
+  k : int, optional
+      The number of series to narrate. Default is 5.
+  rank : str, {'change', 'growth'}
+      Rank the series by absolute or relative change. Default is 'change'.
+  summarization : str, {'sum', 'count', 'average'}
+      The method to use for summarizing the data. Default is 'sum'.
+  template_outlier : str, optional
+      The template to use for a single series. Defaults to the template of narrate_trend.
+  template_outlier_multiple : str, optional
+      The template to use for multiple series. Defaults to the template of narrate_trend.
+  context : TrendContext, optional
+      Precomputed measure, date, frequency and compared windows from get_trend_context. Default is None.
+  chunk_size : int, optional
+      The maximum number of series pivoted at once, bounding the memory. Default is 10000.
+
+  Returns:
+  --------
+  narrative : dict
+      The narrative of the series keyed like the dimensions of narrate_trend, empty if no series changed.
+
+  Example:
+    from pynarrator import *
+    narrative = narrate_trend_movers(df, series = 'SKU', measure = 'Sales', rank = 'growth')
+  """
+  defaults = inspect.signature(narrate_trend).parameters
+
+  template_outlier = defaults['template_outlier'].default if isinstance(template_outlier, type(None)) else template_outlier
+  template_outlier_multiple = defaults['template_outlier_multiple'].default if isinstance(template_outlier_multiple, type(None)) else template_outlier_multiple
+
+  if isinstance(context, type(None)):
+    context = get_trend_context(df, measure = measure)
+
+  measure = context.measure
+
+  output = get_trend_movers(
+    df,
+    series = series,
+    measure = measure,
+    k = k,
+    rank = rank,
+    summarization = summarization,
+    context = context,
+    chunk_size = chunk_size
+  )
+
+  if isinstance(output, type(None)):
+    return {}
+
+  outlier_insight = ', '.join([f"{outlier_levels} ({outlier_values}, {outlier_values_p})" for outlier_levels, outlier_values, outlier_values_p in zip(output['outlier_levels'], output['outlier_values'], output['outlier_values_p'])])
+
+  return {
+    f'{series} by {measure}': render_template(template_outlier_multiple if output['n_outliers'] > 1 else template_outlier, {
+      'dimension': series,
+      'measure': measure,
+      'outlier_insight': outlier_insight,
+      **output
+    })
+  }
+
+
 """
 from pynarrator.data import read_data
 from pynarrator.narrate_trend import get_trend_outliers
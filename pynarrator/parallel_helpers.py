@@ -0,0 +1,64 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+def resolve_n_jobs(n_jobs):
+    """
+    Resolve the number of workers, negative values count back from the number of CPUs.
+
+    Args:
+    n_jobs (int or None): The number of workers, None or 1 for sequential execution and -1 for all CPUs.
+
+    Returns:
+    int: The number of workers, at least 1.
+
+    Examples:
+    >>> resolve_n_jobs(-1) == os.cpu_count()
+    True
+    """
+    if n_jobs is None:
+        return 1
+
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive integer, -1 or None")
+
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+    return n_jobs
+
+def map_ordered(func, items, n_jobs=None, executor=None):
+    """
+    Apply a function to every item, optionally in parallel.
+
+    Results are always returned in the order of items, regardless of the order in which
+    the workers complete, so the output is deterministic. With an executor the work is
+    submitted to it, otherwise a thread pool of n_jobs workers is used for the call.
+    NumPy and pandas release the GIL in most of their aggregations, so threads share the
+    data frame without copying it. Process pools need a picklable function and pickle
+    its arguments for every item.
+
+    Args:
+    func (callable): The function to apply.
+    items (iterable): The items to apply the function to.
+    n_jobs (int, optional): The number of worker threads, None or 1 for sequential execution and -1 for all CPUs. Defaults to None.
+    executor (concurrent.futures.Executor, optional): Executor to submit the work to, takes precedence over n_jobs. Defaults to None.
+
+    Returns:
+    list: The results in the order of items.
+
+    Examples:
+    >>> map_ordered(len, ['a', 'bb', 'ccc'], n_jobs=2)
+    [1, 2, 3]
+    """
+    items = list(items)
+
+    if executor is not None:
+        return list(executor.map(func, items))
+
+    n_jobs = min(resolve_n_jobs(n_jobs), len(items))
+
+    if n_jobs <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(func, items))
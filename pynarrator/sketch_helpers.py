@@ -0,0 +1,246 @@
+import pandas as pd
+import numpy as np
+
+def hash_values(values):
+    """
+    Hash values to 64 bit integers.
+
+    Numbers are hashed by value, whole floats like 5.0 hash the same as the integer 5,
+    so sketches of chunks where a column became float because of missing values merge
+    with sketches of integer chunks without counting the same values twice.
+
+    Args:
+    values (array-like): Values to hash, missing values should be removed beforehand.
+
+    Returns:
+    numpy.ndarray: Array of uint64 hashes.
+
+    Examples:
+    >>> hash_values(['foo', 'bar', 'foo'])
+    array([3600424527151052760, 1374399572096150070, 3600424527151052760], dtype=uint64)
+    """
+    values = pd.Series(values)
+
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) in ("integer", "floating", "mixed-integer-float", "decimal"):
+        values = values.astype("float64")
+
+    # Integers of every width and sign are hashed as int64
+    if values.dtype.kind == "u" and (values > np.iinfo("int64").max).any():
+        values = values.astype("float64")
+    elif values.dtype.kind in "biu":
+        values = values.astype("int64")
+
+    if values.dtype.kind != "f":
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+    # Whole floats within the int64 range are hashed as integers
+    numbers = values.to_numpy(dtype="float64")
+    whole = np.isfinite(numbers) & (np.floor(numbers) == numbers) & (np.abs(numbers) < 2.0 ** 63)
+    hashes = pd.util.hash_pandas_object(pd.Series(numbers), index=False).to_numpy().copy()
+
+    if whole.any():
+        hashes[whole] = pd.util.hash_pandas_object(pd.Series(numbers[whole].astype("int64")), index=False).to_numpy()
+
+    return hashes
+
+def _bit_length(x):
+    # Exact number of significant bits of uint64 values with a binary search over shifts
+    x = x.copy()
+    length = np.zeros(x.shape, dtype="uint8")
+
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        length[mask] += shift
+        x[mask] >>= np.uint64(shift)
+
+    return length + (x > 0)
+
+# Largest register array built at once, 1 GiB is 262144 groups at the default precision
+REGISTER_BUDGET = 2 ** 30
+
+def hll_registers(codes, n_groups, hashes, precision=12, max_bytes=REGISTER_BUDGET):
+    """
+    Build HyperLogLog registers of every group in one pass.
+
+    The first `precision` bits of a hash select the register, the position of the
+    first set bit in the rest of the hash is the rank kept as the register maximum.
+    Every group takes 2 ** precision bytes, arrays above `max_bytes` are refused
+    instead of exhausting the memory, see hll_group_estimates for estimates of many groups.
+
+    Args:
+    codes (numpy.ndarray): Integer group codes of the hashed values.
+    n_groups (int): The number of groups.
+    hashes (numpy.ndarray): uint64 hashes of the values, see hash_values.
+    precision (int, optional): The number of bits selecting the register, between 4 and 18. Defaults to 12.
+    max_bytes (int, optional): The largest register array to build. Defaults to REGISTER_BUDGET, 1 GiB.
+
+    Returns:
+    numpy.ndarray: uint8 array of shape (n_groups, 2 ** precision).
+
+    Raises:
+    ValueError: If the registers of all groups would take more than max_bytes.
+    """
+    if not 4 <= precision <= 18:
+        raise ValueError("precision must be between 4 and 18")
+
+    if n_groups * 2 ** precision > max_bytes:
+        raise ValueError(
+            f"Registers of {n_groups} groups at precision {precision} need {n_groups * 2 ** precision} bytes, "
+            f"more than the budget of {max_bytes} bytes, use a lower precision or exact counts"
+        )
+
+    bits = np.uint64(64 - precision)
+    index = (hashes >> bits).astype("int64")
+    rest = hashes & ((np.uint64(1) << bits) - np.uint64(1))
+    rank = (np.uint8(bits) - _bit_length(rest) + 1).astype("uint8")
+
+    registers = np.zeros((n_groups, 2 ** precision), dtype="uint8")
+    np.maximum.at(registers, (np.asarray(codes, dtype="int64"), index), rank)
+
+    return registers
+
+def hll_estimate(registers):
+    """
+    Estimate distinct counts from HyperLogLog registers.
+
+    Uses the raw HyperLogLog estimate with linear counting for small cardinalities.
+    The relative standard error is about 1.04 / sqrt(2 ** precision), i.e. 1.6% for the
+    default precision of 12, with a memory of 2 ** precision bytes per group.
+
+    Args:
+    registers (numpy.ndarray): Registers of shape (n_groups, 2 ** precision).
+
+    Returns:
+    numpy.ndarray: Estimated distinct counts of every group.
+    """
+    m = registers.shape[1]
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+
+    raw = alpha * m * m / np.sum(np.exp2(-registers.astype("float64")), axis=1)
+    zeros = np.count_nonzero(registers == 0, axis=1)
+
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+def hll_group_estimates(codes, n_groups, hashes, precision=12, max_bytes=REGISTER_BUDGET):
+    """
+    Estimate distinct counts of every group without keeping the registers of all groups.
+
+    Groups are sketched in chunks whose registers fit in `max_bytes`, so the memory is
+    bounded for dimensions with millions of levels. The estimates are the same as
+    hll_estimate of the registers of all groups.
+
+    Args:
+    codes (numpy.ndarray): Integer group codes of the hashed values.
+    n_groups (int): The number of groups.
+    hashes (numpy.ndarray): uint64 hashes of the values, see hash_values.
+    precision (int, optional): The number of bits selecting the register, between 4 and 18. Defaults to 12.
+    max_bytes (int, optional): The largest register array of a chunk. Defaults to REGISTER_BUDGET, 1 GiB.
+
+    Returns:
+    numpy.ndarray: Estimated distinct counts of every group.
+    """
+    chunk = max(max_bytes // 2 ** precision, 1)
+
+    if n_groups <= chunk:
+        return hll_estimate(hll_registers(codes, n_groups, hashes, precision, max_bytes))
+
+    codes = np.asarray(codes, dtype="int64")
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(0, n_groups + chunk, chunk))
+    estimates = np.empty(n_groups, dtype="float64")
+
+    for start, lo, hi in zip(range(0, n_groups, chunk), bounds[:-1], bounds[1:]):
+        stop = min(start + chunk, n_groups)
+        rows = order[lo:hi]
+        estimates[start:stop] = hll_estimate(hll_registers(codes[rows] - start, stop - start, hashes[rows], precision, max_bytes))
+
+    return estimates
+
+class HyperLogLog:
+    """
+    Mergeable HyperLogLog sketches of distinct counts for a set of group levels.
+
+    The relative standard error of the estimates is about 1.04 / sqrt(2 ** precision),
+    every level keeps 2 ** precision bytes of registers. Sketches built on separate
+    chunks or partitions with the same precision can be merged, the result is the same
+    as a sketch of all the values.
+
+    Args:
+    precision (int, optional): The number of bits selecting the register, between 4 and 18. Defaults to 12.
+
+    Examples:
+    >>> sketch = HyperLogLog.from_frame(df, ['Region'], 'Order ID')
+    >>> sketch.merge(HyperLogLog.from_frame(df_next, ['Region'], 'Order ID'))
+    >>> sketch.estimate()
+    Region
+    ASPAC    1043.0
+    EMEA     2981.0
+    ...
+    """
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        self.precision = precision
+        self.levels = None
+        self.registers = np.zeros((0, 2 ** precision), dtype="uint8")
+
+    @classmethod
+    def from_frame(cls, df, keys, measure, precision=12):
+        """
+        Build sketches of the distinct values of measure by the levels of keys.
+        Rows with missing keys are dropped, same as in groupby.
+        """
+        sketch = cls(precision)
+        keys = list(keys)
+
+        df = df[df[keys].notna().all(axis=1)]
+
+        if len(keys) == 1:
+            codes, levels = pd.factorize(df[keys[0]])
+            levels = pd.Index(levels, name=keys[0])
+        else:
+            codes, levels = pd.MultiIndex.from_frame(df[keys]).factorize()
+            levels = levels.set_names(keys)
+
+        valid = df[measure].notna().to_numpy()
+        sketch.levels = levels
+        sketch.registers = hll_registers(codes[valid], len(levels), hash_values(df[measure].to_numpy()[valid]), precision)
+
+        return sketch
+
+    def merge(self, other):
+        """
+        Merge the registers of another sketch with the same precision.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only sketches with the same precision can be merged")
+
+        if other.levels is None:
+            return self
+
+        if self.levels is None:
+            self.levels, self.registers = other.levels, other.registers.copy()
+            return self
+
+        levels = self.levels.append(other.levels).unique()
+        registers = np.zeros((len(levels), self.registers.shape[1]), dtype="uint8")
+        registers[levels.get_indexer(self.levels)] = self.registers
+        positions = levels.get_indexer(other.levels)
+        registers[positions] = np.maximum(registers[positions], other.registers)
+
+        self.levels, self.registers = levels, registers
+
+        return self
+
+    def estimate(self):
+        """
+        Return the estimated distinct counts as a series indexed by level.
+        """
+        if self.levels is None:
+            return pd.Series(dtype="float64")
+
+        return pd.Series(hll_estimate(self.registers), index=self.levels)
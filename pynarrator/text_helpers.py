@@ -1,5 +1,104 @@
 import re
-import inflect
+import string
+import functools
+import threading
+import numpy as np
+import pandas as pd
+
+_WHITESPACE = re.compile(r'\s+')
+# Single spaces after opening and before closing brackets, commas and periods
+_PUNCTUATION_SPACE = re.compile(r'(?<=\() | (?=[),.])')
+_PERCENT = re.compile(r'(?<=\d)%')
+_WORD = re.compile(r'\w+')
+_NUMBER = re.compile(r'[-+]?\d*\.\d+|\d+')
+
+def _case_pass(words, case):
+    # Replaces the words ignoring case with their lower or upper case version.
+    # Words are merged into one alternation when it matches the same characters
+    # as replacing them one after another, i.e. no word overlaps another one.
+    words = tuple(words)
+
+    if not words:
+        return lambda text: text
+
+    folded = [word.lower() for word in words]
+    overlapping = any(
+        a[-k:] == b[:k]
+        for a in folded
+        for b in folded
+        for k in range(1, min(len(a), len(b)))
+    )
+
+    if overlapping or any('\\' in word or not word.isascii() for word in words):
+        def replace(text):
+            for word in words:
+                text = re.sub(re.escape(word), getattr(word, case)(), text, flags=re.IGNORECASE)
+            return text
+
+        return replace
+
+    # The lookahead on the first characters lets the engine skip most positions quickly
+    ordered = sorted(words, key=len, reverse=True)
+    first = ''.join(sorted({re.escape(word[0]) for word in ordered}))
+    pattern = re.compile(f'(?=[{first}])(?:' + '|'.join(f'({re.escape(word)})' for word in ordered) + ')', flags=re.IGNORECASE)
+    replacements = [None] + [getattr(word, case)() for word in ordered]
+
+    return functools.partial(pattern.sub, lambda match: replacements[match.lastindex])
+
+def _capitalize_sentences(text):
+    # Capitalize the first word of every sentence if its first token isn't UPPER case
+    sentences = text.split('. ')
+
+    for i, sentence in enumerate(sentences):
+        if not all(c.isupper() for c in sentence.split()[0]):
+            word = _WORD.search(sentence)
+
+            if word is not None:
+                sentences[i] = sentence[:word.start()] + word.group(0).capitalize() + sentence[word.end():]
+
+    return '. '.join(sentences)
+
+@functools.lru_cache(maxsize=64)
+def _compile_cleaner(upper, lower):
+    to_lower = _case_pass(lower, 'lower')
+    to_upper = _case_pass(upper, 'upper')
+
+    def clean(text):
+        text_processed = _WHITESPACE.sub(' ', text.strip())
+        text_processed = _PUNCTUATION_SPACE.sub('', text_processed)
+        text_processed = _PERCENT.sub(' %', text_processed)
+        text_processed = _capitalize_sentences(text_processed)
+        text_processed = to_upper(to_lower(text_processed))
+
+        # Replace excessive whitespaces once again - in case if replacement led to multiple spaces
+        return _WHITESPACE.sub(' ', text_processed.strip())
+
+    return clean
+
+def compile_cleaner(
+    upper=['YTD', 'PYTD'],
+    lower=['vs', 'br>', 'h1>', 'h2>', 'h3>', 'h4>', 'h5>', 'h6>', 'b>']
+    ):
+    """
+    Compile Text Cleaner.
+
+    Builds the cleaning function of clean_text for a configuration of upper and lower case
+    words once. The words of each list are replaced in a single pass of one precompiled
+    alternation, and compiled cleaners are cached per configuration.
+
+    Args:
+        upper (List[str], optional): Vector of words that need to be changed to uppercase in text.
+        lower (List[str], optional): Vector of words that need to be changed to lowercase in text.
+
+    Returns:
+        Callable[[str], str]: Function cleaning a text string, same as clean_text.
+
+    Examples:
+        >>> clean = compile_cleaner(upper=['YTD', 'PYTD', 'EMEA'])
+        >>> clean('sales in emea  are up ( 4.3 % vs pytd )')
+        'Sales in EMEA are up (4.3 % vs PYTD)'
+    """
+    return _compile_cleaner(tuple(upper), tuple(lower))
 
 def clean_text(
     text, 
@@ -26,45 +125,46 @@ def clean_text(
         >>> clean_text(' Total  is 12,300 Orders ( 23.5 % for East  ) ')
         'Total is 12,300 Orders (23.5% for East).'
     """
-    # helper to detect the upper case
-    def is_upper(string):
-        return all(c.isupper() for c in string)
-    
-    # assertion
-    text_processed = re.sub(r'\s+', ' ', text.strip())
-    
-    # Clean spaces before commas and after brackets ---------------------------
-    text_processed = re.sub(r'\( ', '(', text_processed)
-    text_processed = re.sub(r' \)', ')', text_processed)
-    text_processed = re.sub(r' ,', ',', text_processed)
-    text_processed = re.sub(r' \.', '.', text_processed)
-    
-    # Add space before percentage ---------------------------------------------
-    text_processed = re.sub(r'(?<=\d)\%', ' %', text_processed)
-    
-    # Capitalize first word ---------------------------------------------------
-    # Split to sentences and capitalize every first word (if it is not UPPER case)
-    sentences = re.split(r'\. ', text_processed)
-    
-    for i in range(len(sentences)):
-        # check for UPPER case
-        if not is_upper(sentences[i].split()[0]):
-            sentences[i] = re.sub(r'\b\w+\b', lambda m: m.group(0).capitalize(), sentences[i], 1)
-    
-    text_processed = '. '.join(sentences)
-    
-    # Replace the pattern Lowercase
-    for pat in lower:
-        text_processed = re.sub(re.escape(pat), pat.lower(), text_processed, flags=re.IGNORECASE)
-    
-    # Replace the pattern Uppercase
-    for pat in upper:
-        text_processed = re.sub(re.escape(pat), pat.upper(), text_processed, flags=re.IGNORECASE)
-    
-    # Replace excessive whitespaces once again - in case if replacement led to multiple spaces
-    text_processed = re.sub(r'\s+', ' ', text_processed.strip())
-    
-    return text_processed
+    return compile_cleaner(upper, lower)(text)
+
+def clean_text_many(
+    texts,
+    upper=['YTD', 'PYTD'],
+    lower=['vs', 'br>', 'h1>', 'h2>', 'h3>', 'h4>', 'h5>', 'h6>', 'b>']
+    ):
+    """
+    Clean Many Text Strings.
+
+    Cleans every text like clean_text with one compiled cleaner. Repeated texts are
+    cleaned once, which is common for narratives rendered from the same templates.
+
+    Args:
+        texts (List[str] or pandas.Series): Text strings for cleaning.
+        upper (List[str], optional): Vector of words that need to be changed to uppercase in text.
+        lower (List[str], optional): Vector of words that need to be changed to lowercase in text.
+
+    Returns:
+        List[str] or pandas.Series: Cleaned text strings, a series with the same index for a series.
+        Missing values of a series stay missing.
+
+    Examples:
+        >>> clean_text_many(['total  is 12,300 ( 23.5 % for East )', 'ytd vs pytd'])
+        ['Total is 12,300 (23.5 % for East)', 'YTD vs PYTD']
+    """
+    clean = compile_cleaner(upper, lower)
+
+    if isinstance(texts, pd.Series):
+        codes, uniques = pd.factorize(texts)
+        cleaned = np.array([clean(text) for text in uniques] + [np.nan], dtype=object)
+
+        return pd.Series(cleaned[codes], index=texts.index, name=texts.name)
+
+    if not isinstance(texts, (list, tuple)):
+        raise ValueError('Provide list of text strings or pandas Series')
+
+    memo = {}
+
+    return [memo[text] if text in memo else memo.setdefault(text, clean(text)) for text in texts]
 
 def format_text(
         text, 
@@ -95,15 +195,9 @@ def format_text(
     text = re.sub('  ', ' ', text)
 
     # automatic color will, if string contains a number
-    if color == 'auto' and any(char.isdigit() for char in text):
-        if float(re.findall(r'[-+]?\d*\.\d+|\d+', text)[0]) < 0:
-            color = 'red'
-        elif float(re.findall(r'[-+]?\d*\.\d+|\d+', text)[0]) > 0:
-            color = 'green'
-        else:
-            color = 'black'
-    elif color == 'auto' and not any(char.isdigit() for char in text):
-        color = 'black'
+    if color == 'auto':
+        number = _NUMBER.search(text)
+        color = 'black' if number is None else color_classes(float(number.group(0)), 'green', 'red', 'black')
 
     # bold text
     if bold:
@@ -113,6 +207,167 @@ def format_text(
 
     return text_processed
 
+_COMPACT_SUFFIXES = np.array(['', 'K', 'M', 'B', 'T'])
+
+def _group_thousands(text, values):
+    # Inserts thousands separators into the integer part of fixed notation numbers
+    negative = np.char.startswith(text, '-')
+    parts = np.char.partition(np.char.lstrip(text, '-'), '.')
+    grouped = np.isfinite(values) & (np.abs(values) < 1e18) & (np.char.find(text, 'e') < 0)
+    integers = np.where(grouped, np.char.str_len(parts[..., 0]) > 0, False)
+    remaining = np.zeros(text.shape, dtype=np.int64)
+    remaining[integers] = parts[..., 0][integers].astype(np.int64)
+
+    head = (remaining % 1000).astype(str)
+    remaining //= 1000
+
+    while (remaining > 0).any():
+        head = np.where(remaining > 0, np.char.add(np.char.add((remaining % 1000).astype(str), ','), np.char.zfill(head, 3)), head)
+        remaining //= 1000
+
+    head = np.where(integers, head, parts[..., 0])
+    text = np.char.add(np.char.add(head, parts[..., 1]), parts[..., 2])
+
+    return np.where(negative, np.char.add('-', text), text)
+
+def format_numbers(
+        values,
+        decimals = None,
+        thousands = False,
+        compact = False,
+        sign = False,
+        suffix = ''):
+    """
+    Format Numbers
+    Formats a whole array of numbers in one call, without a Python loop over the values.
+
+    Parameters
+    ----------
+    values : array-like
+        Numbers to format, e.g. a NumPy array or pandas Series.
+    decimals : int, optional
+        Number of fixed decimals. Default is None, the shortest text of every number like str(),
+        or 1 decimal for compact numbers.
+    thousands : bool, optional
+        Separate thousands with commas. Default is False.
+    compact : bool, optional
+        Shorten numbers with K, M, B and T suffixes, e.g. 1.2K or 3.4M. Default is False.
+    sign : bool, optional
+        Add a plus sign to positive numbers. Default is False.
+    suffix : str, optional
+        Text added to every number, e.g. '%'. Default is ''.
+
+    Returns
+    -------
+    numpy.ndarray: formatted numbers, missing and infinite values are formatted as 'nan' and 'inf'
+
+    Examples
+    --------
+    >>> format_numbers([1234.5, -0.25], decimals = 1, thousands = True)
+    array(['1,234.5', '-0.2'], dtype='<U36')
+    >>> format_numbers([1234.5, 3400000], compact = True)
+    array(['1.2K', '3.4M'], dtype='<U5')
+    """
+    values = np.asarray(values)
+
+    if values.dtype.kind not in 'iuf':
+        values = values.astype(float)
+
+    suffixes = np.full(values.shape, '', dtype='<U1')
+
+    if compact:
+        decimals = 1 if decimals is None else decimals
+        values = values.astype(float)
+        magnitude = np.abs(np.nan_to_num(values))
+        units = np.minimum(np.floor(np.log10(np.maximum(magnitude, 1)) / 3), 4).astype(int)
+
+        # Rounding can carry into the next unit, e.g. 999.96K to 1.0M
+        carry = (np.abs(np.round(magnitude / 1000.0 ** units, decimals)) >= 1000) & (units < 4)
+        units = units + carry
+
+        values = values / 1000.0 ** units
+        suffixes = _COMPACT_SUFFIXES[units]
+
+    if decimals is None:
+        text = values.astype(str)
+    else:
+        text = np.char.mod(f'%.{decimals}f', values)
+
+    if thousands and text.size:
+        text = _group_thousands(text, values.astype(float))
+
+    if sign:
+        text = np.where(values > 0, np.char.add('+', text), text)
+
+    return np.char.add(np.char.add(text, suffixes), suffix)
+
+def format_percentages(
+        values,
+        decimals = None,
+        sign = False):
+    """
+    Format Percentages
+    Formats a whole array of percentages in one call, see format_numbers.
+
+    Parameters
+    ----------
+    values : array-like
+        Percentages to format, e.g. 52.0 for 52%.
+    decimals : int, optional
+        Number of fixed decimals. Default is None, the shortest text of every number like str().
+    sign : bool, optional
+        Add a plus sign to positive percentages. Default is False.
+
+    Returns
+    -------
+    numpy.ndarray: formatted percentages
+
+    Examples
+    --------
+    >>> format_percentages([28.999999999999996, -4.5], decimals = 1, sign = True)
+    array(['+29.0%', '-4.5%'], dtype='<U7')
+    """
+    return format_numbers(values, decimals = decimals, sign = sign, suffix = '%')
+
+def color_classes(
+        values,
+        positive = 'green',
+        negative = 'red',
+        neutral = None):
+    """
+    Color Classes
+    Picks the color of every number at once, e.g. to color formatted percentages.
+
+    Parameters
+    ----------
+    values : float or array-like
+        Numbers deciding the colors.
+    positive : str, optional
+        Color of positive numbers. Default is 'green'.
+    negative : str, optional
+        Color of negative numbers. Default is 'red'.
+    neutral : str, optional
+        Color of zeros and missing values. Default is None, i.e. the positive color for zeros
+        and no color for missing values.
+
+    Returns
+    -------
+    str or numpy.ndarray: color of every number, a single color for a single number
+
+    Examples
+    --------
+    >>> color_classes([5.2, -1.0, 0.0])
+    array(['green', 'red', 'green'], dtype=object)
+    """
+    numbers = np.asarray(values, dtype=float)
+    zero = positive if neutral is None else neutral
+    colors = np.select([numbers > 0, numbers < 0, numbers == 0], [positive, negative, zero], default=neutral).astype(object)
+
+    return colors if numbers.ndim else colors.item()
+
+_PCT_PUNCTUATION = re.compile(r'(?![.%-//)//://(])[\[:punct:]]')
+_NOT_NUMBER = re.compile(r'[^\d.-]')
+
 def format_pct(
         text, 
         positive = 'green', 
@@ -149,25 +404,192 @@ def format_pct(
         text = [text]
 
     # Replace excessive punctuation
-    text = [re.sub(' %', '%', t) for t in text]
-    text = [re.sub(r'\(', ' (', t) for t in text]
-    text = [re.sub(r'\)', ') ', t) for t in text]
-    text = [re.sub(r'(?![.%-//)//://(])[[:punct:]]', '', t) for t in text]
-
-    # Looping through the vector/list of narrations
-    for i, t in enumerate(text):
-        t_list = t.split()
-        num_value = float(re.sub(r'[^\d.-]', '', t_list[0])) if '%' in t_list[0] else None
-        t_list[0] = format_text(t_list[0], color=positive) if num_value is not None and num_value >= 0 else format_text(t_list[0], color=negative) if num_value is not None and num_value < 0 else t_list[0]
+    text = [_PCT_PUNCTUATION.sub('', t.replace(' %', '%').replace('(', ' (').replace(')', ') ')) for t in text]
+    words = [t.split() for t in text]
+
+    # Colors of the leading percentages of all narrations at once
+    numbers = [float(_NOT_NUMBER.sub('', w[0])) if '%' in w[0] else np.nan for w in words]
+    colors = color_classes(numbers, positive, negative)
+
+    for i, (t_list, color) in enumerate(zip(words, colors)):
+        if color is not None:
+            t_list[0] = format_text(t_list[0], color=color)
         text[i] = ' '.join(t_list)
 
     text_output = [clean_text(t) for t in text] if isinstance(text, list) else clean_text(text)
     return text_output
 
+# Plurals used before inflect, e.g. loaded from a file for offline use without inflect
+PLURALS = {}
+
+_ENGINE = None
+_ENGINE_LOCK = threading.Lock()
+
+def _inflect_engine():
+    # The engine is created once on first use, importing inflect only then
+    global _ENGINE
+
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                try:
+                    import inflect
+                except ImportError as e:
+                    raise ImportError("inflect is required to pluralize words missing from PLURALS, see register_plurals") from e
+
+                _ENGINE = inflect.engine()
+
+    return _ENGINE
+
+@functools.lru_cache(maxsize=4096)
+def _inflect_plural(word):
+    return _inflect_engine().plural(word)
+
 def pluralize(word):
-  engine = inflect.engine()
-  plural = engine.plural(word)
-  return(plural)
+    """
+    Return the plural of a word, e.g. 'Region' to 'Regions'.
+
+    Words registered in PLURALS are returned without inflect, other words are
+    pluralized by one shared inflect engine created on first use and their plurals
+    are kept in a bounded cache, so repeated dimension names cost a dictionary lookup.
+
+    :param word: The word to pluralize.
+    :return: The plural of the word.
+    """
+    plural = PLURALS.get(word)
+
+    if plural is None:
+        plural = _inflect_plural(word)
+
+    return plural
+
+def precompute_plurals(words):
+    """
+    Return the plurals of the words as a dictionary, e.g. to store them for register_plurals.
+
+    :param words: The words to pluralize, e.g. the dimension names of a dataset.
+    :return: A dictionary of the words and their plurals.
+    """
+    return {word: pluralize(word) for word in words}
+
+def register_plurals(plurals):
+    """
+    Add plurals to PLURALS, they are used by pluralize before inflect.
+
+    With the plurals of all dimension names registered, the narratives don't need
+    inflect at all.
+
+    :param plurals: A dictionary of words and their plurals.
+    """
+    if not isinstance(plurals, dict):
+        raise ValueError("plurals must be a dictionary")
+
+    PLURALS.update(plurals)
+
+# Functions that can be called inside of the narrative templates
+TEMPLATE_FUNCTIONS = {
+    'pluralize': pluralize
+}
+
+_TEMPLATE_CALL = re.compile(r'^\s*([A-Za-z_]\w*)\s*\(\s*([A-Za-z_]\w*)\s*\)\s*$')
+_TEMPLATE_NAME = re.compile(r'^\s*([A-Za-z_]\w*)\s*$')
+_TEMPLATE_CONVERSIONS = {None: lambda x: x, 's': str, 'r': repr, 'a': ascii}
+
+@functools.lru_cache(maxsize=256)
+def compile_template(template):
+    """
+    Compile Narrative Template
+
+    Parses the template once into a render plan. Fields can be variable names
+    like {measure} or calls of TEMPLATE_FUNCTIONS like {pluralize(dimension)},
+    optionally followed by a conversion and a format spec like {total:,.2f}.
+    Compiled plans are cached by template string.
+
+    :param template: Template string
+    :type template: str
+
+    :return: Tuple of (literal text, field name, function, conversion, format spec) steps
+    :rtype: tuple
+
+    :raises ValueError: If the template is not a string or contains unsupported expressions
+
+    :seealso: `render_template()` function for rendering templates
+
+    :examples:
+    >>> compile_template('Outlying {pluralize(dimension)} are {outlier_insight}.')
+    (('Outlying ', 'dimension', 'pluralize', None, ''), (' are ', 'outlier_insight', None, None, ''), ('.', None, None, None, ''))
+    """
+    if not isinstance(template, str):
+        raise ValueError('Provide template string')
+
+    plan = []
+
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is None:
+            plan.append((literal, None, None, None, ''))
+            continue
+
+        call = _TEMPLATE_CALL.match(field)
+        name = _TEMPLATE_NAME.match(field)
+
+        if call is not None:
+            function, field = call.groups()
+
+            if function not in TEMPLATE_FUNCTIONS:
+                raise ValueError(f"Function '{function}' is not supported in templates")
+        elif name is not None:
+            function, field = None, name.group(1)
+        else:
+            raise ValueError(f"Unsupported template expression '{{{field}}}'")
+
+        if '{' in (spec or ''):
+            raise ValueError("Nested format specs are not supported in templates")
+
+        plan.append((literal, field, function, conversion, spec or ''))
+
+    return tuple(plan)
+
+def render_template(template, variables):
+    """
+    Render Narrative Template
+
+    Substitutes variables into a template compiled with `compile_template()`.
+
+    :param template: Template string
+    :type template: str
+
+    :param variables: Values of the variables used in the template
+    :type variables: dict
+
+    :return: Rendered text
+    :rtype: str
+
+    :raises ValueError: If a variable used in the template is not supplied
+
+    :examples:
+    >>> render_template('Total {measure} across all {pluralize(dimension)} is {total}.',
+    ...                 {'measure': 'Sales', 'dimension': 'Region', 'total': 125})
+    'Total Sales across all Regions is 125.'
+    """
+    parts = []
+
+    for literal, field, function, conversion, spec in compile_template(template):
+        parts.append(literal)
+
+        if field is None:
+            continue
+
+        try:
+            value = variables[field]
+        except KeyError:
+            raise ValueError(f"Variable '{field}' used in the template is not available") from None
+
+        if function is not None:
+            value = TEMPLATE_FUNCTIONS[function](value)
+
+        parts.append(format(_TEMPLATE_CONVERSIONS[conversion](value), spec))
+
+    return ''.join(parts)
 
 def clean_tags(html_string):
     """
@@ -0,0 +1,247 @@
+import html
+import math
+from dataclasses import dataclass
+from typing import Optional
+from pynarrator.text_helpers import TEMPLATE_FUNCTIONS, compile_template, render_template, _TEMPLATE_CONVERSIONS
+
+TOKEN_KINDS = ["text", "measure", "level", "value", "percentage"]
+
+OUTPUT_FORMATS = ["plain", "html", "markdown", "tokens"]
+
+# Kinds of the variables of the narrative templates, other variables are text
+TEMPLATE_KINDS = {
+    "measure": "measure",
+    "level_l1": "level",
+    "total": "value",
+    "total_raw": "value",
+    "total_curr": "value",
+    "total_prev": "value",
+    "change": "value",
+    "change_p": "percentage"
+}
+
+@dataclass(frozen=True)
+class Token:
+    """
+    A piece of a narrative with its kind and numeric payload.
+
+    Narratives rendered to tokens keep the numbers they were formatted from, so the
+    renderers color or emphasize them without parsing the text again.
+
+    Args:
+    kind (str): One of 'text', 'measure', 'level', 'value' or 'percentage'.
+    text (str): The text of the token in a plain narrative.
+    value (float, optional): The number of value and percentage tokens, e.g. 52.0 for '52.0%'. Defaults to None.
+
+    Examples:
+    >>> Token("percentage", "52.0%", 52.0)
+    Token(kind='percentage', text='52.0%', value=52.0)
+    """
+    kind: str
+    text: str
+    value: Optional[float] = None
+
+def _number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.rstrip("%"))
+        except ValueError:
+            return None
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def outlier_tokens(levels, values, values_p, measure=None):
+    """
+    Return the tokens of an outlier insight like 'East (55, 52.0%), West (40, 38.1%)'.
+
+    Args:
+    levels (list): The outlier levels.
+    values (list): The outlier values.
+    values_p (list): The outlier percentages as text, e.g. '52.0%'.
+    measure (str, optional): The measure of an average summarization, added as ' vs average {measure}'. Defaults to None.
+
+    Returns:
+    list: The tokens, rendered to plain text they are the same as the outlier_insight of the narratives.
+    """
+    tokens = []
+
+    for i, (level, value, value_p) in enumerate(zip(levels, values, values_p)):
+        if i > 0:
+            tokens.append(Token("text", ", "))
+
+        tokens.append(Token("level", str(level)))
+        tokens.append(Token("text", " ("))
+        tokens.append(Token("value", str(value), _number(value)))
+        tokens.append(Token("text", ", "))
+        tokens.append(Token("percentage", str(value_p), _number(value_p)))
+
+        if measure is not None:
+            tokens.append(Token("text", " vs average "))
+            tokens.append(Token("measure", str(measure)))
+
+        tokens.append(Token("text", ")"))
+
+    return tokens
+
+def template_tokens(template, variables, kinds=None):
+    """
+    Render a narrative template to tokens instead of text.
+
+    Literal parts of the template are text tokens and every variable is a token of its
+    kind in `kinds`, by default TEMPLATE_KINDS. Variables whose value is a list of tokens,
+    e.g. from outlier_tokens, are inserted as they are.
+
+    Args:
+    template (str): Template string, see compile_template.
+    variables (dict): Values of the variables used in the template.
+    kinds (dict, optional): Kinds of the variables. Defaults to None, i.e. TEMPLATE_KINDS.
+
+    Returns:
+    list: The tokens, rendered to plain text they are the same as render_template.
+
+    Examples:
+    >>> template_tokens('Total {measure} is {total}.', {'measure': 'Sales', 'total': 125})
+    [Token(kind='text', text='Total ', value=None), Token(kind='measure', text='Sales', value=None), ...]
+    """
+    kinds = TEMPLATE_KINDS if kinds is None else kinds
+    tokens = []
+
+    for literal, field, function, conversion, spec in compile_template(template):
+        if literal:
+            tokens.append(Token("text", literal))
+
+        if field is None:
+            continue
+
+        try:
+            value = variables[field]
+        except KeyError:
+            raise ValueError(f"Variable '{field}' used in the template is not available") from None
+
+        if isinstance(value, list) and all(isinstance(token, Token) for token in value):
+            tokens.extend(value)
+            continue
+
+        if function is not None:
+            value = TEMPLATE_FUNCTIONS[function](value)
+
+        kind = kinds.get(field, "text")
+        text = format(_TEMPLATE_CONVERSIONS[conversion](value), spec)
+        number = _number(value) if kind in ("value", "percentage") else None
+
+        tokens.append(Token(kind, text, number))
+
+    return tokens
+
+def render_plain(tokens):
+    """
+    Render tokens to plain text.
+    """
+    return "".join(token.text for token in tokens)
+
+def render_html(tokens, positive="green", negative="red", bold=("level",)):
+    """
+    Render tokens to HTML.
+
+    Text is escaped, percentages are colored like format_pct and the tokens of the
+    kinds in `bold` are wrapped in <b> tags.
+
+    Args:
+    tokens (list): The tokens to render.
+    positive (str, optional): Color of positive percentages. Defaults to 'green'.
+    negative (str, optional): Color of negative percentages. Defaults to 'red'.
+    bold (tuple, optional): Kinds of the tokens in bold. Defaults to ('level',).
+
+    Returns:
+    str: The HTML text.
+    """
+    parts = []
+
+    for token in tokens:
+        text = html.escape(token.text, quote=False)
+
+        if token.kind == "percentage" and token.value is not None and not math.isnan(token.value):
+            text = f"<span style='color: {positive if token.value >= 0 else negative};'>{text}</span>"
+
+        if token.kind in bold:
+            text = f"<b>{text}</b>"
+
+        parts.append(text)
+
+    return "".join(parts)
+
+_MARKDOWN_SPECIAL = str.maketrans({c: "\\" + c for c in "\\`*_[]<>#|"})
+
+def render_markdown(tokens, bold=("level", "percentage")):
+    """
+    Render tokens to Markdown.
+
+    Markdown characters of the text are escaped and the tokens of the kinds in `bold`
+    are emphasized with **.
+
+    Args:
+    tokens (list): The tokens to render.
+    bold (tuple, optional): Kinds of the tokens in bold. Defaults to ('level', 'percentage').
+
+    Returns:
+    str: The Markdown text.
+    """
+    parts = []
+
+    for token in tokens:
+        text = token.text.translate(_MARKDOWN_SPECIAL)
+        parts.append(f"**{text}**" if token.kind in bold and text.strip() else text)
+
+    return "".join(parts)
+
+RENDERERS = {
+    "plain": render_plain,
+    "html": render_html,
+    "markdown": render_markdown
+}
+
+def render_narrative(template, variables, output_format="plain", average_measure=None):
+    """
+    Render a narrative template in an output format of the narrate functions.
+
+    Plain narratives are rendered with render_template directly. For the other formats
+    the template is rendered to tokens, with the outlier insight built from the
+    outlier_levels, outlier_values and outlier_values_p variables when they are given,
+    and the tokens are rendered in a single pass.
+
+    Args:
+    template (str): Template string, see compile_template.
+    variables (dict): Values of the variables used in the template.
+    output_format (str, optional): One of 'plain', 'html', 'markdown' or 'tokens'. Defaults to 'plain'.
+    average_measure (str, optional): The measure of an average summarization, see outlier_tokens. Defaults to None.
+
+    Returns:
+    str or list: The narrative, a list of tokens for 'tokens'.
+    """
+    if output_format == "plain":
+        return render_template(template, variables)
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must of be one of: {', '.join(OUTPUT_FORMATS)}")
+
+    if "outlier_levels" in variables:
+        variables = {
+            **variables,
+            "outlier_insight": outlier_tokens(
+                variables["outlier_levels"],
+                variables["outlier_values"],
+                variables["outlier_values_p"],
+                average_measure
+            )
+        }
+
+    tokens = template_tokens(template, variables)
+
+    return tokens if output_format == "tokens" else RENDERERS[output_format](tokens)
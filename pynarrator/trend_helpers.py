@@ -1,18 +1,32 @@
 import pandas as pd
 import numpy as np
 import datetime as dt
+import weakref
+from dataclasses import dataclass, field
 from typing import Optional
+from pynarrator.cache_helpers import cached
 
-def get_frequency(df, date_field=None):
+_frequency_memo = {}
+
+def _forget_frequency(key):
+    _frequency_memo.pop(key, None)
+
+def get_frequency(df, date_field=None, sample_size=None):
     """
     Get Date Frequency of the Data
 
-    Function will group the data and estimate the frequency of the time stamps,
-    returning 'year', 'quarter', 'month', 'week' or 'day'. You can use it on raw or aggregated data frames
+    Function will estimate the frequency of the time stamps from the most common gap in days
+    between the unique sorted dates, returning 'year', 'quarter', 'month', 'week' or 'day'.
+    Repeated dates of several series in a long frame don't affect the estimate, so you can use
+    it on raw or aggregated data frames. The result is memoized per data frame and column, so
+    repeated calls on the same frame only checksum the dates instead of sorting them again.
 
     Args:
         df (pandas.DataFrame): Data frame of tibble, can be aggregated or raw
         date_field (str): Date field to be analyzed, by default the first date-like column will be used
+        sample_size (int): Estimate the frequency on the gaps between the latest sample_size unique
+            dates, by default the gaps between all unique dates are used. The unique dates are always
+            taken from all rows, sampled rows would leave gaps between the dates and stretch them.
 
     Returns:
         str: frequency - 'quarter', 'month', 'week' or 'day'
@@ -22,9 +36,10 @@ def get_frequency(df, date_field=None):
         >>> sales['Date'] = pd.to_datetime(sales['Date'])
         >>> sales_monthly = sales.groupby(['Region', pd.Grouper(key='Date', freq='MS')])['Sales'].sum().reset_index()
         >>> get_frequency(sales_monthly)
-        
+        'month'
         >>> sales_weekly = sales.groupby(['Region', pd.Grouper(key='Date', freq=pd.offsets.Week(weekday=0))])['Sales'].sum().reset_index()
         >>> get_frequency(sales_weekly)
+        'week'
     """
     
     if not isinstance(df, pd.DataFrame):
@@ -34,9 +49,9 @@ def get_frequency(df, date_field=None):
         raise ValueError("'df' must have at least 1 row")
         
     if date_field is None:
-        date_fields = df.select_dtypes(include=[np.datetime64]).columns if not df.select_dtypes(include=[np.datetime64]).columns.empty else None
+        date_fields = df.select_dtypes(include=["datetime", "datetimetz"]).columns
         
-        if date_fields is None:
+        if date_fields.empty:
             raise ValueError("No date field detected in 'df'")
         elif len(date_fields) > 1:
             raise ValueError("Multiple date fields detected in 'df', please specify 'date_field'")
@@ -45,12 +60,36 @@ def get_frequency(df, date_field=None):
     else:
         if date_field not in df.columns:
             raise ValueError("'date_field' must be present in the supplied data frame")
-        elif not np.issubdtype(df[date_field].dtype, np.datetime64):
+        elif not pd.api.types.is_datetime64_any_dtype(df[date_field]):
             raise ValueError("'date_field' must be of datetime type")
-            
-    df = df.rename(columns={date_field: "date_field"})
-    
-    est_frequency = df["date_field"].diff().dt.days.abs().value_counts().idxmax()
+
+    dates = df[date_field]
+
+    # Memoized per frame and column. The version is taken from the stored column: a replaced
+    # column has a different buffer and the checksum of the timestamps catches in-place edits,
+    # reordering the same dates keeps the checksum but also the frequency
+    stamps = dates.array.asi8
+    key = (id(df), date_field, sample_size)
+    version = (stamps.__array_interface__["data"][0], len(stamps), str(dates.dtype), int(stamps.sum()))
+    memo = _frequency_memo.get(key)
+
+    if memo is not None and memo[0] == version:
+        return memo[1]
+
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+
+    dates = dates.to_numpy()
+
+    # Unique sorted days as integers
+    days = dates.astype("datetime64[D]").view("int64")
+    days = np.sort(pd.unique(days[days != np.iinfo("int64").min]))
+
+    # A contiguous run of the unique days keeps the gaps between them
+    if sample_size is not None and len(days) > sample_size:
+        days = days[-sample_size:]
+
+    est_frequency = np.bincount(np.diff(days)).argmax() if len(days) > 1 else 0
     
     if est_frequency > 300:
         frequency = "year"
@@ -62,10 +101,15 @@ def get_frequency(df, date_field=None):
         frequency = "week"
     else:
         frequency = "day"
+
+    if key not in _frequency_memo:
+        weakref.finalize(df, _forget_frequency, key)
+
+    _frequency_memo[key] = (version, frequency)
     
     return frequency
 
-def get_py_date(df: pd.DataFrame, frequency: Optional[str] = None):
+def get_py_date(df: pd.DataFrame, frequency: Optional[str] = None, calendar = None):
     """
     Calculate the prior year date based on the maximum date in the DataFrame and the given frequency.
 
@@ -76,6 +120,9 @@ def get_py_date(df: pd.DataFrame, frequency: Optional[str] = None):
     frequency : str, optional
         Date frequency to use for the calculation, by default None.
         If not provided, the frequency will be inferred from the DataFrame.
+    calendar : FiscalCalendar, optional
+        Fiscal calendar, by default None, i.e. calendar years.
+        If provided, the same day of the previous fiscal year is returned.
 
     Examples
     --------
@@ -101,11 +148,15 @@ def get_py_date(df: pd.DataFrame, frequency: Optional[str] = None):
     if date_field is None:
         raise ValueError("Data frame must contain one date column")
 
+    max_date = df[date_field].max()
+
+    if calendar is not None:
+        return calendar.previous(max_date, "year").date()
+
     # Calculating frequency if not available
     if frequency is None:
         frequency = get_frequency(df)
 
-    max_date = df[date_field].max()
     max_year = max_date.year
 
     if frequency == "week":
@@ -132,13 +183,133 @@ def get_py_date(df: pd.DataFrame, frequency: Optional[str] = None):
     return py_date.date()
 
 
+def sort_by_date(df, date=None):
+    """
+    Sort a data frame by date once for the sorted date mode of the trend functions.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input pandas DataFrame containing the data to be analyzed.
+    date : str, optional
+        Column name of the date, by default the first datetime column.
+
+    Examples
+    --------
+    >>> df = sort_by_date(df)
+    >>> context = get_trend_context(df, sorted_dates=True)
+    >>> ytd_volume(df, sorted_dates=True)
+
+    Returns
+    -------
+    pd.DataFrame
+        A new pandas DataFrame sorted by date with a stable sort and a default index.
+    """
+    if date is None:
+        date_fields = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+
+        if date_fields.empty:
+            raise ValueError("No date column found in the dataset")
+
+        date = date_fields[0]
+
+    return df.sort_values(by=date, kind="stable", ignore_index=True)
+
+
+COMPARISONS = ["ytd", "wow", "mom", "qoq", "rolling"]
+
+# Calendar period compared by every period over period comparison
+_COMPARISON_GRAINS = {"ytd": "year", "wow": "week", "mom": "month", "qoq": "quarter"}
+
+
+def _period_offset(grain, periods=1):
+    # Calendar offset of a number of periods of a grain
+    if grain == "quarter":
+        return pd.DateOffset(months=3 * periods)
+
+    return pd.DateOffset(**{f"{grain}s": periods})
+
+
+def _period_start(cut_off, grain):
+    # Midnight of the first day of the calendar period, weeks start on Monday
+    day = cut_off.normalize()
+
+    if grain == "day":
+        return day
+    if grain == "week":
+        return day - pd.Timedelta(days=day.dayofweek)
+    if grain == "month":
+        return day.replace(day=1)
+    if grain == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+
+    return day.replace(month=1, day=1)
+
+
+def _year_window(year, cut_off):
+    # Rows of the year up to the cut-off date as (start, stop, include start)
+    cut_off = pd.Timestamp(cut_off)
+    start = cut_off.normalize().replace(year=year, month=1, day=1)
+
+    return start, min(cut_off, start + pd.DateOffset(years=1) - pd.Timedelta(1, "ns")), True
+
+
+def _comparison_window(comparison, cut_off, frequency, periods, calendar=None):
+    # Window of a comparison ending at the cut-off date as (start, stop, include start)
+    if comparison == "rolling":
+        return cut_off - _period_offset(frequency, periods), cut_off, False
+
+    if calendar is not None:
+        return calendar.period_start(cut_off, _COMPARISON_GRAINS[comparison]), cut_off, True
+
+    if comparison == "ytd":
+        return _year_window(cut_off.year, cut_off)
+
+    return _period_start(cut_off, _COMPARISON_GRAINS[comparison]), cut_off, True
+
+
+def _timeframe(comparison, cut_off, frequency, periods, calendar=None):
+    # Label of the window ending at the cut-off date used in the narrative
+    if calendar is not None and comparison != "rolling":
+        label = calendar.label(cut_off, _COMPARISON_GRAINS[comparison])
+        return f"{label} YTD" if comparison == "ytd" else label
+    if comparison == "ytd":
+        return f"{cut_off.year} YTD"
+    if comparison == "wow":
+        year, week, _ = cut_off.isocalendar()
+        return f"{year} W{week:02d}"
+    if comparison == "mom":
+        return cut_off.strftime("%b %Y")
+    if comparison == "qoq":
+        return f"{cut_off.year} Q{cut_off.quarter}"
+
+    return f"{periods} {frequency}{'s' if periods > 1 else ''} to {cut_off.strftime('%Y-%m-%d')}"
+
+
+def _window_mask(dates, window):
+    start, stop, include_start = window
+    after = dates >= start if include_start else dates > start
+
+    return (after & (dates <= stop)).to_numpy()
+
+
+def _window_slice(dates, window):
+    # Rows of the window located with binary search in sorted dates
+    start, stop, include_start = window
+    first = dates.searchsorted(start, side="left" if include_start else "right")
+    last = dates.searchsorted(stop, side="right")
+
+    return slice(int(first), int(max(first, last)))
+
+
 def ytd_volume(
         df, 
         measure = None, 
         date = None, 
         summarization = "sum", 
         current_year = None, 
-        cy_date = None):
+        cy_date = None,
+        sorted_dates = False):
     """
     Calculate the year-to-date (YTD) volume of a given measure in a pandas DataFrame.
 
@@ -161,6 +332,10 @@ def ytd_volume(
     cy_date : datetime, optional
         Date to use for the YTD calculation, by default None.
         If not provided, the current date will be used.
+    sorted_dates : bool, optional
+        If True, `df` must be sorted by date, e.g. with `sort_by_date`, by default False.
+        The window is located with binary search and aggregated as a contiguous slice
+        of rows instead of filtering a copy of the DataFrame.
 
     Raises
     ------
@@ -169,6 +344,7 @@ def ytd_volume(
         If `summarization` is not one of {"sum", "count", "average"}.
         If `measure` or `date` is not a valid column in the DataFrame.
         If `date` is not a valid datetime column in the DataFrame.
+        If `sorted_dates` is True and `df` isn't sorted by date.
 
     Examples
     --------
@@ -232,6 +408,14 @@ def ytd_volume(
     else:
         current_year = cy_date.year
 
+    # Contiguous slice of date sorted rows instead of filtering a copy of the data frame
+    if sorted_dates:
+        if not df[date].is_monotonic_increasing:
+            raise ValueError("df must be sorted by date, use sort_by_date")
+
+        window = _window_slice(df[date], _year_window(current_year, cy_date))
+        return df[measure].iloc[window].agg("mean" if summarization == "average" else summarization).round(2)
+
     cy_volume = (df.assign(year=df[date].dt.year)
                 .query('year == @current_year and `{0}` <= @cy_date'.format(date))
                 .agg({measure: summarization})
@@ -248,7 +432,8 @@ def pytd_volume(
         date = None, 
         summarization = "sum", 
         current_year = None, 
-        py_date = None):
+        py_date = None,
+        sorted_dates = False):
     """
     Calculate the previous year-to-date (PYTD) volume of a given measure in a pandas DataFrame.
 
@@ -271,6 +456,10 @@ def pytd_volume(
     py_date : datetime, optional
         Date to use for the YTD calculation, by default None.
         If not provided, the current date will be used.
+    sorted_dates : bool, optional
+        If True, `df` must be sorted by date, e.g. with `sort_by_date`, by default False.
+        The window is located with binary search and aggregated as a contiguous slice
+        of rows instead of filtering a copy of the DataFrame.
 
     Raises
     ------
@@ -279,6 +468,7 @@ def pytd_volume(
         If `summarization` is not one of {"sum", "count", "average"}.
         If `measure` or `date` is not a valid column in the DataFrame.
         If `date` is not a valid datetime column in the DataFrame.
+        If `sorted_dates` is True and `df` isn't sorted by date.
 
     Examples
     --------
@@ -342,6 +532,14 @@ def pytd_volume(
     else:
         previous_year = py_date.year
 
+    # Contiguous slice of date sorted rows instead of filtering a copy of the data frame
+    if sorted_dates:
+        if not df[date].is_monotonic_increasing:
+            raise ValueError("df must be sorted by date, use sort_by_date")
+
+        window = _window_slice(df[date], _year_window(previous_year, py_date))
+        return df[measure].iloc[window].agg("mean" if summarization == "average" else summarization).round(2)
+
     py_volume = (df.assign(year=df[date].dt.year)
                 .query('year == @previous_year and `{0}` <= @py_date'.format(date))
                 .agg({measure: summarization})
@@ -352,6 +550,509 @@ def pytd_volume(
 
     return py_volume
 
+# Compared by identity, the generated __eq__ and __hash__ would compare the masks
+@dataclass(frozen=True, eq=False)
+class TrendContext:
+    """
+    Date related state shared by all trend calculations on one data frame.
+
+    The current and previous windows are the year to date windows by default, or the
+    windows of another comparison like month over month, see `get_trend_context`.
+
+    Use `get_trend_context` to build it. The context can be reused across many
+    calls of `narrate_trend`, `get_trend_outliers` and `trend_volume` as long as
+    the data frame isn't modified in between.
+
+    Attributes
+    ----------
+    measure : str
+        Column name of the measure.
+    date : str
+        Column name of the date.
+    frequency : str
+        Date frequency - 'year', 'quarter', 'month', 'week' or 'day'.
+    cy_date : pd.Timestamp
+        Current year cut-off date.
+    py_date : pd.Timestamp
+        Prior year cut-off date.
+    cy_mask : np.ndarray
+        Read-only boolean mask of the rows in the current year to date window.
+    py_mask : np.ndarray
+        Read-only boolean mask of the rows in the prior year to date window.
+    cy_slice : slice or None
+        Rows of the current year to date window if the data frame is sorted by date.
+    py_slice : slice or None
+        Rows of the prior year to date window if the data frame is sorted by date.
+    comparison : str
+        Compared windows - 'ytd', 'wow', 'mom', 'qoq' or 'rolling'.
+    periods : int
+        Number of periods of the frequency in a rolling window.
+    timeframe_curr : str
+        Label of the current window, e.g. '2022 YTD' or 'Mar 2022'.
+    timeframe_prev : str
+        Label of the previous window, e.g. '2021 YTD' or 'Feb 2022'.
+    calendar : FiscalCalendar or None
+        Fiscal calendar of the windows, None for calendar years.
+    """
+    measure: str
+    date: str
+    frequency: str
+    cy_date: pd.Timestamp
+    py_date: pd.Timestamp
+    cy_mask: np.ndarray = field(repr=False)
+    py_mask: np.ndarray = field(repr=False)
+    cy_slice: Optional[slice] = field(default=None, repr=False)
+    py_slice: Optional[slice] = field(default=None, repr=False)
+    comparison: str = "ytd"
+    periods: int = 1
+    timeframe_curr: Optional[str] = None
+    timeframe_prev: Optional[str] = None
+    calendar: Optional[object] = None
+
+    def check(self, df):
+        """
+        Raise ValueError if the context can't be applied to the data frame.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("df must be a pandas DataFrame")
+        if self.measure not in df.columns or self.date not in df.columns:
+            raise ValueError("context measure and date must be columns in the dataset")
+        if len(self.cy_mask) != df.shape[0]:
+            raise ValueError("context was built for a data frame with a different number of rows")
+
+
+def get_trend_context(
+        df,
+        measure = None,
+        date = None,
+        frequency = None,
+        cy_date = None,
+        py_date = None,
+        sorted_dates = False,
+        comparison = "ytd",
+        periods = 1,
+        calendar = None):
+    """
+    Resolve the measure, date column, frequency and compared windows of a data frame once.
+
+    By default the current year to date is compared with the prior year to date. The other
+    comparisons compare the calendar period of the cut-off date up to it with the previous
+    period up to the same point, i.e. week over week ('wow'), month over month ('mom') or
+    quarter over quarter ('qoq'), or the last `periods` periods of the frequency with the
+    ones before ('rolling'). Every comparison is resolved to two row masks, so the volumes of
+    all levels are aggregated in one pass by `trend_volume` and `get_trend_outliers`.
+
+    With a fiscal `calendar` the years, quarters, months and weeks of the comparisons are the
+    fiscal years, quarters, periods and weeks. The window bounds are looked up once in the
+    date table of the calendar, the rows are then compared with them as usual.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input pandas DataFrame containing the data to be analyzed.
+    measure : str, optional
+        Column name of the measure, by default None.
+        If not provided, the first numerical column in the DataFrame will be used.
+    date : str, optional
+        Column name of the date, by default None.
+        If not provided, the first datetime column in the DataFrame will be used.
+    frequency : str, optional
+        Date frequency, by default estimated with `get_frequency`.
+    cy_date : datetime, optional
+        Current cut-off date, by default the maximum date in the DataFrame.
+    py_date : datetime, optional
+        Previous cut-off date, by default calculated with `get_py_date` for 'ytd' and
+        one period, or `periods` periods for 'rolling', before `cy_date` otherwise.
+    sorted_dates : bool, optional
+        If True, `df` must be sorted by date, e.g. with `sort_by_date`, by default False.
+        The windows are located with binary search and kept as row slices, so
+        `trend_volume` only aggregates the rows from the start of the previous window.
+    comparison : str, optional
+        Compared windows, by default "ytd".
+        Must be one of {"ytd", "wow", "mom", "qoq", "rolling"}.
+    periods : int, optional
+        Number of periods of the frequency in a rolling window, by default 1.
+    calendar : FiscalCalendar, optional
+        Fiscal calendar of the windows, by default None, i.e. calendar years.
+
+    Raises
+    ------
+    ValueError
+        If `df` is not a pandas DataFrame or has no rows.
+        If `measure` or `date` is not a valid column in the DataFrame.
+        If `date` is not a valid datetime column in the DataFrame.
+        If `sorted_dates` is True and `df` isn't sorted by date.
+        If `comparison` is not one of {"ytd", "wow", "mom", "qoq", "rolling"} or `periods` is not positive.
+
+    Examples
+    --------
+    >>> data = {'Monthly Date': pd.date_range(start='2021-01-01', periods=15, freq='MS'),
+        'Value': [10, 15, 20, 25, 30, 10, 15, 20, 25, 30, 10, 15, 20, 25, 30],
+        'Category': ['A', 'B', 'A', 'B', 'A', 'A', 'B', 'A', 'B', 'A', 'A', 'B', 'A', 'B', 'A']}
+    >>> df = pd.DataFrame(data)
+    >>> context = get_trend_context(df)
+    >>> context
+    TrendContext(measure='Value', date='Monthly Date', frequency='month', cy_date=Timestamp('2022-03-01 00:00:00'), py_date=Timestamp('2021-03-01 00:00:00'))
+    >>> narrate_trend(df, context=context)
+    >>> context = get_trend_context(df, comparison='rolling', periods=3)
+    >>> context.timeframe_prev, context.timeframe_curr
+    ('3 months to 2021-12-01', '3 months to 2022-03-01')
+
+    Returns
+    -------
+    TrendContext
+        Immutable context to be passed to trend functions.
+    """
+    # Table must be a pandas DataFrame and have at least one row
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("df must be a pandas DataFrame")
+    if df.shape[0] == 0:
+        raise ValueError("df must have at least one row, execution is stopped")
+
+    if comparison not in COMPARISONS:
+        raise ValueError(f"comparison must of be one of: {', '.join(COMPARISONS)}")
+    if int(periods) != periods or periods < 1:
+        raise ValueError("periods must be a positive integer")
+
+    # Measure, Date and Dimensions Assertion
+    if measure is not None:
+        if measure not in df.columns:
+            raise ValueError("measure must a column in the dataset")
+    else:
+        # If measure isn't supplied get the first numerical column from it
+        measure = df.select_dtypes(include=[np.number]).columns[0]
+
+    # Get Date
+    if date is not None:
+        if date not in df.columns:
+            raise ValueError("date must a column in the dataset")
+
+        if not pd.api.types.is_datetime64_any_dtype(df[date]):
+            raise ValueError("'date' must be a date column in the dataset")
+    else:
+        # Getting the first date field available
+        date_fields = df.select_dtypes(include=[np.datetime64]).columns
+
+        if date_fields.empty:
+            raise ValueError("No date column found in the dataset")
+
+        date = date_fields[0]
+
+    if frequency is None:
+        frequency = get_frequency(df, date_field=date)
+
+    # Current and Previous Cut-off Dates
+    cy_date = df[date].max() if cy_date is None else pd.to_datetime(cy_date)
+
+    if py_date is not None:
+        py_date = pd.to_datetime(py_date)
+    elif comparison == "rolling":
+        py_date = cy_date - _period_offset(frequency, periods)
+    elif calendar is not None:
+        py_date = calendar.previous(cy_date, _COMPARISON_GRAINS[comparison])
+    elif comparison == "ytd":
+        py_date = pd.to_datetime(get_py_date(df, frequency=frequency))
+    else:
+        py_date = cy_date - _period_offset(_COMPARISON_GRAINS[comparison])
+
+    cy_window = _comparison_window(comparison, cy_date, frequency, periods, calendar)
+    py_window = _comparison_window(comparison, py_date, frequency, periods, calendar)
+
+    dates = df[date]
+
+    if sorted_dates:
+        if not dates.is_monotonic_increasing:
+            raise ValueError("df must be sorted by date, use sort_by_date")
+
+        # Windows are contiguous slices of the sorted rows
+        cy_slice = _window_slice(dates, cy_window)
+        py_slice = _window_slice(dates, py_window)
+        cy_mask = np.zeros(len(dates), dtype=bool)
+        py_mask = np.zeros(len(dates), dtype=bool)
+        cy_mask[cy_slice] = True
+        py_mask[py_slice] = True
+    else:
+        # One boolean mask per window over the full data frame
+        cy_slice = py_slice = None
+        cy_mask = _window_mask(dates, cy_window)
+        py_mask = _window_mask(dates, py_window)
+
+    cy_mask.flags.writeable = False
+    py_mask.flags.writeable = False
+
+    return TrendContext(
+        measure=measure,
+        date=date,
+        frequency=frequency,
+        cy_date=cy_date,
+        py_date=py_date,
+        cy_mask=cy_mask,
+        py_mask=py_mask,
+        cy_slice=cy_slice,
+        py_slice=py_slice,
+        comparison=comparison,
+        periods=periods,
+        timeframe_curr=_timeframe(comparison, cy_date, frequency, periods, calendar),
+        timeframe_prev=_timeframe(comparison, py_date, frequency, periods, calendar),
+        calendar=calendar
+    )
+
+
+def _window_rows(df, context):
+    # Rows that can be in a window, all of them unless the data frame is sorted by date
+    if context.cy_slice is None:
+        return slice(None)
+
+    return slice(
+        min(context.cy_slice.start, context.py_slice.start),
+        max(context.cy_slice.stop, context.py_slice.stop)
+    )
+
+
+def _window_volumes(df, context, summarization, rows=slice(None)):
+    # Rows outside of the window must not contribute to the aggregate,
+    # for sum they are zeroed to keep the dtype, otherwise they are masked out
+    values = df[context.measure].iloc[rows]
+    fill = 0 if summarization == "sum" else np.nan
+
+    return pd.DataFrame({
+        "curr_volume": values.where(context.cy_mask[rows], fill),
+        "prev_volume": values.where(context.py_mask[rows], fill)
+    })
+
+
+def trend_volume(
+        df,
+        dimension = None,
+        measure = None,
+        date = None,
+        summarization = "sum",
+        cy_date = None,
+        py_date = None,
+        context = None,
+        cache = None,
+        comparison = "ytd",
+        periods = 1,
+        calendar = None):
+    """
+    Calculate the current and previous volumes of a measure for every level of a dimension,
+    by default the YTD and PYTD volumes.
+
+    Unlike calling `ytd_volume` and `pytd_volume` once per group, the current and
+    previous year windows are resolved once for the whole data frame as boolean masks
+    and all levels are aggregated with a single groupby. With a context built with
+    `sorted_dates=True` only the rows from the start of the previous window are grouped,
+    levels without rows in that span are left out.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input pandas DataFrame containing the data to be analyzed.
+    dimension : str or list, optional
+        Column name of the dimension to group by, or a list of them, by default None.
+        If not provided, the volumes are calculated for the whole DataFrame.
+    measure : str, optional
+        Column name of the measure, by default None.
+        If not provided, the first numerical column in the DataFrame will be used.
+    date : str, optional
+        Column name of the date, by default None.
+        If not provided, the first datetime column in the DataFrame will be used.
+    summarization : str, optional
+        Summarization method to use, by default "sum".
+        Must be one of {"sum", "count", "average"}.
+    cy_date : datetime, optional
+        Current year cut-off date, by default the maximum date in the DataFrame.
+    py_date : datetime, optional
+        Prior year cut-off date, by default calculated with `get_py_date`.
+    context : TrendContext, optional
+        Precomputed context from `get_trend_context`, by default None.
+        If provided, `measure`, `date`, `cy_date`, `py_date`, `comparison`, `periods` and `calendar` are taken from it.
+    cache : AggregationCache, optional
+        Cache of the aggregated volumes reused across calls, by default None.
+    comparison : str, optional
+        Compared windows, see `get_trend_context`, by default "ytd".
+    periods : int, optional
+        Number of periods of the frequency in a rolling window, by default 1.
+    calendar : FiscalCalendar, optional
+        Fiscal calendar of the windows, by default None, i.e. calendar years.
+
+    Raises
+    ------
+    ValueError
+        If `df` is not a pandas DataFrame or has no rows.
+        If `summarization` is not one of {"sum", "count", "average"}.
+        If `dimension`, `measure` or `date` is not a valid column in the DataFrame.
+
+    Examples
+    --------
+    >>> data = {'Monthly Date': pd.date_range(start='2021-01-01', periods=15, freq='MS'),
+        'Value': [10, 15, 20, 25, 30, 10, 15, 20, 25, 30, 10, 15, 20, 25, 30],
+        'Category': ['A', 'B', 'A', 'B', 'A', 'A', 'B', 'A', 'B', 'A', 'A', 'B', 'A', 'B', 'A']}
+    >>> df = pd.DataFrame(data)
+    >>> trend_volume(df, 'Category')
+      Category  curr_volume  prev_volume
+    0        A           50           30
+    1        B           25           15
+    >>> trend_volume(df)
+    curr_volume    75
+    prev_volume    45
+    dtype: int64
+
+    Returns
+    -------
+    pd.DataFrame or pd.Series
+        A pandas DataFrame with one row per dimension level and the columns
+        `curr_volume` and `prev_volume`, or a pandas Series with the same
+        entries if `dimension` is None.
+    """
+    # Summarization Assertion
+    if summarization not in ["sum", "count", "average"]:
+        raise ValueError("summarization must of be one of: 'sum', 'count' or 'mean'.")
+
+    if context is None:
+        context = get_trend_context(df, measure=measure, date=date, cy_date=cy_date, py_date=py_date, comparison=comparison, periods=periods, calendar=calendar)
+    else:
+        context.check(df)
+
+    func = "mean" if summarization == "average" else summarization
+
+    if dimension is None:
+        dimensions = None
+    else:
+        dimensions = list(dimension) if isinstance(dimension, (list, tuple)) else [dimension]
+
+        if any(d not in df.columns for d in dimensions):
+            raise ValueError("dimension must a column in the dataset")
+
+    def aggregate():
+        rows = _window_rows(df, context)
+        volumes = _window_volumes(df, context, summarization, rows)
+
+        if dimensions is None:
+            return volumes.agg(func).round(2)
+
+        return (
+            volumes
+            .groupby([df[d].iloc[rows] for d in dimensions], observed=True)
+            .agg(func)
+            .round(2)
+            .reset_index()
+        )
+
+    key = (
+        "trend_volume",
+        None if dimensions is None else tuple(dimensions),
+        context.measure,
+        context.date,
+        summarization,
+        context.cy_date,
+        context.py_date,
+        context.comparison,
+        context.periods,
+        context.calendar
+    )
+
+    return cached(cache, df, key, aggregate)
+
+
+def series_matrix(
+        df,
+        series,
+        measure = None,
+        date = None,
+        summarization = "sum",
+        chunk_size = 10000):
+    """
+    Pivot long format time series to dense float32 arrays of series by period.
+
+    The series and the dates are factorized once and the rows are ordered by series, so
+    every chunk of `chunk_size` series is pivoted with a single `np.bincount` over its own
+    rows. The memory of a chunk is bounded by chunk_size * periods * 4 bytes whatever the
+    number of series, values are stored as float32, i.e. with about 7 significant digits.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input pandas DataFrame containing the data to be analyzed, one row per observation.
+    series : str
+        Column name identifying the series, e.g. a SKU.
+    measure : str, optional
+        Column name of the measure, by default the first numerical column in the DataFrame.
+    date : str, optional
+        Column name of the date, by default the first datetime column in the DataFrame.
+    summarization : str, optional
+        Summarization of the rows of a series in a period, by default "sum".
+        Must be one of {"sum", "count"}.
+    chunk_size : int, optional
+        Maximum number of series in a chunk, by default 10000.
+
+    Raises
+    ------
+    ValueError
+        If `df` is not a pandas DataFrame.
+        If `summarization` is not one of {"sum", "count"} or `chunk_size` is not positive.
+        If `series`, `measure` or `date` is not a valid column in the DataFrame.
+
+    Examples
+    --------
+    >>> for levels, periods, values in series_matrix(df, 'SKU', 'Sales', chunk_size=50000):
+    ...     growth = values[:, -1] / values[:, -2]
+
+    Yields
+    ------
+    tuple
+        The series levels of the chunk as a pd.Index, the sorted periods as a pd.Index of
+        dates and the float32 array of shape (levels, periods).
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("df must be a pandas DataFrame")
+    if summarization not in ["sum", "count"]:
+        raise ValueError("summarization must of be one of: 'sum' or 'count'.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if series not in df.columns:
+        raise ValueError("series must a column in the dataset")
+
+    if measure is None:
+        measure = df.select_dtypes(include=[np.number]).columns[0]
+    elif measure not in df.columns:
+        raise ValueError("measure must a column in the dataset")
+
+    if date is None:
+        date_fields = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+
+        if date_fields.empty:
+            raise ValueError("No date column found in the dataset")
+
+        date = date_fields[0]
+    elif date not in df.columns:
+        raise ValueError("date must a column in the dataset")
+
+    codes, levels = pd.factorize(df[series])
+    period_codes, periods = pd.factorize(df[date], sort=True)
+    values = df[measure].to_numpy(dtype="float64", na_value=np.nan)
+
+    valid = (codes >= 0) & (period_codes >= 0) & ~np.isnan(values)
+    order = np.argsort(codes[valid], kind="stable")
+    codes = codes[valid][order]
+    period_codes = period_codes[valid][order]
+    values = values[valid][order] if summarization == "sum" else None
+
+    levels = pd.Index(levels, name=series)
+    periods = pd.Index(periods, name=date)
+    n_periods = len(periods)
+
+    # Rows of every chunk of series are contiguous after ordering by series
+    for start in range(0, len(levels), chunk_size):
+        stop = min(start + chunk_size, len(levels))
+        lo, hi = np.searchsorted(codes, [start, stop])
+        cells = (codes[lo:hi] - start) * n_periods + period_codes[lo:hi]
+        weights = None if values is None else values[lo:hi]
+
+        matrix = np.bincount(cells, weights=weights, minlength=(stop - start) * n_periods)
+
+        yield levels[start:stop], periods, matrix.astype("float32").reshape(stop - start, n_periods)
+
 """
 data = {'Monthly Date': pd.date_range(start='2021-01-01', periods=15, freq='MS'),
         'Value': [10, 15, 20, 25, 30, 10, 15, 20, 25, 30, 10, 15, 20, 25, 30],
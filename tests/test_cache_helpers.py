@@ -0,0 +1,72 @@
+import pickle
+import pandas as pd
+from pynarrator import narrate_descriptive, AggregationCache, frame_fingerprint
+
+def make_df():
+    return pd.DataFrame({
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B'],
+        'Sales': [10, 15, 20, 5, 25, 30]
+    })
+
+def test_cache_skips_aggregation_for_presentation_changes():
+    df = make_df()
+    cache = AggregationCache()
+
+    narrative = narrate_descriptive(df, measure='Sales', coverage=0.4, cache=cache)
+    misses = cache.stats()['misses']
+
+    assert narrative == narrate_descriptive(df, measure='Sales', coverage=0.4)
+    assert narrate_descriptive(df, measure='Sales', coverage=0.8, coverage_limit=2, cache=cache) == \
+        narrate_descriptive(df, measure='Sales', coverage=0.8, coverage_limit=2)
+    assert cache.stats()['misses'] == misses
+    assert cache.stats()['hits'] == misses
+
+def test_cache_detects_changed_frame():
+    df = make_df()
+    cache = AggregationCache()
+    narrate_descriptive(df, measure='Sales', cache=cache)
+
+    df.loc[0, 'Sales'] = 100
+
+    assert narrate_descriptive(df, measure='Sales', cache=cache) == narrate_descriptive(df, measure='Sales')
+    assert frame_fingerprint(df) != frame_fingerprint(make_df())
+
+def test_cache_detects_edits_of_any_row():
+    df = pd.DataFrame({'Region': ['North', 'South'] * 2500, 'Sales': range(5000)})
+    cache = AggregationCache()
+    narrate_descriptive(df, measure='Sales', cache=cache)
+
+    # Every row counts, not only a sample of them
+    for position in [1, 2499, 3777]:
+        fingerprint = frame_fingerprint(df)
+        df.iloc[position, 1] += 1
+        assert frame_fingerprint(df) != fingerprint
+
+    df.iloc[3001, 0] = 'West'
+
+    assert narrate_descriptive(df, measure='Sales', cache=cache) == narrate_descriptive(df, measure='Sales')
+    assert frame_fingerprint(df.iloc[::-1]) != frame_fingerprint(df)
+
+def test_cache_lru_eviction():
+    cache = AggregationCache(max_bytes=2000)
+    table = pd.DataFrame({'a': range(100)})
+
+    cache.put('first', table)
+    cache.put('second', table)
+    cache.get('first')
+    cache.put('third', table)
+
+    assert 'first' in cache and 'third' in cache
+    assert 'second' not in cache
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] <= 2000
+
+def test_cache_pickles_empty():
+    cache = AggregationCache(max_bytes=2000)
+    cache.put('first', pd.DataFrame({'a': range(10)}))
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    assert len(copy) == 0 and copy.max_bytes == 2000
+    assert len(cache) == 1
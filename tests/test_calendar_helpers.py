@@ -0,0 +1,74 @@
+import pandas as pd
+import numpy as np
+from pynarrator import FiscalCalendar, get_trend_context, trend_volume, narrate_trend, get_py_date
+import pytest
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range(start='2022-01-01', end='2024-06-12', freq='D')
+
+    return pd.DataFrame({
+        'Date': dates.repeat(2),
+        'Region': ['North', 'South'] * len(dates),
+        'Sales': rng.integers(0, 100, 2 * len(dates))
+    })
+
+def test_date_table_445():
+    calendar = FiscalCalendar(start_month=2, pattern=(4, 4, 5), week_start=6)
+    table = calendar.date_table(pd.date_range(start='2023-01-29', end='2024-02-03', freq='D'))
+
+    # FY2024 runs from the Sunday nearest to February 1, 2023 and has 53 weeks
+    assert (table['fiscal_year'] == 2024).all()
+    assert table.groupby('fiscal_period').size().tolist() == [28, 28, 35] * 3 + [28, 28, 42]
+    assert table['fiscal_week'].max() == 53
+    assert (table['week_start'].dt.dayofweek == 6).all()
+    assert table.loc['2023-03-01', 'same_day_last_year'] == pd.Timestamp('2022-03-02')
+
+def test_date_table_months():
+    table = FiscalCalendar(start_month=7).date_table(pd.to_datetime(['2023-06-30', '2023-07-01', '2024-02-29']))
+
+    assert table['fiscal_year'].tolist() == [2023, 2024, 2024]
+    assert table['fiscal_quarter'].tolist() == [4, 1, 3]
+    assert table['quarter_start'].dt.strftime('%Y-%m-%d').tolist() == ['2023-04-01', '2023-07-01', '2024-01-01']
+
+def test_annotate():
+    calendar = FiscalCalendar(start_month=7)
+    df = pd.DataFrame({'Date': pd.to_datetime(['2023-07-01 10:00', None, '2023-06-30 00:00'])})
+
+    annotated = calendar.annotate(df, 'Date')
+
+    assert annotated['fiscal_year'].tolist() == [2024, pd.NA, 2023]
+    assert annotated['fiscal_period'].tolist() == [1, pd.NA, 12]
+
+def test_fiscal_ytd(df):
+    calendar = FiscalCalendar(start_month=2, pattern=(4, 4, 5), week_start=6)
+    context = get_trend_context(df, calendar=calendar)
+    table = calendar.date_table(df['Date'])
+    fiscal = df.join(table, on='Date')
+
+    # FY2025 starts on Sunday February 4, 2024, the same day of FY2024 is June 7, 2023
+    assert context.py_date == pd.Timestamp('2023-06-07')
+    assert get_py_date(df, calendar=calendar) == context.py_date.date()
+    assert context.cy_mask.sum() == ((fiscal['fiscal_year'] == 2025) & (fiscal['Date'] <= '2024-06-12')).sum()
+    assert context.py_mask.sum() == ((fiscal['fiscal_year'] == 2024) & (fiscal['Date'] <= '2023-06-07')).sum()
+
+    narrative = narrate_trend(df, dimensions=['Region'], calendar=calendar)
+    assert narrative['Total Sales'].startswith('From FY2024 YTD to FY2025 YTD')
+
+    quarter = get_trend_context(df, calendar=calendar, comparison='qoq')
+    assert (quarter.timeframe_prev, quarter.timeframe_curr) == ('FY2025 Q1', 'FY2025 Q2')
+
+def test_calendar_year_matches_default(df):
+    default = get_trend_context(df)
+    calendar = get_trend_context(df, calendar=FiscalCalendar())
+
+    assert (default.cy_mask == calendar.cy_mask).all()
+    assert (default.py_mask == calendar.py_mask).all()
+    assert trend_volume(df, 'Region', context=calendar).equals(trend_volume(df, 'Region', context=default))
+
+def test_invalid_calendar():
+    with pytest.raises(ValueError):
+        FiscalCalendar(pattern=(4, 4, 4))
+    with pytest.raises(ValueError):
+        FiscalCalendar(start_month=13)
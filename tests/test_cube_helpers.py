@@ -0,0 +1,70 @@
+import pandas as pd
+import numpy as np
+from pynarrator import TimeCube, period_start, narrate_trend, trend_volume
+import pytest
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 5000
+
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2021-01-01') + pd.to_timedelta(rng.integers(0, 800, n), unit='D'),
+        'Region': rng.choice(['North', 'South', 'West'], n),
+        'Product': rng.choice(['A', 'B', 'C', 'D'], n),
+        'Sales': rng.integers(1, 100, n)
+    })
+
+@pytest.mark.parametrize('grain, freq', [('month', 'MS'), ('quarter', 'QS'), ('year', 'YS')])
+def test_cube_matches_resampled_frame(df, grain, freq):
+    cube = TimeCube.from_frame(df)
+    resampled = df.groupby(['Region', 'Product', pd.Grouper(key='Date', freq=freq)])['Sales'].sum().reset_index()
+
+    frame = cube.frame(grain).sort_values(['Region', 'Product', 'Date'], ignore_index=True)
+    pd.testing.assert_frame_equal(frame, resampled, check_dtype=False)
+
+    assert cube.narrate(grain) == narrate_trend(resampled, dimensions=['Region', 'Product'])
+    assert cube.trend_volume(grain, 'Region').equals(trend_volume(resampled, 'Region'))
+
+def test_cube_week_grain(df):
+    cube = TimeCube.from_frame(df, measure='Sales', date='Date', dimensions=['Region'])
+    weekly = cube.frame('week')
+
+    assert (weekly['Date'].dt.dayofweek == 0).all()
+    assert weekly['Sales'].sum() == df['Sales'].sum()
+    assert cube.context('week').frequency == 'week'
+    assert cube.narrate('week', comparison='wow') == narrate_trend(weekly, dimensions=['Region'], comparison='wow')
+
+def test_cube_keeps_missing_levels(df):
+    df.loc[:10, 'Region'] = None
+    cube = TimeCube.from_frame(df, dimensions=['Region'])
+
+    assert cube.frame('year')['Sales'].sum() == df['Sales'].sum()
+
+def test_period_start():
+    dates = pd.Series(pd.to_datetime(['2023-02-15 10:00', None, '2023-05-02 00:00']).tz_localize('Europe/Paris'))
+
+    assert period_start(dates, 'quarter').dt.strftime('%Y-%m-%d').tolist()[::2] == ['2023-01-01', '2023-04-01']
+    assert period_start(dates, 'quarter').isna().tolist() == [False, True, False]
+    assert str(period_start(dates, 'week').dtype) == str(dates.dtype)
+
+    with pytest.raises(ValueError):
+        period_start(dates, 'hour')
+
+@pytest.mark.parametrize('summarization', ['sum', 'count'])
+def test_cube_summarization_matches_raw_frame(df, summarization):
+    df.loc[::7, 'Sales'] = np.nan
+    cube = TimeCube.from_frame(df, measure='Sales', date='Date', dimensions=['Region', 'Product'])
+
+    raw = narrate_trend(df, measure='Sales', dimensions=['Region', 'Product'], summarization=summarization)
+
+    assert cube.narrate('day', summarization=summarization) == raw
+    assert cube.trend_volume('day', 'Region', summarization=summarization).equals(trend_volume(df, 'Region', 'Sales', summarization=summarization))
+
+def test_cube_rejects_average(df):
+    cube = TimeCube.from_frame(df)
+
+    with pytest.raises(ValueError):
+        cube.narrate('month', summarization='average')
+    with pytest.raises(ValueError):
+        cube.trend_volume('month', 'Region', summarization='average')
@@ -0,0 +1,71 @@
+import pandas as pd
+from pynarrator import narrate_by, narrate_descriptive, narrate_trend, AggregationCache
+import pytest
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'Store': ['S1'] * 6 + ['S2'] * 6 + ['S3'] * 2,
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', 'North', 'South', 'South', 'West', 'East', 'West', 'North', 'North'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A', 'C', 'B', 'A', 'A', 'C', 'A', 'B'],
+        'Sales': [10, 15, 20, 5, 25, 30, 40, 10, 5, 20, 5, 10, 7, 3]
+    })
+
+@pytest.mark.parametrize('summarization', ['sum', 'count', 'average'])
+def test_narrate_by_matches_segments(df, summarization):
+    narratives = narrate_by(df, by='Store', measure='Sales', summarization=summarization)
+
+    assert list(narratives) == ['S1', 'S2', 'S3']
+
+    for store, segment in df.groupby('Store'):
+        narrative = narrate_descriptive(segment, 'Sales', ['Region', 'Product'], summarization=summarization, narration_depth=1)
+
+        # Segments with a single level of a dimension have no narrative for it
+        if store == 'S3':
+            del narrative['Region by Sales']
+
+        assert narratives[store] == narrative
+
+@pytest.mark.parametrize('summarization, comparison, output_format', [
+    ('sum', 'ytd', 'plain'),
+    ('average', 'ytd', 'plain'),
+    ('sum', 'qoq', 'html')
+])
+def test_narrate_by_trend_matches_segments(summarization, comparison, output_format):
+    # Every store has the same dates, so the YTD windows of the segments are the same
+    df = pd.MultiIndex.from_product([
+        ['S1', 'S2'],
+        ['North', 'South', 'West'],
+        ['A', 'B'],
+        pd.date_range(start='2021-01-01', periods=15, freq='MS')
+    ], names=['Store', 'Region', 'Product', 'Date']).to_frame(index=False)
+    df['Sales'] = (df.index * 7) % 23 + df['Date'].dt.year - 2000
+
+    options = dict(summarization=summarization, comparison=comparison, output_format=output_format)
+
+    # The cached context of another comparison isn't reused
+    cache = AggregationCache()
+    narrate_by(df, by='Store', measure='Sales', kind='trend', cache=cache, comparison='wow')
+    narratives = narrate_by(df, by='Store', measure='Sales', kind='trend', cache=cache, **options)
+
+    for store, segment in df.groupby('Store'):
+        narrative = narrate_trend(segment, 'Sales', ['Region', 'Product'], narration_depth=1, **options)
+        assert narratives[store] == narrative
+
+def test_narrate_by_generator(df):
+    narratives = narrate_by(df, by='Store', measure='Sales', generator=True, simplify=True)
+
+    assert not isinstance(narratives, dict)
+    assert dict(narratives) == {store: list(narrative.values()) for store, narrative in narrate_by(df, by='Store', measure='Sales').items()}
+
+    with pytest.raises(ValueError):
+        narrate_by(df, by='Store', measure='Sales', dimensions=['Store', 'Region'])
+
+def test_narrate_by_segments_with_the_same_text(df):
+    df = df.assign(Store=[1] * 6 + ['1'] * 6 + [None] * 2)
+    narratives = narrate_by(df, by='Store', measure='Sales')
+
+    # 1 and '1' are distinct segments and the rows without a segment aren't narrated
+    assert len(narratives) == 2
+    assert narratives[1] == narrate_descriptive(df.head(6), 'Sales', ['Region', 'Product'], narration_depth=1)
+    assert narratives['1'] == narrate_descriptive(df.iloc[6:12], 'Sales', ['Region', 'Product'], narration_depth=1)
@@ -1,6 +1,9 @@
 import pandas as pd
-from pynarrator import narrate_descriptive
+import numpy as np
+from pynarrator import narrate_descriptive, narrate_descriptive_stream, narrate_descriptive_many, get_descriptive_outliers, get_descriptive_outliers_l2, aggregate_dimensions, DescriptiveState
+from pynarrator.descriptive_helpers import top_k_positions
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 def test_narrate_descriptive_returns_dict():
     # Prepare test data
@@ -45,4 +48,143 @@ def test_narrate_descriptive_runs():
     df = pd.DataFrame(data)
 
     with pytest.raises(Exception):
-        narrate_descriptive(df, measure='Region', dimensions=['Region', 'Sales'])
\ No newline at end of file
+        narrate_descriptive(df, measure='Region', dimensions=['Region', 'Sales'])
+
+
+@pytest.mark.parametrize('summarization', ['sum', 'count', 'average'])
+def test_aggregate_dimensions_matches_groupby(summarization):
+    data = {
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', None],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A'],
+        'Sales': [10, 15, 10, 5, 25, 30, 20]
+    }
+    df = pd.DataFrame(data)
+
+    tables = aggregate_dimensions(df, ['Region', 'Product'], 'Sales', summarization)
+
+    for dimension, table in tables.items():
+        expected = df.groupby(dimension)['Sales'].agg(
+            'sum' if summarization == 'sum' else
+            'nunique' if summarization == 'count' else
+            'mean'
+            ).reset_index()
+        pd.testing.assert_frame_equal(table, expected, check_dtype=False)
+
+def test_aggregate_dimensions_exact_integer_sums():
+    df = pd.DataFrame({'Region': ['North', 'North', 'South'], 'Sales': [2 ** 53, 1, 2 ** 60 + 1]})
+
+    table = aggregate_dimensions(df, ['Region'], 'Sales')['Region']
+
+    assert table['Sales'].tolist() == [2 ** 53 + 1, 2 ** 60 + 1]
+    assert table['Sales'].tolist() == df.groupby('Region')['Sales'].sum().tolist()
+
+    state = DescriptiveState('Sales', ['Region']).update(df.head(1))
+    state.merge(DescriptiveState('Sales', ['Region']).update(df.tail(2)))
+    assert state.tables()['Region']['Sales'].tolist() == [2 ** 53 + 1, 2 ** 60 + 1]
+    assert state.total() == 2 ** 53 + 2 ** 60 + 2
+
+def test_top_k_positions_matches_full_sort():
+    values = np.array([3, 9, np.nan, 9, 5, 1, 5, 7])
+    expected = pd.Series(values).sort_values(ascending=False, kind='stable').index.to_numpy()
+
+    for k in range(len(values) + 2):
+        np.testing.assert_array_equal(top_k_positions([values], k), expected[:k])
+
+    # ties of the first key are broken by the next one
+    np.testing.assert_array_equal(top_k_positions([[1, 2, 2, 1], [0, 1, 3, 2]], 3), [2, 1, 3])
+
+def test_narrate_descriptive_depth():
+    data = {
+        'Region': ['North', 'North', 'North', 'South', 'South', 'South'],
+        'Product': ['A', 'B', 'C', 'A', 'B', 'C'],
+        'Sales': [10, 20, 70, 30, 40, 30]
+    }
+    df = pd.DataFrame(data)
+
+    narrative_l1 = narrate_descriptive(df, measure='Sales', dimensions=['Region', 'Product'], narration_depth=1)
+    narrative_l2 = narrate_descriptive(df, measure='Sales', dimensions=['Region', 'Product'], narration_depth=2)
+
+    assert list(narrative_l1) == ['Total Sales', 'Region by Sales', 'Product by Sales']
+    assert narrative_l2['Region North - Product by Sales'] == 'In North, significant Product by Sales is C (70, 70.0%).'
+    assert set(narrative_l1.items()) < set(narrative_l2.items())
+
+def test_get_descriptive_outliers_l2_matches_filtered():
+    data = {
+        'Region': ['North', 'North', 'North', 'South', 'South', 'South', 'West'],
+        'Product': ['A', 'B', 'C', 'A', 'B', 'C', 'A'],
+        'Sales': [10, 20, 70, 30, 40, 30, 5]
+    }
+    df = pd.DataFrame(data)
+
+    for summarization in ['sum', 'count', 'average']:
+        output = get_descriptive_outliers_l2(df, 'Region', 'Product', 'Sales', summarization=summarization)
+
+        # Parents with a single child are skipped
+        assert list(output) == ['North', 'South']
+
+        for region, output_l2 in output.items():
+            df_l2 = df[df['Region'] == region]
+            total = df_l2['Sales'].mean().round(2) if summarization == 'average' else None
+            assert output_l2 == get_descriptive_outliers(df_l2, 'Product', 'Sales', total=total, summarization=summarization)
+
+@pytest.mark.parametrize('summarization', ['sum', 'count', 'average'])
+def test_narrate_descriptive_stream_matches_frame(summarization):
+    data = {
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', 'North', 'South'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A', 'C'],
+        'Sales': [10, 15, 20, 5, 25, 30, 10, None]
+    }
+    df = pd.DataFrame(data)
+    chunks = [df.iloc[i:i + 3] for i in range(0, len(df), 3)]
+
+    narrative = narrate_descriptive_stream(iter(chunks), measure='Sales', summarization=summarization)
+
+    assert narrative == narrate_descriptive(df, measure='Sales', summarization=summarization)
+
+    # states of separate partitions can be merged
+    state = DescriptiveState('Sales', ['Region', 'Product'], summarization, narration_depth=2).update(chunks[0])
+    other = DescriptiveState('Sales', ['Region', 'Product'], summarization, narration_depth=2)
+    for chunk in chunks[1:]:
+        other.update(chunk)
+
+    assert narrate_descriptive(None, summarization=summarization, aggregates=state.merge(other)) == narrative
+
+def test_narrate_descriptive_parallel_matches_sequential():
+    data = {
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', 'North', 'South'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A', 'C'],
+        'Channel': ['X', 'Y', 'X', 'X', 'Y', 'Y', 'Y', 'X'],
+        'Sales': [10, 15, 20, 5, 25, 30, 10, 40]
+    }
+    df = pd.DataFrame(data)
+
+    for summarization in ['sum', 'count', 'average']:
+        narrative = narrate_descriptive(df, measure='Sales', summarization=summarization)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(narrate_descriptive(df, measure='Sales', summarization=summarization, executor=executor).items()) == list(narrative.items())
+
+        assert list(narrate_descriptive(df, measure='Sales', summarization=summarization, n_jobs=-1).items()) == list(narrative.items())
+
+@pytest.mark.parametrize('narration_depth', [1, 2])
+def test_narrate_descriptive_many_matches_single(narration_depth):
+    data = {
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', 'North', 'South'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A', 'C'],
+        'Sales': [10.5, 15, 20, 5, 25, 30, 10, 40],
+        'Quantity': [1, 2, 2, 1, 3, 4, 1, 2],
+        'Customer': ['a', 'b', 'a', 'c', 'd', 'd', 'e', 'b']
+    }
+    df = pd.DataFrame(data)
+    measures = ['Sales', ('Quantity', 'average'), ('Customer', 'count')]
+
+    narratives = narrate_descriptive_many(df, measures, narration_depth=narration_depth)
+
+    assert list(narratives) == ['Sales', 'Quantity', 'Customer']
+
+    for measure, summarization in [('Sales', 'sum'), ('Quantity', 'average'), ('Customer', 'count')]:
+        narrative = narrate_descriptive(df, measure, ['Region', 'Product'], summarization=summarization, narration_depth=narration_depth)
+        assert list(narratives[measure].items()) == list(narrative.items())
+
+    with pytest.raises(ValueError):
+        narrate_descriptive_many(df, ['Sales', ('Sales', 'average')])
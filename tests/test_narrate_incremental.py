@@ -0,0 +1,91 @@
+import pandas as pd
+from pynarrator import IncrementalNarrator, WindowNarrator, DescriptiveState, narrate_descriptive
+import pytest
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'Region': ['North', 'North', 'South', 'West', 'East', 'East', 'North', 'South', 'West', 'East', 'North', 'South'],
+        'Product': ['A', 'B', 'A', 'C', 'C', 'B', 'A', 'C', 'A', 'A', 'C', 'B'],
+        'Sales': [10, 15, 20, 5, 25, 30, 10, 40, 35, 5, 60, 10]
+    })
+
+@pytest.mark.parametrize('summarization', ['sum', 'count', 'average'])
+def test_incremental_narrator_matches_full(df, summarization):
+    narrator = IncrementalNarrator(measure='Sales', summarization=summarization)
+
+    for end in [4, 8, 12]:
+        previous = narrator.narrative
+        changed = narrator.append(df.iloc[end - 4:end])
+        narrative = narrate_descriptive(df.iloc[:end], measure='Sales', summarization=summarization)
+
+        assert list(narrator.narrative.items()) == list(narrative.items())
+        assert set(changed) == {key for key in set(previous) | set(narrative) if previous.get(key) != narrative.get(key)}
+
+def test_incremental_narrator_reports_changed_keys(df):
+    narrator = IncrementalNarrator(measure='Sales', dimensions=['Region', 'Product'], narration_depth=1)
+
+    assert narrator.append(df) == ['Total Sales', 'Region by Sales', 'Product by Sales']
+
+    # Rows of a level that is not an outlier only change the total
+    previous = dict(narrator.narrative)
+    changed = narrator.append(pd.DataFrame({'Region': ['West'], 'Product': ['B'], 'Sales': [0.5]}))
+
+    assert changed == [key for key in narrator.narrative if narrator.narrative[key] != previous[key]]
+    assert narrator.append(df.iloc[:0]) == []
+
+    with pytest.raises(ValueError):
+        IncrementalNarrator(measure='Sales', template_unknown='{measure}')
+
+@pytest.mark.parametrize('summarization', ['sum', 'count', 'average'])
+def test_window_narrator_matches_window(df, summarization):
+    df = df.assign(Date=pd.date_range(start='2023-01-01', periods=12, freq='D'))
+    narrator = WindowNarrator(date='Date', window='5D', measure='Sales', dimensions=['Region', 'Product'], summarization=summarization)
+
+    for end in range(2, 13, 2):
+        narrator.append(df.iloc[end - 2:end])
+        window = df.iloc[max(end - 5, 0):end]
+
+        assert narrator.rows().equals(window)
+        assert list(narrator.narrative.items()) == list(narrate_descriptive(window, 'Sales', ['Region', 'Product'], summarization=summarization).items())
+
+def test_descriptive_state_remove_restores_state(df):
+    state = DescriptiveState('Sales', ['Region', 'Product'], 'count', narration_depth=2).update(df.iloc[:6])
+    expected = state.tables()
+
+    state.update(df.iloc[6:]).remove(df.iloc[6:])
+
+    for dimension, table in state.tables().items():
+        pd.testing.assert_frame_equal(table, expected[dimension])
+
+    with pytest.raises(ValueError):
+        DescriptiveState('Sales', ['Region'], 'count', approximate=True).update(df).remove(df)
+
+def test_descriptive_state_counts_distinct_values(df):
+    # Values repeated within and across chunks, some of them removed again
+    state = DescriptiveState('Sales', ['Region', 'Product'], 'count', narration_depth=2).update(df)
+    state.merge(DescriptiveState('Sales', ['Region', 'Product'], 'count', narration_depth=2).update(df.iloc[:6]))
+    state.remove(df.iloc[:6]).remove(df.iloc[6:9])
+    rows = df.drop(df.index[6:9])
+
+    for dimension, table in state.tables().items():
+        assert table.set_index(dimension)['Sales'].to_dict() == rows.groupby(dimension)['Sales'].nunique().to_dict()
+
+    table = state.table_l2('Region', 'Product', ['North'])
+    assert table['Sales'].tolist() == rows[rows['Region'] == 'North'].groupby('Product')['Sales'].nunique().tolist()
+
+def test_window_narrator_count_touches_delta(df, monkeypatch):
+    df = pd.concat([df] * 10, ignore_index=True).assign(Sales=range(120), Date=pd.date_range(start='2023-01-01', periods=120, freq='D'))
+    narrator = WindowNarrator(date='Date', window='30D', measure='Sales', dimensions=['Region', 'Product'], summarization='count')
+    narrator.append(df.iloc[:60])
+
+    # Every slide only counts the pairs of the rows entering and leaving the window
+    sizes = []
+    count_values = DescriptiveState._count_values
+    monkeypatch.setattr(DescriptiveState, '_count_values', lambda self, key, values, sign: sizes.append(len(values)) or count_values(self, key, values, sign))
+
+    for end in range(62, 121, 2):
+        narrator.append(df.iloc[end - 2:end])
+
+    assert sizes and max(sizes) == 2
+    assert list(narrator.narrative.items()) == list(narrate_descriptive(df.iloc[-30:], 'Sales', ['Region', 'Product'], summarization='count').items())
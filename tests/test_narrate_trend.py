@@ -0,0 +1,224 @@
+import pandas as pd
+from pynarrator import narrate_trend, get_trend_outliers, get_trend_outliers_l2, get_trend_context, get_frequency, trend_volume, ytd_volume, pytd_volume, sort_by_date, series_matrix, get_trend_movers, narrate_trend_movers
+import numpy as np
+import pytest
+from pynarrator import trend_helpers
+
+@pytest.fixture
+def df():
+    # Two full years and one quarter of monthly data
+    return pd.DataFrame({
+        'Date': pd.date_range(start='2021-01-01', periods=15, freq='MS').repeat(2),
+        'Region': ['North', 'South'] * 15,
+        'Sales': [10, 20] * 12 + [30, 20] * 3
+    })
+
+def test_trend_volume_matches_ytd_pytd(df):
+    table = trend_volume(df, dimension='Region', measure='Sales').set_index('Region')
+
+    for region, group in df.groupby('Region'):
+        assert table.loc[region, 'curr_volume'] == ytd_volume(group.copy(), measure='Sales')
+        assert table.loc[region, 'prev_volume'] == pytd_volume(group.copy(), measure='Sales')
+
+def test_get_trend_outliers(df):
+    output = get_trend_outliers(df, dimension='Region', measure='Sales')
+
+    assert output == {
+        'n_outliers': 1,
+        'outlier_levels': ['North'],
+        'outlier_values': [60],
+        'outlier_values_p': ['200.0%']
+    }
+
+def test_get_trend_outliers_summarization():
+    with pytest.raises(ValueError):
+        get_trend_outliers(pd.DataFrame({'Date': pd.to_datetime(['2021-01-01']), 'Region': ['North'], 'Sales': [1]}),
+                           dimension='Region', measure='Sales', summarization='median')
+
+def test_narrate_trend_reuses_context(df):
+    context = get_trend_context(df)
+
+    assert context.measure == 'Sales'
+    assert context.date == 'Date'
+    assert context.py_date == pd.Timestamp('2021-03-01')
+
+    narrative = narrate_trend(df, dimensions=['Region'], context=context)
+
+    assert narrative == narrate_trend(df, dimensions=['Region'])
+    assert narrative['Total Sales'] == 'From 2021 YTD to 2022 YTD, Sales had an increase of 60 (66.67%, 90 to 150).'
+
+def test_trend_context_is_immutable(df):
+    context = get_trend_context(df)
+
+    with pytest.raises(Exception):
+        context.measure = 'Region'
+    with pytest.raises(ValueError):
+        context.cy_mask[0] = False
+    with pytest.raises(ValueError):
+        get_trend_outliers(df.head(10), dimension='Region', measure='Sales', context=context)
+
+def test_trend_context_identity(df):
+    context = get_trend_context(df)
+
+    assert context == context and context != get_trend_context(df)
+    assert {context: 1}[context] == 1
+
+def test_get_trend_outliers_l2(df):
+    df = df.assign(Product=['A', 'B', 'C'] * 10)
+    context = get_trend_context(df)
+
+    output = get_trend_outliers_l2(df, 'Region', 'Product', 'Sales', context=context)
+
+    for region, output_l2 in output.items():
+        df_l2 = df[df['Region'] == region].reset_index(drop=True)
+        context_l2 = get_trend_context(df_l2, cy_date=context.cy_date, py_date=context.py_date)
+        assert output_l2 == get_trend_outliers(df_l2, 'Product', 'Sales', context=context_l2)
+
+    narrative = narrate_trend(df, dimensions=['Region', 'Product'], context=context)
+    assert narrative['Region North - Product by Sales'].startswith('In North, significant Product')
+
+def test_narrate_trend_parallel_matches_sequential(df):
+    df = df.assign(Product=['A', 'B', 'C'] * 10)
+    narrative = narrate_trend(df, measure='Sales', dimensions=['Region', 'Product'])
+
+    assert list(narrate_trend(df, measure='Sales', dimensions=['Region', 'Product'], n_jobs=2).items()) == list(narrative.items())
+
+@pytest.mark.parametrize('freq, frequency', [('D', 'day'), ('W-MON', 'week'), ('MS', 'month'), ('QS', 'quarter'), ('YS', 'year')])
+def test_get_frequency(freq, frequency):
+    dates = pd.date_range(start='2019-01-01', periods=20, freq=freq)
+    df = pd.DataFrame({'Date': dates.repeat(3), 'Region': ['North', 'South', 'West'] * 20, 'Sales': 1})
+
+    # Repeated dates of several series and the row order don't matter
+    assert get_frequency(df) == frequency
+    assert get_frequency(df.sample(frac=1, random_state=1)) == frequency
+    assert get_frequency(df, sample_size=30) == get_frequency(df.iloc[::-1], date_field='Date')
+
+def test_get_frequency_sample_matches_full():
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1000, 100000), unit='D')
+    df = pd.DataFrame({'Date': dates, 'Sales': 1})
+
+    assert get_frequency(df, 'Date') == 'day'
+    assert get_frequency(df, 'Date', sample_size=1000) == get_frequency(df, 'Date', sample_size=10) == 'day'
+
+def test_get_frequency_memo_follows_column(df):
+    assert get_frequency(df) == 'month'
+
+    df['Date'] = pd.date_range(start='2021-01-01', periods=30, freq='D')
+
+    assert get_frequency(df) == 'day'
+
+def test_get_frequency_memo_timezone_and_in_place_edits(df, monkeypatch):
+    df['Date'] = df['Date'].dt.tz_localize('Europe/Paris')
+
+    assert get_frequency(df) == 'month'
+
+    # Memo hit, the dates aren't sorted again
+    with monkeypatch.context() as m:
+        m.setattr(trend_helpers.np, 'bincount', None)
+        assert get_frequency(df) == 'month'
+
+    # Edit in place, the column keeps its buffer
+    df.loc[:, 'Date'] = pd.date_range(start='2021-01-01', periods=30, freq='D', tz='Europe/Paris')
+
+    assert get_frequency(df) == 'day'
+
+def test_sorted_dates_match_masks(df):
+    df = df.assign(Product=['A', 'B', 'C'] * 10).sample(frac=1, random_state=1)
+    df_sorted = sort_by_date(df)
+    context = get_trend_context(df)
+    context_sorted = get_trend_context(df_sorted, sorted_dates=True)
+
+    assert ytd_volume(df_sorted, measure='Sales', sorted_dates=True) == ytd_volume(df.copy(), measure='Sales')
+    assert pytd_volume(df_sorted, measure='Sales', sorted_dates=True) == pytd_volume(df.copy(), measure='Sales')
+    assert (context_sorted.cy_mask.sum(), context_sorted.py_mask.sum()) == (context.cy_mask.sum(), context.py_mask.sum())
+    assert narrate_trend(df_sorted, dimensions=['Region', 'Product'], context=context_sorted) == narrate_trend(df, dimensions=['Region', 'Product'], context=context)
+
+    with pytest.raises(ValueError):
+        get_trend_context(df, sorted_dates=True)
+    with pytest.raises(ValueError):
+        ytd_volume(df, measure='Sales', sorted_dates=True)
+    with pytest.raises(ValueError):
+        pytd_volume(df, measure='Sales', sorted_dates=True)
+
+@pytest.mark.parametrize('comparison, periods, curr, prev', [
+    ('mom', 1, ('2022-03-01', '2022-03-01'), ('2022-02-01', '2022-02-01')),
+    ('qoq', 1, ('2022-01-01', '2022-03-01'), ('2021-10-01', '2021-12-01')),
+    ('rolling', 2, ('2022-02-01', '2022-03-01'), ('2021-12-01', '2022-01-01'))
+])
+def test_period_over_period(df, comparison, periods, curr, prev):
+    context = get_trend_context(df, comparison=comparison, periods=periods)
+    table = trend_volume(df, dimension='Region', context=context).set_index('Region')
+
+    for region, group in df.groupby('Region'):
+        assert table.loc[region, 'curr_volume'] == group[group['Date'].between(*curr)]['Sales'].sum()
+        assert table.loc[region, 'prev_volume'] == group[group['Date'].between(*prev)]['Sales'].sum()
+
+    sorted_context = get_trend_context(df, comparison=comparison, periods=periods, sorted_dates=True)
+    assert trend_volume(df, dimension='Region', context=sorted_context).equals(table.reset_index())
+
+def test_narrate_trend_comparison(df):
+    narrative = narrate_trend(df, dimensions=['Region'], comparison='qoq')
+
+    assert narrative['Total Sales'].startswith('From 2021 Q4 to 2022 Q1, Sales had an increase of 60')
+    assert narrative['Region by Sales'] == 'Region with biggest changes of Sales is North (60, 200.0%).'
+    assert get_trend_context(df, comparison='mom').timeframe_prev == 'Feb 2022'
+    assert get_trend_context(df, comparison='wow').timeframe_curr == '2022 W09'
+
+    with pytest.raises(ValueError):
+        get_trend_context(df, comparison='dod')
+    with pytest.raises(ValueError):
+        get_trend_context(df, comparison='rolling', periods=0)
+
+@pytest.fixture
+def skus():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range(start='2021-01-01', periods=15, freq='MS')
+
+    return pd.DataFrame({
+        'SKU': np.repeat([f'SKU-{i:03d}' for i in range(300)], len(dates)),
+        'Date': np.tile(dates, 300),
+        'Sales': rng.integers(0, 1000, 300 * len(dates))
+    }).sample(frac=1, random_state=1)
+
+def test_series_matrix(skus):
+    chunks = list(series_matrix(skus, 'SKU', 'Sales', chunk_size=128))
+    levels, periods, values = chunks[0]
+
+    assert [len(chunk[0]) for chunk in chunks] == [128, 128, 44]
+    assert values.dtype == np.float32 and values.shape == (128, 15)
+    assert values[3, 5] == skus[(skus['SKU'] == levels[3]) & (skus['Date'] == periods[5])]['Sales'].sum()
+
+@pytest.mark.parametrize('summarization', ['sum', 'average'])
+def test_get_trend_movers_matches_outliers(skus, summarization):
+    output = get_trend_movers(skus, 'SKU', k=4, summarization=summarization, chunk_size=64)
+
+    assert output == get_trend_outliers(skus, 'SKU', 'Sales', summarization=summarization, coverage=1, coverage_limit=4)
+
+def test_get_trend_movers_growth(skus):
+    context = get_trend_context(skus)
+    table = trend_volume(skus, 'SKU', context=context)
+    growth = ((table['curr_volume'] - table['prev_volume']) / table['prev_volume']).abs()
+
+    output = get_trend_movers(skus, 'SKU', k=3, rank='growth', context=context, chunk_size=50)
+
+    assert output['outlier_levels'] == table.loc[growth.nlargest(3).index, 'SKU'].tolist()
+    assert narrate_trend_movers(skus, 'SKU', k=1, rank='growth', context=context) == {
+        'SKU by Sales': f"SKU with biggest changes of Sales is {output['outlier_levels'][0]} ({output['outlier_values'][0]}, {output['outlier_values_p'][0]})."
+    }
+
+    with pytest.raises(ValueError):
+        get_trend_movers(skus, 'SKU', rank='size')
+
+def test_trend_outliers_without_change(df):
+    flat = df.assign(Sales=10, Product=['A', 'B', 'C'] * 10)
+
+    assert get_trend_outliers(flat, dimension='Region', measure='Sales') is None
+    assert get_trend_outliers_l2(flat, 'Region', 'Product', 'Sales') == {}
+    assert list(narrate_trend(flat, measure='Sales', dimensions=['Region'])) == ['Total Sales']
+
+def test_trend_outliers_ignore_total(df):
+    output = get_trend_outliers(df, dimension='Region', measure='Sales')
+
+    assert get_trend_outliers(df, dimension='Region', measure='Sales', total=100) == output
+    assert get_trend_outliers(df, 'Region', 'Sales', None, 'sum') == output
@@ -0,0 +1,56 @@
+import sys
+import time
+import subprocess
+
+# Budget of `import pynarrator` in a new interpreter on top of the interpreter start up,
+# it loaded pandas and openai before
+IMPORT_BUDGET = 0.1
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+def _seconds(code, repeat=5):
+    # Fastest of several fresh interpreters, the slower runs measure the machine load
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(code)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+def test_import_is_lazy():
+    loaded = _run(
+        'import sys, pynarrator\n'
+        'print(*[m for m in ("pandas", "numpy", "inflect", "openai") if m in sys.modules])\n'
+        'pynarrator.narrate_descriptive\n'
+        'print("|", *[m for m in ("inflect", "openai") if m in sys.modules])'
+    )
+
+    assert loaded == ['|']
+
+def test_import_time_budget():
+    assert _seconds('import pynarrator') - _seconds('pass') < IMPORT_BUDGET
+
+def test_public_names_resolve():
+    # Submodules imported by other names must not shadow the functions named like them
+    wrong = _run(
+        'import inspect, types\n'
+        'from pynarrator import TimeCube, IncrementalNarrator, narrate_by\n'
+        'from pynarrator import *\n'
+        'import pynarrator\n'
+        'print(*[name for name in pynarrator.__all__ if isinstance(getattr(pynarrator, name), types.ModuleType) or not callable(getattr(pynarrator, name))])\n'
+        'print(*[name for name in ("narrate_trend", "narrate_descriptive", "narrate_by") if not inspect.isfunction(globals()[name])])'
+    )
+
+    assert wrong == []
+
+    # Submodules imported explicitly are bound until the next lazy name is resolved
+    wrong = _run(
+        'import inspect, pynarrator.narrate_trend, pynarrator.narrate_descriptive, pynarrator.narrate_by\n'
+        'from pynarrator import TimeCube\n'
+        'print(*[name for name in ("narrate_trend", "narrate_descriptive", "narrate_by") if not inspect.isfunction(getattr(pynarrator, name))])'
+    )
+
+    assert wrong == []
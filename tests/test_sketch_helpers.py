@@ -0,0 +1,78 @@
+import pandas as pd
+import numpy as np
+from pynarrator import HyperLogLog, DescriptiveState, narrate_descriptive, narrate_descriptive_stream
+from pynarrator.sketch_helpers import hash_values, hll_registers, hll_estimate, hll_group_estimates
+import pytest
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 200000
+    return pd.DataFrame({
+        'Region': rng.choice(['North', 'South', 'West'], n),
+        'Order ID': rng.integers(0, 100000, n)
+    })
+
+@pytest.mark.parametrize('precision', [10, 12, 14])
+def test_hyperloglog_error_bound(df, precision):
+    exact = df.groupby('Region')['Order ID'].nunique()
+    estimate = HyperLogLog.from_frame(df, ['Region'], 'Order ID', precision).estimate()
+
+    error = (estimate.reindex(exact.index) / exact - 1).abs()
+
+    # 4 standard errors
+    assert (error < 4 * 1.04 / np.sqrt(2 ** precision)).all()
+
+def test_hyperloglog_small_cardinality_is_exact():
+    df = pd.DataFrame({'Region': ['North'] * 6 + ['South'] * 2, 'Order ID': [1, 2, 3, 3, 4, 5, 1, 1]})
+
+    estimate = HyperLogLog.from_frame(df, ['Region'], 'Order ID').estimate().round()
+
+    assert estimate.to_dict() == {'North': 5, 'South': 1}
+
+def test_hyperloglog_merge_matches_full(df):
+    full = HyperLogLog.from_frame(df, ['Region'], 'Order ID')
+
+    merged = HyperLogLog()
+    for i in range(0, len(df), 30000):
+        merged.merge(HyperLogLog.from_frame(df.iloc[i:i + 30000], ['Region'], 'Order ID'))
+
+    pd.testing.assert_series_equal(merged.estimate().sort_index(), full.estimate().sort_index())
+
+    with pytest.raises(ValueError):
+        full.merge(HyperLogLog(precision=10))
+
+def test_narrate_descriptive_approximate_count(df):
+    narrative = narrate_descriptive(df, 'Order ID', ['Region'], summarization='count', approximate=True)
+    chunks = (df.iloc[i:i + 30000] for i in range(0, len(df), 30000))
+
+    assert narrative.keys() == narrate_descriptive(df, 'Order ID', ['Region'], summarization='count').keys()
+    assert narrate_descriptive_stream(chunks, 'Order ID', ['Region'], summarization='count', approximate=True) == narrative
+
+def test_hash_values_by_value():
+    assert (hash_values(np.array([5, 7])) == hash_values(np.array([5.0, 7.0]))).all()
+    assert (hash_values(np.array([5], dtype='uint8')) == hash_values(np.array([5.0], dtype=object))).all()
+    assert hash_values(np.array([5.5]))[0] != hash_values(np.array([5]))[0]
+
+def test_merge_mixed_int_and_float_chunks():
+    ints = pd.DataFrame({'Region': ['North'] * 4, 'Order ID': [1, 2, 3, 4]})
+    floats = pd.DataFrame({'Region': ['North'] * 4, 'Order ID': [1, 2, None, 5]})
+
+    merged = HyperLogLog.from_frame(ints, ['Region'], 'Order ID').merge(HyperLogLog.from_frame(floats, ['Region'], 'Order ID'))
+    state = DescriptiveState('Order ID', ['Region'], summarization='count', approximate=True)
+    state.update(ints)
+    state.update(floats)
+
+    assert merged.estimate().round().to_dict() == {'North': 5}
+    assert state.tables(['Region'])['Region']['Order ID'].tolist() == [5]
+
+def test_group_estimates_match_registers_within_budget():
+    rng = np.random.default_rng(1)
+    codes = rng.integers(0, 50, 20000)
+    hashes = hash_values(rng.integers(0, 1000, 20000))
+
+    full = hll_estimate(hll_registers(codes, 50, hashes, precision=8))
+
+    np.testing.assert_array_equal(hll_group_estimates(codes, 50, hashes, precision=8, max_bytes=7 * 2 ** 8), full)
+    with pytest.raises(ValueError):
+        hll_registers(codes, 50, hashes, precision=8, max_bytes=2 ** 8)
@@ -0,0 +1,86 @@
+import pytest
+import pandas as pd
+from pynarrator import compile_template, render_template, clean_text, clean_text_many, compile_cleaner, pluralize, precompute_plurals, register_plurals
+from pynarrator import text_helpers, format_numbers, format_percentages, color_classes, format_pct, format_text
+
+def test_render_template_with_pluralize():
+    text = render_template('Outlying {pluralize(dimension)} by {measure} are {outlier_insight}.',
+                           {'dimension': 'Region', 'measure': 'Sales', 'outlier_insight': "East (55, 52.0%)"})
+
+    assert text == 'Outlying Regions by Sales are East (55, 52.0%).'
+
+def test_render_template_with_quotes_and_format_spec():
+    text = render_template("{measure}'s total is {total:,.1f} ({{approx.}})", {'measure': 'Sales', 'total': 12300})
+
+    assert text == "Sales's total is 12,300.0 ({approx.})"
+
+def test_compile_template_is_cached():
+    template = 'Total {measure} is {total}.'
+
+    assert compile_template(template) is compile_template(template)
+
+def test_compile_template_rejects_expressions():
+    with pytest.raises(ValueError):
+        compile_template('{__import__("os")}')
+    with pytest.raises(ValueError):
+        compile_template('{total * 2}')
+    with pytest.raises(ValueError):
+        render_template('{missing}', {})
+
+def test_clean_text():
+    text = ' total  sales ( 23.5 % for east  ) , ytd vs Pytd .  VAT is up by 3%. <B>north</B> '
+
+    assert clean_text(text) == 'Total sales (23.5 % for east), YTD vs PYTD. VAT is up by 3 %. <b>north</b>'
+    assert clean_text('abc and bcd', upper=['ab', 'bc'], lower=[]) == 'ABC and BCd'
+
+def test_clean_text_many():
+    texts = ['ytd  vs pytd', None, 'sales ( 5% )', 'ytd  vs pytd']
+    series = pd.Series(texts, index=list('abcd'), name='narrative')
+
+    cleaned = clean_text_many(series)
+
+    assert cleaned.index.tolist() == list('abcd') and cleaned.name == 'narrative'
+    assert cleaned.isna().tolist() == [False, True, False, False]
+    assert cleaned.dropna().tolist() == [clean_text(texts[0]), clean_text(texts[2]), clean_text(texts[3])]
+    assert clean_text_many(['ytd  vs pytd', 'sales ( 5% )']) == ['YTD vs PYTD', 'Sales (5 %)']
+
+def test_compile_cleaner_is_cached():
+    assert compile_cleaner() is compile_cleaner(['YTD', 'PYTD'])
+
+def test_pluralize_is_cached():
+    assert pluralize('Region') == 'Regions' and pluralize('category') == 'categories'
+    assert text_helpers._inflect_engine() is text_helpers._inflect_engine()
+    assert text_helpers._inflect_plural.cache_info().currsize > 0
+
+def test_register_plurals(monkeypatch):
+    monkeypatch.setattr(text_helpers, 'PLURALS', {})
+    monkeypatch.setattr(text_helpers, '_ENGINE', None)
+    plurals = precompute_plurals(['Region', 'country'])
+
+    assert plurals == {'Region': 'Regions', 'country': 'countries'}
+
+    # Registered plurals don't need inflect
+    monkeypatch.setattr(text_helpers, '_ENGINE', None)
+    monkeypatch.setitem(__import__('sys').modules, 'inflect', None)
+    text_helpers._inflect_plural.cache_clear()
+    register_plurals(plurals)
+
+    assert render_template('All {pluralize(dimension)}', {'dimension': 'country'}) == 'All countries'
+    with pytest.raises(ImportError):
+        pluralize('Store')
+    with pytest.raises(ValueError):
+        register_plurals(['Region'])
+
+def test_format_numbers():
+    values = [1234567.891, -0.25, 0, float('nan')]
+
+    assert format_numbers(values).tolist() == ['1234567.891', '-0.25', '0.0', 'nan']
+    assert format_numbers(values, decimals=1, thousands=True).tolist() == ['1,234,567.9', '-0.2', '0.0', 'nan']
+    assert format_numbers([999, 1250, 999960, -3.4e9], compact=True).tolist() == ['999.0', '1.2K', '1.0M', '-3.4B']
+    assert format_percentages([0.29 * 100, -4.5, 12], decimals=1, sign=True).tolist() == ['+29.0%', '-4.5%', '+12.0%']
+
+def test_color_classes():
+    assert color_classes([5.2, -1.0, 0.0, float('nan')]).tolist() == ['green', 'red', 'green', None]
+    assert color_classes(0, neutral='black') == 'black'
+    assert format_text('1.2%') == "<b> <span style='color: green;'>1.2%</span> </b>"
+    assert format_pct(['-4.5% vs PY', 'sales are up']) == ["<b> <span style='color: red;'>-4.5 %</span> </b> vs PY", 'Sales are up']
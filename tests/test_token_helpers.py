@@ -0,0 +1,48 @@
+import pytest
+import pandas as pd
+from pynarrator import Token, template_tokens, outlier_tokens, render_plain, render_html, render_markdown, render_narrative, render_template, narrate_descriptive, narrate_trend
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'Date': pd.date_range(start='2021-01-01', periods=15, freq='MS').repeat(2),
+        'Region': ['North', 'R&D_south'] * 15,
+        'Sales': [10, 20] * 12 + [30, 15] * 3
+    })
+
+def test_template_tokens():
+    template = 'Total {measure} across all {pluralize(dimension)} is {total:,.1f} ({change_p}).'
+    variables = {'measure': 'Sales', 'dimension': 'Region', 'total': 12300, 'change_p': '-4.5%'}
+    tokens = template_tokens(template, variables)
+
+    assert render_plain(tokens) == render_template(template, variables)
+    assert Token('measure', 'Sales') in tokens
+    assert Token('value', '12,300.0', 12300.0) in tokens
+    assert Token('percentage', '-4.5%', -4.5) in tokens
+    with pytest.raises(ValueError):
+        template_tokens('{missing}', {})
+
+def test_outlier_tokens():
+    tokens = outlier_tokens(['East', 'West'], [55, -40], ['52.0%', '-38.1%'])
+
+    assert render_plain(tokens) == 'East (55, 52.0%), West (-40, -38.1%)'
+    assert render_plain(outlier_tokens(['East'], [5.5], ['5.0%'], measure='Sales')) == 'East (5.5, 5.0% vs average Sales)'
+
+def test_renderers():
+    tokens = outlier_tokens(['R&D', 'a_b'], [55, -40], ['52.0%', '-38.1%'])
+
+    assert render_html(tokens) == "<b>R&amp;D</b> (55, <span style='color: green;'>52.0%</span>), <b>a_b</b> (-40, <span style='color: red;'>-38.1%</span>)"
+    assert render_markdown(tokens) == '**R&D** (55, **52.0%**), **a\\_b** (-40, **-38.1%**)'
+    with pytest.raises(ValueError):
+        render_narrative('{measure}', {'measure': 'Sales'}, output_format='pdf')
+
+@pytest.mark.parametrize('narrate', [narrate_descriptive, narrate_trend])
+@pytest.mark.parametrize('summarization', ['sum', 'average'])
+def test_narrative_tokens_match_plain(df, narrate, summarization):
+    plain = narrate(df, measure='Sales', summarization=summarization)
+    tokens = narrate(df, measure='Sales', summarization=summarization, output_format='tokens')
+    html = narrate(df, measure='Sales', summarization=summarization, output_format='html')
+
+    assert list(tokens) == list(plain) == list(html)
+    assert all(render_plain(tokens[key]) == plain[key] for key in plain)
+    assert all(render_html(tokens[key]) == html[key] for key in plain)